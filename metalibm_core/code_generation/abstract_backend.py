@@ -35,7 +35,7 @@ import inspect
 
 from sollya import S2
 
-from ..utility.log_report import Log
+from ..utility.log_report import Log, UnsupportedOperationError
 from .generator_utility import *
 from .code_element import *
 from .complex_generator import *
@@ -43,6 +43,10 @@ from ..core.ml_formats import *
 from ..core.ml_table import ML_ApproxTable
 from ..core.ml_operations import *
 from .generator_helper import *
+from .dispatch_index import (
+    DispatchIndex, get_table_dispatch_index, set_table_dispatch_index,
+    load_compiled_index, save_compiled_index
+)
 
 LOG_BACKEND_INIT = Log.LogLevel(Log.Info, "backend_init")
 
@@ -59,6 +63,50 @@ class AbstractBackend(object):
         # create simplified of operation supported by the processor hierarchy
         self.simplified_rec_op_map = {}
         self.simplified_rec_op_map[C_Code] = self.generate_supported_op_map(language = C_Code)
+        self.load_dispatch_index()
+
+    def get_dispatch_table_map(self):
+        """ return the dict name -> table of the tables indexed in the
+            compiled dispatch index of the backend class """
+        table_map = {"simplified_rec_op_map": self.simplified_rec_op_map}
+        if hasattr(self, "code_generation_table"):
+            table_map["code_generation_table"] = self.code_generation_table
+        return table_map
+
+    def load_dispatch_index(self):
+        """ initialize the dispatch indexes of the backend tables from the
+            compiled index file of the backend class (built by
+            python -m metalibm_core.code_generation.dispatch_index), if it
+            exists and matches the current sources """
+        compiled_tables = load_compiled_index(self.__class__)
+        if compiled_tables is None:
+            return
+        Log.report(LOG_BACKEND_INIT, "loaded compiled dispatch index of {}", self.__class__.__name__)
+        for table_name, table in self.get_dispatch_table_map().items():
+            compiled_map = compiled_tables.get(table_name)
+            if table is self.simplified_rec_op_map:
+                self.simplified_rec_index = DispatchIndex(table, compiled_map)
+            else:
+                set_table_dispatch_index(table, compiled_map)
+
+    def save_dispatch_index(self):
+        """ compile the dispatch indexes of the backend tables and save
+            them in the compiled index file of the backend class,
+            return the file name (None if it was not saved) """
+        return save_compiled_index(
+            self.__class__,
+            dict((table_name, self.get_dispatch_index(table)) for table_name, table in self.get_dispatch_table_map().items())
+        )
+
+    def get_dispatch_index(self, op_map):
+        """ return the compiled DispatchIndex of @p op_map: the index of the
+            instance simplified support map is stored with the instance,
+            class code generation tables share a process-wide index """
+        if op_map is getattr(self, "simplified_rec_op_map", None):
+            if getattr(self, "simplified_rec_index", None) is None:
+                self.simplified_rec_index = DispatchIndex(op_map)
+            return self.simplified_rec_index
+        return get_table_dispatch_index(op_map)
 
     ## return the backend target name
     def get_target_name(sef):
@@ -107,21 +155,16 @@ class AbstractBackend(object):
         #key_getter = AbstractBackend.get_operation_keys if key_getter is None else key_getter
         table = table_getter(self)
         op_class, interface, codegen_key = key_getter(self, optree)
-        for condition in table[language][op_class][codegen_key]:
-            if condition(optree):
-                for interface_condition in table[language][op_class][codegen_key][condition]:
-                    if interface_condition(*interface, optree = optree):
-                        implementation = table[language][op_class][codegen_key][condition][interface_condition]
-                        sourceinfo = implementation.get_source_info()
-                        Log.report(
-                            Log.Verbose, 
-                             "optree {} to implementation @ {}".format(
-                                optree.get_str(display_precision = True),
-                                str(sourceinfo)
-                             )
-                        )
-                        return implementation
-        return None
+        implementation = self.get_dispatch_index(table).lookup(language, op_class, codegen_key, interface, optree)
+        if not implementation is None:
+            Log.report(
+                Log.Verbose,
+                lambda: "optree {} to implementation @ {}".format(
+                    optree.get_str(display_precision = True),
+                    str(implementation.get_source_info())
+                )
+            )
+        return implementation
 
     def get_recursive_implementation(self, optree, language = None, table_getter = lambda self: self.code_generation_table, key_getter = lambda self, optree: self.get_operation_keys(optree)):
         """ recursively search for an implementation of optree in the processor class hierarchy """
@@ -133,10 +176,10 @@ class AbstractBackend(object):
                 if parent_proc.is_local_supported_operation(optree, language = language, table_getter = table_getter, key_getter = key_getter):
                     return parent_proc.get_implementation(optree, language, table_getter = table_getter, key_getter = key_getter)
             # no implementation were found
-            Log.report(Log.Verbose, "Tested architecture(s) for language %s:" % language)
+            Log.report(Log.Verbose, "Tested architecture(s) for language {}:", language)
             for parent_proc in self.parent_architecture:
-              Log.report(Log.Verbose, "  %s " % parent_proc)
-            Log.report(Log.Error, "the following operation is not supported by %s: \n%s" % (self.__class__, optree.get_str(depth = 2, display_precision = True, memoization_map = {})))
+              Log.report(Log.Verbose, "  {} ", parent_proc)
+            Log.report(Log.Error, "the following operation is not supported by %s: \n%s" % (self.__class__, optree.get_str(depth = 2, display_precision = True, memoization_map = {})), error=UnsupportedOperationError)
 
     def is_map_supported_operation(self, op_map, optree, language = C_Code, debug = False,  key_getter = lambda self, optree: self.get_operation_keys(optree)):
         """ return wheter or not the operation performed by optree has a local implementation """
@@ -157,10 +200,8 @@ class AbstractBackend(object):
                     # unsupported codegen key
                     return False
                 else:
-                    for condition in op_map[language][op_class][codegen_key]:
-                        if condition(optree):
-                            for interface_condition in op_map[language][op_class][codegen_key][condition]:
-                                if interface_condition(*interface, optree = optree): return True
+                    if not self.get_dispatch_index(op_map).lookup(language, op_class, codegen_key, interface, optree) is None:
+                        return True
                     # unsupported condition or interface type
                     if debug: 
                       Log.report(Log.Info, "unsupported condition key for %s" % optree.get_str(display_precision = True))
@@ -207,12 +248,10 @@ class AbstractBackend(object):
         """ return the implementation provided by <proc_class> of the operation performed by <optree> """
         op_class, interface, codegen_key = key_getter(proc_class, optree)
         table = table_getter(proc_class)
-        for condition in table[language][op_class][codegen_key]:
-            if condition(optree):
-                for interface_condition in table[language][op_class][codegen_key][condition]:
-                    if interface_condition(*interface, optree = optree):
-                        return table[language][op_class][codegen_key][condition][interface_condition]
-        raise Exception()
+        implementation = get_table_dispatch_index(table).lookup(language, op_class, codegen_key, interface, optree)
+        if implementation is None:
+            raise Exception()
+        return implementation
 
 ## Determine whether an object is a true processor
 #  class with real backend capabilities or not
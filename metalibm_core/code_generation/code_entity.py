@@ -40,6 +40,7 @@ from .code_object import NestedCode
 from .generator_utility import FunctionOperator, FO_Arg
 from .code_constant import *
 from ..core.attributes import Attributes, AttributeCtor
+from ..utility.log_report import Log
 
 
 class CodeEntity(object):
@@ -133,6 +134,11 @@ class CodeEntity(object):
 
   def get_arg_list(self):
     return self.arg_list
+  ## replace the argument list, the tag -> input map is rebuilt
+  #  accordingly
+  def set_arg_list(self, arg_list):
+    self.arg_list = arg_list
+    self.arg_map = dict((arg.get_tag(), arg) for arg in self.arg_list)
   def clear_arg_list(self):
     self.arg_list = []
 
@@ -195,6 +201,18 @@ class CodeEntity(object):
   def get_scheme(self):
     return Statement(*tuple(self.process_list + list(self.get_output_assign())))
 
+  ## replace entity implementation by @p scheme, a Statement
+  #  with the same layout as get_scheme result (processes followed
+  #  by output assignations)
+  def set_scheme(self, scheme):
+    process_num = len(self.process_list)
+    new_inputs = scheme.get_inputs()
+    if len(new_inputs) != process_num + len(self.output_map):
+      Log.report(Log.Error, "scheme does not match entity {} layout".format(self.name))
+    self.process_list = list(new_inputs[:process_num])
+    for name, output_assign in zip(list(self.output_map.keys()), new_inputs[process_num:]):
+      self.output_map[name] = output_assign
+
   def get_definition(self, code_generator, language, folded = True, static_cst = False):
     code_object = NestedCode(code_generator, static_cst = static_cst, code_ctor = VHDLCodeObject)
     code_object.add_local_header("ieee.std_logic_1164.all")
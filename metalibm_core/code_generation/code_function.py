@@ -64,6 +64,8 @@ class CodeFunction(object):
 
   def get_arg_list(self):
     return self.arg_list
+  def set_arg_list(self, arg_list):
+    self.arg_list = arg_list
   def clear_arg_list(self):
     self.arg_list = []
 
@@ -77,6 +79,14 @@ class CodeFunction(object):
     arg_list_precision = [arg.get_precision() for arg in self.arg_list]
     return FunctionObject(self.name, arg_list_precision, self.output_format, self.get_function_operator())
 
+  ## redirect every call to @p self towards @p code_function
+  #  (used when @p self implementation duplicates @p code_function's one)
+  def redirect_calls(self, code_function):
+    function_object = self.get_function_object()
+    target_object = code_function.get_function_object()
+    function_object.name = target_object.get_function_name()
+    function_object.generator_object = target_object.get_generator_object()
+
   def get_function_operator(self):
     return self.build_function_operator()
 
@@ -98,11 +98,10 @@ class SymbolTable(object):
         self.reverse_map[symbol_object] = name
 
     def generate_declaration(self, code_generator):
-        code_object = ""
-        for symbol in self.table:
-            symbol_object = self.table[symbol]
-            code_object += code_generator.generate_declaration(symbol, symbol_object)
-        return code_object
+        return "".join(
+            code_generator.generate_declaration(symbol, self.table[symbol])
+            for symbol in self.table
+        )
 
     def generate_initialization(self, code_generator):
         """ generate symbol initialization, only necessary
@@ -248,12 +247,10 @@ class MultiSymbolTable(object):
 
 
     def generate_declarations(self, code_generator, exclusion_list = []):
-        code_object = ""
-        for table_tag in self.table_list:
-            if table_tag in exclusion_list:
-                continue
-            code_object += self.table_list[table_tag].generate_declaration(code_generator) 
-        return code_object
+        return "".join(
+            self.table_list[table_tag].generate_declaration(code_generator)
+            for table_tag in self.table_list if not table_tag in exclusion_list
+        )
 
     def generate_initializations(self, code_generator, init_required_list = []):
         code_object = ""
@@ -521,7 +518,9 @@ class VHDLCodeObject(object):
     tab = "    "
     def __init__(self, language, shared_tables = None, parent_tables = None, rounding_mode = ML_GlobalRoundMode, uniquifier = "", main_code_level = False, var_ctor = None):
         """ code object initialization """
-        self.expanded_code = ""
+        ## list of code chunks, only joined when the full code is required
+        #  (appending to a single string attribute is quadratic)
+        self.code_chunk_list = []
         self.uniquifier = uniquifier
         self.tablevel = 0
         self.header_list = []
@@ -542,21 +541,39 @@ class VHDLCodeObject(object):
     def get_symbol_table(self):
         return self.symbol_table
 
+    @property
+    def expanded_code(self):
+        """ code content of this level as a single string """
+        if len(self.code_chunk_list) > 1:
+            self.code_chunk_list = ["".join(self.code_chunk_list)]
+        return self.code_chunk_list[0] if self.code_chunk_list else ""
+
     def __lshift__(self, added_code):
         """ implicit code insertion through << operator """
-        self.expanded_code += re.sub("\n", lambda _: ("\n" + self.tablevel * CodeObject.tab), added_code)
+        if added_code:
+            self.code_chunk_list.append(added_code.replace("\n", "\n" + self.tablevel * CodeObject.tab))
 
     def inc_level(self):
         """ increase indentation level """
         self.tablevel += 1
-        self.expanded_code += CodeObject.tab
+        self.code_chunk_list.append(CodeObject.tab)
 
     def dec_level(self):
         """ decrease indentation level """
         self.tablevel -= 1
-        # deleting last inserted tab
-        if self.expanded_code[-len(CodeObject.tab):] == CodeObject.tab:
-            self.expanded_code = self.expanded_code[:-len(CodeObject.tab)]
+        # deleting last inserted tab, which may span several chunks
+        tab_len = len(CodeObject.tab)
+        suffix = ""
+        for chunk in reversed(self.code_chunk_list):
+            suffix = chunk[-tab_len:] + suffix
+            if len(suffix) >= tab_len: break
+        if suffix[-tab_len:] == CodeObject.tab:
+            remaining = tab_len
+            while remaining > 0:
+                chunk = self.code_chunk_list.pop()
+                if len(chunk) > remaining:
+                    self.code_chunk_list.append(chunk[:-remaining])
+                remaining -= len(chunk)
 
     def open_level(self, inc = True):
         """ open nested block """
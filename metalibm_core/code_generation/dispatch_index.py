@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: compiled index of backend code generation tables for fast
+#              implementation lookup
+###############################################################################
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+
+from ..utility.log_report import Log
+from ..core.ml_snapshot import IRPickler, IRUnpickler, GlobalNameMap
+from .generator_utility import type_strict_match
+
+
+## Log level for compiled dispatch index reports
+LOG_DISPATCH_INDEX = Log.LogLevel("Info", "dispatch_index")
+
+## version of the compiled index file format
+DISPATCH_INDEX_VERSION = 1
+## directory where compiled indexes are stored (overloaded by the
+#  ML_DISPATCH_INDEX_DIR environment variable)
+DEFAULT_DISPATCH_INDEX_DIR = os.path.join("~", ".cache", "metalibm", "dispatch_index")
+## modules (besides the ones defining the backend class hierarchy) whose
+#  source is part of the compiled index hash
+INDEX_DEPENDENCY_MODULES = (
+    "metalibm_core.code_generation.dispatch_index",
+    "metalibm_core.core.ml_formats",
+    "metalibm_core.code_generation.generator_utility",
+)
+## compiled entries store table positions, they can only be reused by another
+#  process if dict iteration order is the insertion order
+ORDERED_DICT_TABLES = sys.version_info >= (3, 7)
+
+
+def get_declarative_tuple(interface_condition):
+    """ return the (hashable) format tuple matched by @p interface_condition
+        if it is a declarative strict match, None otherwise """
+    if not isinstance(interface_condition, type_strict_match):
+        return None
+    try:
+        hash(interface_condition.type_tuple)
+    except TypeError:
+        # unhashable format (e.g. ML_Custom_FixedPoint_Format)
+        return None
+    return interface_condition.type_tuple
+
+
+def compile_interface_entries(entry_list):
+    """ compile an ordered list of (interface_condition, implementation)
+
+        Returns:
+            tuple: (entry count, list of (format tuple, position) of the
+                first strict match of each format tuple, list of the
+                positions of the dynamic conditions)
+    """
+    strict_positions = {}
+    strict_list = []
+    dynamic_positions = []
+    for position, (interface_condition, _) in enumerate(entry_list):
+        type_tuple = get_declarative_tuple(interface_condition)
+        if type_tuple is None:
+            dynamic_positions.append(position)
+        elif not type_tuple in strict_positions:
+            strict_positions[type_tuple] = position
+            strict_list.append((type_tuple, position))
+    return len(entry_list), strict_list, dynamic_positions
+
+
+class InterfaceIndex(object):
+    """ compiled version of a map interface_condition -> implementation:
+        strict format-tuple matches are indexed in a dict, only the
+        other (dynamic) conditions remain callables.
+        @p compiled is an optional result of compile_interface_entries
+        (e.g. loaded from a compiled index file), it is ignored if it does
+        not match the size of @p interface_map """
+    def __init__(self, interface_map, compiled=None):
+        ## ordered list of (interface_condition, implementation)
+        self.entry_list = list(interface_map.items())
+        if compiled is None or compiled[0] != len(self.entry_list):
+            compiled = compile_interface_entries(self.entry_list)
+        self.compiled = compiled
+        _, strict_list, dynamic_positions = compiled
+        ## format tuple -> (position, implementation) of the first strict match
+        self.strict_map = dict(
+            (type_tuple, (position, self.entry_list[position][1]))
+            for type_tuple, position in strict_list
+        )
+        ## ordered list of (position, interface_condition, implementation)
+        #  of the non-declarative conditions
+        self.dynamic_list = [
+            (position,) + self.entry_list[position] for position in dynamic_positions
+        ]
+
+    def lookup(self, interface, optree):
+        """ return the first implementation (in table order) whose
+            interface condition matches @p interface, None if none matches """
+        try:
+            strict_entry = self.strict_map.get(interface)
+        except TypeError:
+            # unhashable interface: plain linear search
+            for interface_condition, implementation in self.entry_list:
+                if interface_condition(*interface, optree = optree):
+                    return implementation
+            return None
+        for position, interface_condition, implementation in self.dynamic_list:
+            if not strict_entry is None and position > strict_entry[0]:
+                break
+            if interface_condition(*interface, optree = optree):
+                return implementation
+        return None if strict_entry is None else strict_entry[1]
+
+
+class DispatchIndex(object):
+    """ compiled view of a code generation table
+        language -> op_class -> codegen_key -> condition -> interface_condition -> implementation
+        Each (language, op_class, codegen_key) entry is compiled on
+        first lookup. The table must not be modified once an entry has been
+        compiled.
+        @p compiled_map is an optional (language, op_class, codegen_key) ->
+        list of compiled interface entries (one per condition) map, as
+        returned by get_compiled_map """
+    def __init__(self, table, compiled_map=None):
+        self.table = table
+        self.compiled_map = {} if compiled_map is None else compiled_map
+        ## (language, op_class, codegen_key) -> list of (condition, InterfaceIndex)
+        self.condition_map = {}
+
+    def get_condition_list(self, language, op_class, codegen_key):
+        key = (language, op_class, codegen_key)
+        if not key in self.condition_map:
+            condition_items = list(self.table[language][op_class][codegen_key].items())
+            compiled_list = self.compiled_map.get(key)
+            if compiled_list is None or len(compiled_list) != len(condition_items):
+                compiled_list = [None] * len(condition_items)
+            self.condition_map[key] = [
+                (condition, InterfaceIndex(interface_map, compiled))
+                for (condition, interface_map), compiled in zip(condition_items, compiled_list)
+            ]
+        return self.condition_map[key]
+
+    def get_compiled_map(self, name_map):
+        """ compile every entry of the table and return the part of the
+            result which can be serialized: entries whose keys and format
+            tuples are primitive values or module-level objects known to
+            @p name_map (the other strict matches are stored as dynamic
+            positions, the other keys are compiled on first lookup) """
+        def is_serializable(value):
+            if isinstance(value, tuple):
+                return all(is_serializable(sub_value) for sub_value in value)
+            return value is None or isinstance(value, (bool, int, str)) or not name_map.get_key(value) is None
+        compiled_map = {}
+        for language in self.table:
+            for op_class in self.table[language]:
+                for codegen_key in self.table[language][op_class]:
+                    key = (language, op_class, codegen_key)
+                    if not is_serializable(key):
+                        continue
+                    compiled_list = []
+                    for _, interface_index in self.get_condition_list(*key):
+                        entry_count, strict_list, dynamic_positions = interface_index.compiled
+                        serializable_list = [
+                            (type_tuple, position) for type_tuple, position in strict_list
+                            if is_serializable(type_tuple)
+                        ]
+                        dynamic_positions = sorted(dynamic_positions + [
+                            position for type_tuple, position in strict_list
+                            if not is_serializable(type_tuple)
+                        ])
+                        compiled_list.append((entry_count, serializable_list, dynamic_positions))
+                    compiled_map[key] = compiled_list
+        return compiled_map
+
+    def lookup(self, language, op_class, codegen_key, interface, optree):
+        """ return the implementation of @p optree (None if not found),
+            the table is expected to contain the
+            (language, op_class, codegen_key) entry """
+        for condition, interface_index in self.get_condition_list(language, op_class, codegen_key):
+            if condition(optree):
+                implementation = interface_index.lookup(interface, optree)
+                if not implementation is None:
+                    return implementation
+        return None
+
+
+## id(table) -> (table, DispatchIndex) for tables which live as long as
+#  the process (backend class code generation tables)
+_TABLE_DISPATCH_INDEX_CACHE = {}
+
+def get_table_dispatch_index(table):
+    """ return the (cached) DispatchIndex of @p table """
+    cached_entry = _TABLE_DISPATCH_INDEX_CACHE.get(id(table))
+    if cached_entry is None or not cached_entry[0] is table:
+        cached_entry = (table, DispatchIndex(table))
+        _TABLE_DISPATCH_INDEX_CACHE[id(table)] = cached_entry
+    return cached_entry[1]
+
+def set_table_dispatch_index(table, compiled_map):
+    """ register the DispatchIndex of @p table built from a compiled map,
+        unless the index of @p table already exists """
+    cached_entry = _TABLE_DISPATCH_INDEX_CACHE.get(id(table))
+    if cached_entry is None or not cached_entry[0] is table:
+        _TABLE_DISPATCH_INDEX_CACHE[id(table)] = (table, DispatchIndex(table, compiled_map))
+
+
+## backend class -> source hash
+_SOURCE_HASH_CACHE = {}
+
+def get_source_hash(proc_class):
+    """ return the hash of the sources the compiled index of backend class
+        @p proc_class depends on: modules of its class hierarchy and of the
+        index and format definitions """
+    if not proc_class in _SOURCE_HASH_CACHE:
+        module_names = set(INDEX_DEPENDENCY_MODULES)
+        module_names.update(parent.__module__ for parent in inspect.getmro(proc_class))
+        source_hash = hashlib.sha1()
+        # pickle format and dict ordering depend on the interpreter
+        source_hash.update(sys.version.encode("utf-8"))
+        for module_name in sorted(module_names):
+            try:
+                source_file = inspect.getsourcefile(sys.modules[module_name])
+            except (KeyError, TypeError):
+                # builtin module (e.g. object's)
+                continue
+            source_hash.update(module_name.encode("utf-8"))
+            with open(source_file, "rb") as source_stream:
+                source_hash.update(source_stream.read())
+        _SOURCE_HASH_CACHE[proc_class] = source_hash.hexdigest()
+    return _SOURCE_HASH_CACHE[proc_class]
+
+def get_index_filename(proc_class):
+    """ return the path of the compiled index file of @p proc_class """
+    index_dir = os.environ.get("ML_DISPATCH_INDEX_DIR", DEFAULT_DISPATCH_INDEX_DIR)
+    return os.path.join(
+        os.path.expanduser(index_dir),
+        "{}.{}.idx".format(proc_class.__module__, proc_class.__name__)
+    )
+
+def save_compiled_index(proc_class, table_map):
+    """ save the compiled index of backend class @p proc_class,
+        @p table_map is a dict table name -> DispatchIndex """
+    if not ORDERED_DICT_TABLES:
+        Log.report(Log.Warning, "compiled dispatch indexes require python >= 3.7, index of {} not saved", proc_class.__name__)
+        return None
+    name_map = GlobalNameMap()
+    header = {
+        "version": DISPATCH_INDEX_VERSION,
+        "hash": get_source_hash(proc_class),
+    }
+    tables = dict(
+        (table_name, dispatch_index.get_compiled_map(name_map))
+        for table_name, dispatch_index in table_map.items()
+    )
+    filename = get_index_filename(proc_class)
+    if not os.path.isdir(os.path.dirname(filename)):
+        os.makedirs(os.path.dirname(filename))
+    Log.report(LOG_DISPATCH_INDEX, "saving compiled dispatch index of {} in {}", proc_class.__name__, filename)
+    with open(filename, "wb") as index_stream:
+        pickle.dump(header, index_stream, pickle.HIGHEST_PROTOCOL)
+        IRPickler(index_stream, name_map).dump(tables)
+    return filename
+
+def load_compiled_index(proc_class):
+    """ load the compiled index of backend class @p proc_class
+
+        Returns:
+            dict: table name -> compiled map, None if the index file
+                does not exist or does not match the current sources
+    """
+    if not ORDERED_DICT_TABLES:
+        return None
+    filename = get_index_filename(proc_class)
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with open(filename, "rb") as index_stream:
+            header = pickle.load(index_stream)
+            if header.get("version") != DISPATCH_INDEX_VERSION or header.get("hash") != get_source_hash(proc_class):
+                Log.report(Log.Verbose, "compiled dispatch index {} is outdated, ignoring it", filename)
+                return None
+            return IRUnpickler(index_stream, GlobalNameMap()).load()
+    except (EnvironmentError, EOFError, pickle.UnpicklingError, ImportError, AttributeError, ValueError) as e:
+        Log.report(Log.Verbose, "unable to load compiled dispatch index {}: {}", filename, e)
+        return None
+
+
+if __name__ == "__main__":
+    # build step: compile and save the dispatch index of each target
+    # (every registered target by default)
+    from metalibm_core.core.target import TargetRegister
+    from metalibm_core.utility.ml_template import target_instanciate
+
+    target_names = sys.argv[1:] or TargetRegister.get_target_names()
+    for target_name in target_names:
+        target = target_instanciate(target_name)
+        for backend in [target] + target.parent_architecture:
+            filename = backend.save_dispatch_index()
+            if not filename is None:
+                Log.report(Log.Info, "{}: dispatch index saved in {}", backend.__class__.__name__, filename)
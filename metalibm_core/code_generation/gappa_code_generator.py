@@ -42,7 +42,7 @@ from ..core.attributes import ML_Debug
 from .code_object import Gappa_Unknown, GappaCodeObject
 
 from ..utility.gappa_utils import execute_gappa_script_extract
-from ..utility.log_report import Log
+from ..utility.log_report import Log, ApproximationError
 
 
 class GappaCodeGenerator(object):
@@ -377,7 +377,7 @@ class GappaCodeGenerator(object):
           eval_error = execute_gappa_script_extract(gappa_code.get(self), gappa_filename = gappa_filename)["goal"]
           return eval_error
         except ValueError:
-          Log.report(Log.Error, "Unable to compute evaluation error with gappa")
+          Log.report(Log.Error, "Unable to compute evaluation error with gappa", error=ApproximationError)
           
 
     def get_eval_error_v3(self, opt_engine, pre_optree, variable_copy_map = {}, goal_precision = ML_Exact, gappa_filename = "gappa_tmp.g", dichotomy = [], relative_error = False):
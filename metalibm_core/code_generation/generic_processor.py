@@ -368,6 +368,13 @@ c_code_generation_table = {
             type_strict_match(ML_DoubleDouble, ML_Binary64, ML_Binary64): 
                 ML_Multi_Prec_Lib_Function(
                     "ml_mult_dd_d2", arity=2, output_precision=ML_DoubleDouble),
+            type_strict_match(ML_DoubleDouble, ML_Binary64, ML_DoubleDouble):
+                ML_Multi_Prec_Lib_Function(
+                    "ml_mult_dd_d_dd", arity=2, output_precision=ML_DoubleDouble),
+            type_strict_match(ML_DoubleDouble, ML_DoubleDouble, ML_Binary64):
+                ML_Multi_Prec_Lib_Function(
+                    "ml_mult_dd_d_dd", arity=2, arg_map={0: FO_Arg(1), 1: FO_Arg(0)},
+                    output_precision=ML_DoubleDouble),
             type_std_integer_match:
                 ComplexOperator(
                     optree_modifier=full_mul_modifier,
@@ -47,6 +47,14 @@ from .code_function import CodeFunction
 from .code_object import MultiSymbolTable
 
 
+def result_too_long(result, threshold = 80):
+    """ Checks if CodeExpression result exceeds a given threshold """
+    if not isinstance(result, CodeExpression):
+        return False
+    else:
+        return len(result.get()) > threshold
+
+
 class VHDLCodeGenerator(object):
     language = C_Code
 
@@ -110,8 +118,10 @@ class VHDLCodeGenerator(object):
         language = self.language if language is None else language
 
         # search if <optree> has already been processed
-        if self.has_memoization(optree):
-            return self.get_memoization(optree)
+        # (single scan of the memoization levels)
+        for memoization_level in self.memoization_map:
+            if optree in memoization_level:
+                return memoization_level[optree]
 
         result = None
         # implementation generation
@@ -165,6 +175,26 @@ class VHDLCodeGenerator(object):
             code_object << "wait for {time_ns} ns;\n".format(time_ns = time_ns)
             return None
 
+        elif isinstance(optree, WhileLoop):
+            cond_code = self.generate_expr(code_object, optree.get_condition(), folded = False, language = language)
+            code_object << "while {cond} loop\n".format(cond = cond_code.get())
+            code_object.inc_level()
+            self.generate_expr(code_object, optree.get_body(), folded = folded, language = language)
+            code_object.dec_level()
+            code_object << "end loop;\n"
+            return None
+
+        elif isinstance(optree, ReadLine) or isinstance(optree, ReadValue):
+            src_code = self.generate_expr(code_object, optree.get_input(0), folded = True, language = language)
+            dst_code = self.generate_expr(code_object, optree.get_input(1), folded = True, language = language)
+            function_name = "readline" if isinstance(optree, ReadLine) else "read"
+            code_object << "{function}({src}, {dst});\n".format(function = function_name, src = src_code.get(), dst = dst_code.get())
+            return None
+
+        elif isinstance(optree, EndOfFile):
+            file_code = self.generate_expr(code_object, optree.get_input(0), folded = True, language = language)
+            result = CodeExpression("endfile({})".format(file_code.get()), ML_Bool)
+
         elif isinstance(optree, SwitchBlock):
             switch_value = optree.inputs[0]
             
@@ -479,14 +509,6 @@ class VHDLCodeGenerator(object):
         if optree.get_debug() and not self.disable_debug:
             self.generate_debug_msg(optree, result, code_object)
 
-        def result_too_long(result, threshold = 80):
-            """ Checks if CodeExpression result exceeds a given threshold """
-            if not isinstance(result, CodeExpression):
-                return False
-            else:
-                return len(result.get()) > threshold
-            
-
         if (initial or force_variable_storing or result_too_long(result)) and not isinstance(result, CodeVariable) and not result is None:
             # result could have been modified from initial optree
             result_precision = result.precision
@@ -535,6 +557,8 @@ class VHDLCodeGenerator(object):
 
         elif isinstance(symbol_object, Variable):
             precision_symbol = (symbol_object.get_precision().get_code_name(language = self.language) + " ")
+            if isinstance(symbol_object.get_precision(), HDL_TextFileFormat):
+                return "file %s : %s;\n" % (symbol, precision_symbol)
             return "variable %s : %s;\n" % (symbol, precision_symbol) 
 
         elif isinstance(symbol_object, Signal):
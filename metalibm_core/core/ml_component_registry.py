@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: registry of generated RTL sub-components, structurally
+#              identical entities (same generator and parameters) are
+#              generated once and shared by every instance
+###############################################################################
+
+import re
+
+from ..utility.log_report import Log
+
+## Log level for component registry reports
+LOG_COMPONENT_REGISTRY = Log.LogLevel("Info", "component_registry")
+
+
+class RegisteredComponent(object):
+    """ sub-component entity shared through the ComponentRegistry """
+    def __init__(self, entity, entity_list):
+        ## ML_EntityBasis object which generated the component
+        self.entity = entity
+        ## list of CodeEntity returned by entity.generate_scheme()
+        self.entity_list = entity_list
+        ## VHDL code of the component (and of the unregistered entities
+        #  it instanciates), set once generated in the component library
+        self.code = None
+
+    def get_name(self):
+        return self.entity.entity_name
+
+    def get_code_entity(self):
+        return self.entity.get_implementation()
+
+    def get_component_object(self):
+        return self.get_code_entity().get_component_object()
+
+
+class ComponentRegistry(object):
+    """ Registry of sub-component entities indexed by their generator
+        class and parameters """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """ forget every registered component """
+        ## (entity_ctor, parameters) -> RegisteredComponent
+        self.component_map = {}
+        ## main code entities of the registered components
+        self.main_entity_set = set()
+        ## every code entity generated by a registered component
+        self.shared_entity_set = set()
+        ## code entities already processed by the pass pipeline of a
+        #  previous design
+        self.frozen_entity_set = set()
+
+    @staticmethod
+    def get_key(entity_ctor, param_map):
+        return (entity_ctor, tuple(sorted(param_map.items())))
+
+    @staticmethod
+    def get_entity_name(base_name, param_map):
+        """ build a valid (and parameter-specific) VHDL entity name """
+        param_suffix = "_".join(
+            "{}_{}".format(name, param_map[name]) for name in sorted(param_map)
+        )
+        entity_name = "{}_{}".format(base_name, param_suffix) if param_suffix else base_name
+        return re.sub("_+", "_", re.sub("[^a-zA-Z0-9_]", "_", entity_name)).strip("_")
+
+    def get_component(self, entity_ctor, **param_map):
+        """ return the RegisteredComponent built by @p entity_ctor for
+            @p param_map, generating its scheme only on first request """
+        key = self.get_key(entity_ctor, param_map)
+        if not key in self.component_map:
+            arg_template = entity_ctor.get_default_args(**param_map)
+            arg_template.entity_name = self.get_entity_name(arg_template.entity_name, param_map)
+            entity = entity_ctor(arg_template)
+            Log.report(LOG_COMPONENT_REGISTRY, "registering component {}".format(entity.entity_name))
+            component = RegisteredComponent(entity, entity.generate_scheme())
+            self.component_map[key] = component
+            self.main_entity_set.add(component.get_code_entity())
+            self.shared_entity_set.update(component.entity_list)
+        else:
+            Log.report(LOG_COMPONENT_REGISTRY, "re-using component {}".format(self.component_map[key].get_name()))
+        return self.component_map[key]
+
+    def get_component_list(self):
+        """ return the list of registered components (by registration order) """
+        return list(self.component_map.values())
+
+    def is_registered(self, code_entity):
+        """ test if @p code_entity is the main entity of a registered component """
+        return code_entity in self.main_entity_set
+
+    def freeze(self, code_entity_list):
+        """ flag the shared entities of @p code_entity_list as
+            processed, so passes are not applied again when they are
+            re-used in another design """
+        self.frozen_entity_set.update(
+            code_entity for code_entity in code_entity_list
+            if code_entity in self.shared_entity_set
+        )
+
+    def is_frozen(self, code_entity):
+        return code_entity in self.frozen_entity_set
+
+
+## process-wide component registry
+COMPONENT_REGISTRY = ComponentRegistry()
+
+
+def get_component(entity_ctor, **param_map):
+    """ shortcut for COMPONENT_REGISTRY.get_component """
+    return COMPONENT_REGISTRY.get_component(entity_ctor, **param_map)
@@ -43,21 +43,23 @@ from sollya import Interval, S2
 from metalibm_core.core.ml_optimization_engine import OptimizationEngine
 from metalibm_core.core.ml_operations import (
     Statement, ReferenceAssign, Constant, Comparison, ConditionBlock,
-    LogicalNot, Conversion, TypeCast
+    LogicalNot, Conversion, TypeCast, Variable
 )
 from metalibm_core.core.ml_hdl_operations import (
-    Process, Signal, Wait, Report, Concatenation, Assert
+    Process, Signal, Wait, Report, Concatenation, Assert,
+    WhileLoop, ReadLine, ReadValue, EndOfFile
 )
 from metalibm_core.core.ml_formats import ML_Binary32, ML_Bool, ML_String
 from metalibm_core.core.ml_table import ML_Table
 from metalibm_core.core.ml_complex_formats import ML_Mpfr_t
 from metalibm_core.core.ml_call_externalizer import CallExternalizer
 from metalibm_core.core.ml_vectorizer import StaticVectorizer
+from metalibm_core.core.ml_component_registry import COMPONENT_REGISTRY
 
 from metalibm_core.core.precisions import ML_Faithful
 
 from metalibm_core.core.ml_hdl_format import (
-    ML_StdLogicVectorFormat, ML_StdLogic
+    ML_StdLogicVectorFormat, ML_StdLogic, HDL_TextFileFormat, HDL_Line
 )
 
 from metalibm_core.code_generation.code_object import (
@@ -71,20 +73,27 @@ from metalibm_core.code_generation.code_constant import VHDL_Code
 from metalibm_core.core.passes import (
     PassScheduler, PassDependency, Pass, AfterPassById
 )
+from metalibm_core.core.ml_snapshot import save_snapshot, load_snapshot
+from metalibm_core.utility.pass_profiler import PassProfiler
 
 from metalibm_core.code_generation.gappa_code_generator import (
     GappaCodeGenerator
 )
 
-from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.log_report import Log, ToolchainError, VerificationError
+from metalibm_core.utility.hdl_simulator import get_hdl_simulator
 from metalibm_core.utility.ml_template import (
     ArgDefault, DefaultEntityArgTemplate
 )
 
 from metalibm_core.opt.p_pipelining import generate_pipeline_stage
+from metalibm_core.opt.p_timing_pipelining import (
+    Pass_TimingDrivenPipelining, OperationDelayModel
+)
 
+import collections
+import multiprocessing
 import random
-import subprocess
 
 def generate_random_fp_value(precision, inf, sup):
     """ Generate a random floating-point value of format precision """
@@ -106,6 +115,37 @@ def generate_random_fixed_value(precision):
     rounded_value = precision.round_sollya_object(value)
     return rounded_value
 
+## entity and test case list used by emulation worker processes,
+#  inherited through fork (see ML_EntityBasis.compute_expected_outputs)
+_EMULATION_ENTITY = None
+_EMULATION_TC_LIST = None
+
+def serialize_emulated_value(value):
+    """ convert an emulated value into a picklable value (sollya
+        objects are exchanged as exact hexadecimal strings) """
+    if isinstance(value, sollya.SollyaObject):
+        sollya.settings.display = sollya.hexadecimal
+        return ("sollya", str(value))
+    return ("raw", value)
+
+def deserialize_emulated_value(serialized_value):
+    """ reverse of serialize_emulated_value """
+    value_kind, value = serialized_value
+    if value_kind == "sollya":
+        return sollya.parse(value)
+    return value
+
+def emulate_test_case(tc_index):
+    """ emulation worker: return the serialized output values of test
+        case tc_index, random generator is re-seeded with the test case
+        index so results do not depend on the number of workers """
+    random.seed(tc_index)
+    input_values, _ = _EMULATION_TC_LIST[tc_index]
+    output_values = _EMULATION_ENTITY.numeric_emulate(input_values)
+    return dict(
+        (tag, serialize_emulated_value(output_values[tag])) for tag in output_values
+    )
+
 ## \defgroup ml_entity ml_entity
 ## @{
 
@@ -181,6 +221,11 @@ class ML_EntityBasis(object):
 
     self.precision = arg_template.precision
     self.pipelined = arg_template.pipelined
+    # target clock period (ns) for automatic pipeline stage insertion
+    # (None to keep the stages defined by the entity scheme)
+    self.clock_period = arg_template.clock_period
+    # delay model calibration file used for automatic stage insertion
+    self.delay_model_file = arg_template.delay_model_file
 
     # io_precisions must be a list
     #     -> with a single element
@@ -200,6 +245,33 @@ class ML_EntityBasis(object):
 
     # enable post-generation RTL elaboration
     self.build_enable = arg_template.build_enable
+    # HDL simulator used for elaboration and auto-test execution
+    # (None for automatic selection)
+    self.hdl_simulator = arg_template.hdl_simulator
+
+    # file storing testbench stimulus (None to embed test vectors
+    # in the testbench)
+    self.tb_stimulus_file = arg_template.tb_stimulus_file
+    # streaming testbench: one new test vector per clock cycle, outputs
+    # are checked stage_num cycles later
+    self.tb_streaming = arg_template.tb_streaming
+    # probability of inserting a bubble (cycle without checked vector)
+    # in streaming testbench
+    self.tb_bubble_rate = arg_template.tb_bubble_rate
+    # seed of auto-test random generation (None for a random seed,
+    # set by generate_auto_test)
+    self.auto_test_seed = arg_template.auto_test_seed
+    # number of cycles of the streaming testbench (set by generate_auto_test)
+    self.tb_cycle_num = None
+    # number of processes used to emulate expected test outputs
+    self.emulation_jobs = arg_template.emulation_jobs
+    # shared VHDL file for registered sub-components (None to emit
+    # them in the output file)
+    self.component_library = arg_template.component_library
+    # I.R snapshot files (optimized entities saved before / loaded
+    # instead of scheme generation and optimization)
+    self.save_snapshot = arg_template.save_snapshot
+    self.load_snapshot = arg_template.load_snapshot
 
     self.language = language
 
@@ -239,8 +311,11 @@ class ML_EntityBasis(object):
       self.debug_code_object << debug_utils_lib
       self.vhdl_code_generator.set_debug_code_object(self.debug_code_object)
 
+    # per-pass / per-phase instrumentation
+    self.profile_trace = arg_template.profile_trace
+    self.pass_profiler = PassProfiler(enabled = arg_template.profile_passes or not arg_template.profile_trace is None)
     # pass scheduler instanciation
-    self.pass_scheduler = PassScheduler()
+    self.pass_scheduler = PassScheduler(profiler = self.pass_profiler, verify = arg_template.verify_passes, jobs = arg_template.pass_jobs)
     # recursive pass dependency
     pass_dep = PassDependency()
     for pass_uplet in arg_template.passes:
@@ -334,6 +409,80 @@ class ML_EntityBasis(object):
   #  and dumped to a file named after implementation's name
   #  @param code_function_list list of CodeFunction to be generated (as sub-function )
   #  @return void
+  def generate_entity_code(self, code_entity, language, uniquifier):
+    """ generate the VHDL code of @p code_entity
+
+        Returns:
+            tuple: (code string, list of the CodeEntity instanciated
+                    by code_entity)
+    """
+    entity_code_object = NestedCode(self.vhdl_code_generator, static_cst = False, uniquifier = uniquifier, code_ctor = VHDLCodeObject)
+    result = code_entity.add_definition(self.vhdl_code_generator, language, entity_code_object, static_cst = False)
+    result.add_library("ieee")
+    result.add_header("ieee.std_logic_1164.all")
+    result.add_header("ieee.std_logic_arith.all")
+    result.add_header("ieee.std_logic_misc.all")
+    if self.tb_stimulus_file:
+      result.add_header("std.textio.all")
+    code_str = result.get(self.vhdl_code_generator, headers = True)
+
+    # entities encountered during code generation
+    extra_entity_list = [
+          comp_object.get_code_entity() for comp_object in
+              entity_code_object.get_entity_list()
+    ]
+    Log.report(Log.Info, "appending {} extra entit(y/ies)\n".format(len(extra_entity_list)))
+    return code_str, extra_entity_list
+
+  def generate_entity_list_code(self, code_entity_list, language, uniquifier, library_entity_list = None):
+    """ generate the code of each entity of @p code_entity_list and of
+        the entities they instanciate (each entity is generated once).
+        If @p library_entity_list is not None, entities of registered
+        components are not generated but appended to it.
+
+        Returns:
+            str: generated code
+    """
+    generated_entity = set()
+    # per-entity code strings, joined once at the end
+    code_str_list = []
+    code_entity_list = collections.deque(code_entity_list)
+    while len(code_entity_list) > 0:
+      code_entity = code_entity_list.popleft()
+      if code_entity in generated_entity:
+        continue
+      generated_entity.add(code_entity)
+      if not library_entity_list is None and COMPONENT_REGISTRY.is_registered(code_entity):
+        # shared entity, emitted in the component library
+        library_entity_list.append(code_entity)
+        continue
+      code_str, extra_entity_list = self.generate_entity_code(code_entity, language, uniquifier)
+      code_str_list.append(code_str)
+      # adding the entities encountered during code generation
+      # for future generation
+      code_entity_list.extend(extra_entity_list)
+    return "".join(code_str_list)
+
+  def generate_component_library(self, language):
+    """ generate the shared component library file: every component
+        registered in COMPONENT_REGISTRY is generated once and re-used
+        by every design """
+    for component in COMPONENT_REGISTRY.get_component_list():
+      if component.code is None:
+        component.code = self.generate_entity_list_code(
+          [component.get_code_entity()], language,
+          "{0}_".format(component.get_name()), library_entity_list = []
+        )
+    Log.report(Log.Verbose, "Generating component library in " + self.component_library)
+    with open(self.component_library, "w") as library_stream:
+      library_stream.write("".join(component.code for component in COMPONENT_REGISTRY.get_component_list()))
+
+  def get_vhdl_file_list(self):
+    """ return the list of generated VHDL files (in analysis order) """
+    if self.component_library:
+      return [self.component_library, self.output_file]
+    return [self.output_file]
+
   def generate_code(self, code_entity_list, language = VHDL_Code):
     """ Final VHDL generation, once the evaluation scheme has been optimized"""
     # registering scheme as function implementation
@@ -341,34 +490,16 @@ class ML_EntityBasis(object):
     # main code object
     code_object = self.get_main_code_object()
 
-    # list of ComponentObject which are entities on which self depends
-    common_entity_list = []
-    generated_entity = []
-
     self.result = code_object
-    code_str = ""
-    while len(code_entity_list) > 0:
-      code_entity = code_entity_list.pop(0)
-      if code_entity in generated_entity:
-        continue
-      entity_code_object = NestedCode(self.vhdl_code_generator, static_cst = False, uniquifier = "{0}_".format(self.entity_name), code_ctor = VHDLCodeObject)
-      result = code_entity.add_definition(self.vhdl_code_generator, language, entity_code_object, static_cst = False)
-      result.add_library("ieee")
-      result.add_header("ieee.std_logic_1164.all")
-      result.add_header("ieee.std_logic_arith.all")
-      result.add_header("ieee.std_logic_misc.all")
-      code_str += result.get(self.vhdl_code_generator, headers = True)
-
-      generated_entity.append(code_entity)
-
-      # adding the entities encountered during code generation
-      # for future generation
-      extra_entity_list = [
-            comp_object.get_code_entity() for comp_object in
-                entity_code_object.get_entity_list()
-      ]
-      Log.report(Log.Info, "appending {} extra entit(y/ies)\n".format(len(extra_entity_list)))
-      code_entity_list += extra_entity_list
+    # entities of registered components are emitted in the
+    # component library (if any) rather than in the output file
+    library_entity_list = [] if self.component_library else None
+    code_str = self.generate_entity_list_code(
+      code_entity_list, language, "{0}_".format(self.entity_name),
+      library_entity_list = library_entity_list
+    )
+    if self.component_library:
+      self.generate_component_library(language)
 
     Log.report(Log.Verbose, "Generating VHDL code in " + self.output_file)
     output_stream = open(self.output_file, "w")
@@ -382,23 +513,37 @@ class ML_EntityBasis(object):
       debug_stream.close()
 
 
-  def gen_implementation(self, 
-			display_after_gen = False, 
-			display_after_opt = False, 
-			enable_subexpr_sharing = True
-		):
+  def generate_optimized_entity_list(self, time_step,
+                                     display_after_gen = False,
+                                     display_after_opt = False,
+                                     enable_subexpr_sharing = True):
+    """ generate the entity schemes (test bench included) and apply
+        every optimization and pipelining pass
+
+        Args:
+            time_step (int): stage duration (in ns)
+
+        Returns:
+            list: CodeEntity objects ready for code generation
+    """
     ## apply @p pass_object optimization pass
     #  to the scheme of each entity in code_entity_list
     def entity_execute_pass(scheduler, pass_object, code_entity_list):
       for code_entity in code_entity_list:
+        if COMPONENT_REGISTRY.is_frozen(code_entity):
+          # shared component already processed within another design
+          continue
         entity_scheme = code_entity.get_scheme()
-        processed_scheme = pass_object.execute(entity_scheme)
-        # todo check pass effect
-        # code_entity.set_scheme(processed_scheme)
+        processed_scheme = pass_object.apply_on_graph(entity_scheme)
+        if pass_object.rebuild_graph:
+          code_entity.set_scheme(processed_scheme)
       return code_entity_list
 
-    # generate scheme
-    code_entity_list = self.generate_entity_list()
+    # generate scheme (an entity shared by several sub-blocks is only
+    # listed once)
+    with self.pass_profiler.profile("generate_scheme", "phase") as section:
+      code_entity_list = list(collections.OrderedDict.fromkeys(self.generate_entity_list()))
+      section.set_outputs(code_entity_list)
 
     # defaulting pipeline stage to None
     self.implementation.set_current_stage(None)
@@ -421,7 +566,15 @@ class ML_EntityBasis(object):
     #    )
     
     if self.pipelined:
-        self.stage_num = generate_pipeline_stage(self)
+        if not self.clock_period is None:
+            # automatic stage assignment overriding hand-placed stages
+            delay_model = OperationDelayModel.load(self.delay_model_file) if self.delay_model_file else None
+            timing_pass = Pass_TimingDrivenPipelining(self.backend, clock_period = self.clock_period, delay_model = delay_model)
+            with self.pass_profiler.profile("timing_driven_pipelining", "pass", code_entity_list):
+                for code_entity in code_entity_list:
+                    timing_pass.execute(code_entity.get_scheme())
+        with self.pass_profiler.profile("generate_pipeline_stage", "phase", code_entity_list):
+            self.stage_num = generate_pipeline_stage(self)
     else:
         self.stage_num = 1
     Log.report(Log.Info, "there is/are {} pipeline stage(s)".format(self.stage_num)) 
@@ -433,9 +586,6 @@ class ML_EntityBasis(object):
       entity_execute_pass
     )
 
-    # stage duration (in ns)
-    time_step = 10
-
     if self.auto_test_enable:
       code_entity_list += self.generate_auto_test(
 				test_num = self.auto_test_number if self.auto_test_number else 0, 
@@ -466,35 +616,66 @@ class ML_EntityBasis(object):
       entity_execute_pass
     )
 
+    return code_entity_list
+
+  def gen_implementation(self, 
+			display_after_gen = False, 
+			display_after_opt = False, 
+			enable_subexpr_sharing = True
+		):
+    # stage duration (in ns)
+    time_step = 10
+
+    if self.load_snapshot:
+      # resuming generation from optimized entities
+      code_entity_list, snapshot_state = load_snapshot(self.load_snapshot, kind = "entity")
+      self.stage_num = snapshot_state["stage_num"]
+      self.tb_cycle_num = snapshot_state["tb_cycle_num"]
+    else:
+      code_entity_list = self.generate_optimized_entity_list(
+        time_step,
+        display_after_gen = display_after_gen,
+        display_after_opt = display_after_opt,
+        enable_subexpr_sharing = enable_subexpr_sharing
+      )
+    if self.save_snapshot:
+      save_snapshot(
+        self.save_snapshot, code_entity_list, "entity",
+        stage_num = self.stage_num, tb_cycle_num = self.tb_cycle_num
+      )
+
     # generate VHDL code to implement scheme
-    self.generate_code(code_entity_list, language = self.language)
+    with self.pass_profiler.profile("codegen", "phase", code_entity_list):
+      self.generate_code(code_entity_list, language = self.language)
+    COMPONENT_REGISTRY.freeze(code_entity_list)
+    self.pass_profiler.report(self.profile_trace)
 
     if self.auto_test_execute:
-      # rtl elaboration
-      print("Elaborating {}".format(self.output_file))
-      elab_cmd = "vlib work && vcom -2008 {}".format(self.output_file)
-      elab_result = subprocess.call(elab_cmd, shell = True)
-      print("Elaboration result: ", elab_result)
-      # debug cmd
-      debug_cmd = "do {debug_file};".format(debug_file = self.debug_file) if self.debug_flag else "" 
-      debug_cmd += " exit;" if self.exit_after_test else ""
-      # simulation
-      test_delay = time_step * self.stage_num * (self.auto_test_number + (len(self.standard_test_cases) if self.auto_test_std else 0) + 10) 
-      sim_cmd = "vsim -c work.testbench -do \"run {test_delay} ns; {debug_cmd}\"".format(entity = self.entity_name, debug_cmd = debug_cmd, test_delay = test_delay)
-      sim_result = subprocess.call(sim_cmd, shell = True)
-      if sim_result:
-        Log.report(Log.Error, "simulation failed [{}]".format(sim_result))
+      # rtl elaboration and simulation
+      simulator = get_hdl_simulator(self.hdl_simulator)
+      print("Simulating {} with {}".format(self.output_file, simulator.name))
+      if self.tb_streaming:
+        test_delay = time_step * (self.tb_cycle_num + 10)
       else:
-        Log.report(Log.Info, "simulation success")
+        test_delay = time_step * self.stage_num * (self.auto_test_number + (len(self.standard_test_cases) if self.auto_test_std else 0) + 10) 
+      sim_result = simulator.simulate(
+        self.get_vhdl_file_list(), "testbench", test_delay,
+        debug_file = self.debug_file if self.debug_flag else None,
+        exit_after_test = self.exit_after_test
+      )
+      if not sim_result:
+        Log.report(Log.Error, "simulation failed [{}] ({})".format("; ".join(sim_result.error_list), sim_result.get_timing_report()), error=VerificationError)
+      else:
+        Log.report(Log.Info, "simulation success ({})".format(sim_result.get_timing_report()))
 
     elif self.build_enable:
-      print("Elaborating {}".format(self.output_file))
-      elab_cmd = "vlib work && vcom -2008 {}".format(self.output_file)
-      elab_result = subprocess.call(elab_cmd, shell = True)
-      if elab_result:
-        Log.report(Log.Error, "failed to elaborate [{}]".format(elab_result))
+      simulator = get_hdl_simulator(self.hdl_simulator)
+      print("Elaborating {} with {}".format(self.output_file, simulator.name))
+      elab_result = simulator.elaborate(self.get_vhdl_file_list(), self.entity_name)
+      if not elab_result:
+        Log.report(Log.Error, "failed to elaborate [{}]".format("; ".join(elab_result.error_list)), error=ToolchainError)
       else:
-        Log.report(Log.Info, "elaboration success")
+        Log.report(Log.Info, "elaboration success ({})".format(elab_result.get_timing_report()))
     
 
   # Currently mostly empty, to be populated someday
@@ -549,64 +730,67 @@ class ML_EntityBasis(object):
     """ Generic initialization of test case generator """
     return
 
-  def generate_auto_test(self, test_num = 10, test_range = Interval(-1.0, 1.0), debug = False, time_step = 10):
-    """ time_step: duration of a stage (in ns) """
-    # instanciating tested component
-    # map of input_tag -> input_signal and output_tag -> output_signal
-    io_map = {}
-    # map of input_tag -> input_signal, excludind commodity signals
-    # (e.g. clock and reset)
-    input_signals = {}
-    # map of output_tag -> output_signal
-    output_signals = {}
-    # excluding clock and reset signals from argument list
-    # reduced_arg_list = [input_port for input_port in self.implementation.get_arg_list() if not input_port.get_tag() in ["clk", "reset"]]
-    reduced_arg_list = self.implementation.get_arg_list()
-    for input_port in reduced_arg_list:
-      input_tag = input_port.get_tag()
-      input_signal = Signal(input_tag + "_i", precision = input_port.get_precision(), var_type = Signal.Local)
-      io_map[input_tag] = input_signal
-      if not input_tag in ["clk", "reset"]:
-        input_signals[input_tag] = input_signal
-    for output_port in self.implementation.get_output_port():
-      output_tag = output_port.get_tag()
-      output_signal = Signal(
-        output_tag + "_o",
-        precision=output_port.get_precision(),
-        var_type=Signal.Local
-      )
-      io_map[output_tag] = output_signal
-      output_signals[output_tag] = output_signal
-
-    # building list of test cases
-    tc_list = []
-
-    self_component = self.implementation.get_component_object()
-    self_instance = self_component(io_map = io_map, tag = "tested_entity")
-    test_statement = Statement()
+  def compute_expected_outputs(self, tc_list):
+    """ fill the output values of the test cases of @p tc_list which
+        do not define them, using numeric_emulate. If self.emulation_jobs > 1
+        emulation is distributed across a pool of forked processes
+        (test case order is preserved). The random generator is seeded
+        with the test case index before each emulation, so results do
+        not depend on the number of processes
 
-    # initializing random test case generator
-    self.init_test_generator()
-
-    # Appending standard test cases if required
-    if self.auto_test_std:
-      tc_list += self.standard_test_cases
-
-    for i in range(test_num):
-      input_values = self.generate_test_case(input_signals, io_map, i, test_range)
-      tc_list.append((input_values,None))
+        Args:
+            tc_list (list): list of (input values, output values or None)
 
-    def compute_results(tc):
-        """ update test case with output values if required """
-        input_values, output_values = tc
-        if output_values is None:
-            return input_values, self.numeric_emulate(input_values)
-        else:
-            return tc
+        Returns:
+            list: list of (input values, output values)
+    """
+    emulated_indexes = [index for index, (_, output_values) in enumerate(tc_list) if output_values is None]
+    if self.emulation_jobs > 1 and len(emulated_indexes) > 1 and "fork" in multiprocessing.get_all_start_methods():
+      global _EMULATION_ENTITY, _EMULATION_TC_LIST
+      _EMULATION_ENTITY, _EMULATION_TC_LIST = self, tc_list
+      Log.report(Log.Info, "emulating {} test cases with {} processes".format(len(emulated_indexes), self.emulation_jobs))
+      try:
+        with multiprocessing.get_context("fork").Pool(self.emulation_jobs) as pool:
+          serialized_list = pool.map(
+            emulate_test_case, emulated_indexes,
+            chunksize = max(1, len(emulated_indexes) // (4 * self.emulation_jobs))
+          )
+      finally:
+        _EMULATION_ENTITY, _EMULATION_TC_LIST = None, None
+      emulated_outputs = [
+        dict((tag, deserialize_emulated_value(serialized[tag])) for tag in serialized)
+        for serialized in serialized_list
+      ]
+    else:
+      # random generator is re-seeded with the test case index as in
+      # emulate_test_case (and restored afterwards)
+      random_state = random.getstate()
+      try:
+        emulated_outputs = []
+        for index in emulated_indexes:
+          random.seed(index)
+          emulated_outputs.append(self.numeric_emulate(tc_list[index][0]))
+      finally:
+        random.setstate(random_state)
+    result_list = list(tc_list)
+    for index, output_values in zip(emulated_indexes, emulated_outputs):
+      result_list[index] = (tc_list[index][0], output_values)
+    return result_list
+
+  def generate_unrolled_test_statement(self, tc_list, io_map, output_signals, time_step):
+    """ generate a test statement which embeds every test vector:
+        one input assignation and output check block per test case
 
-    # filling output values
-    tc_list = [compute_results(tc) for tc in tc_list]
+        Args:
+            tc_list (list): list of (input values, output values) test cases
+            io_map (dict): tag -> testbench signal
+            output_signals (dict): tag -> output signal
+            time_step (int): duration of a stage (in ns)
 
+        Returns:
+            Statement: test statement
+    """
+    test_statement = Statement()
     for input_values, output_values in tc_list:
       input_msg = ""
 
@@ -666,9 +850,353 @@ class ML_EntityBasis(object):
             severity = Assert.Failure
           )
         )
+    return test_statement
+
+  @staticmethod
+  def get_stimulus_bit_string(precision, value):
+    """ return the binary string encoding @p value in @p precision,
+        as read by std.textio's read """
+    bit_size = precision.get_bit_size()
+    coding = int(precision.get_base_format().get_integer_coding(value)) & (2**bit_size - 1)
+    return "{value:0{width}b}".format(value = coding, width = bit_size)
+
+  def generate_file_test_statement(self, tc_list, io_map, input_signals, output_signals, time_step):
+    """ dump test vectors into self.tb_stimulus_file (one line per test
+        case: inputs then expected outputs, in tag order) and generate
+        a test statement which reads, drives and checks them in a loop
+        (testbench size does not depend on the number of test cases)
+
+        Args:
+            tc_list (list): list of (input values, output values) test cases
+            io_map (dict): tag -> testbench signal
+            input_signals (dict): tag -> input signal
+            output_signals (dict): tag -> output signal
+            time_step (int): duration of a stage (in ns)
+
+        Returns:
+            Statement: test statement
+    """
+    input_tags = sorted(input_signals.keys())
+    output_tags = sorted(output_signals.keys())
+
+    Log.report(Log.Info, "writing {} test vectors in {}".format(len(tc_list), self.tb_stimulus_file))
+    with open(self.tb_stimulus_file, "w") as stimulus_stream:
+      for input_values, output_values in tc_list:
+        stimulus_stream.write(" ".join(
+          [self.get_stimulus_bit_string(io_map[tag].get_precision(), input_values[tag]) for tag in input_tags] +
+          [self.get_stimulus_bit_string(output_signals[tag].get_precision(), output_values[tag]) for tag in output_tags]
+        ) + "\n")
+
+    stimulus_file = Variable("stimulus_file", precision = HDL_TextFileFormat(self.tb_stimulus_file), var_type = Variable.Local)
+    stimulus_line = Variable("stimulus_line", precision = HDL_Line, var_type = Variable.Local)
+    input_vars = dict(
+      (tag, Variable(tag + "_v", precision = io_map[tag].get_precision(), var_type = Variable.Local))
+      for tag in input_tags
+    )
+    expected_vars = dict(
+      (tag, Variable(tag + "_expected", precision = output_signals[tag].get_precision(), var_type = Variable.Local))
+      for tag in output_tags
+    )
+
+    loop_body = Statement(ReadLine(stimulus_file, stimulus_line))
+    for tag in input_tags:
+      loop_body.add(ReadValue(stimulus_line, input_vars[tag]))
+    for tag in output_tags:
+      loop_body.add(ReadValue(stimulus_line, expected_vars[tag]))
+    for tag in input_tags:
+      loop_body.add(ReferenceAssign(io_map[tag], input_vars[tag]))
+    loop_body.add(Wait(time_step * self.stage_num))
+
+    for tag in output_tags:
+      loop_body.add(
+        self.generate_output_check(
+          tag, output_signals[tag], expected_vars[tag],
+          "\"unexpected value for output {}\"".format(tag)
+        )
+      )
+
+    return Statement(
+      WhileLoop(
+        LogicalNot(EndOfFile(stimulus_file), precision = ML_Bool),
+        loop_body
+      )
+    )
+
+  @staticmethod
+  def generate_output_check(output_tag, output_signal, expected_node, assert_msg):
+    """ generate a statement comparing @p output_signal against
+        @p expected_node: the output and expected values are reported
+        on mismatch, before failing assertion with message @p assert_msg """
+    slv_precision = ML_StdLogicVectorFormat(output_signal.get_precision().get_bit_size())
+    test_pass_cond = Comparison(
+      output_signal,
+      expected_node,
+      specifier = Comparison.Equal,
+      precision = ML_Bool
+    )
+    return Statement(
+      ConditionBlock(
+        LogicalNot(test_pass_cond, precision = ML_Bool),
+        Report(
+          Concatenation(
+            " result for {}: ".format(output_tag),
+            Concatenation(
+              Conversion(TypeCast(output_signal, precision = slv_precision), precision = ML_String),
+              Concatenation(
+                " expecting: ",
+                Conversion(TypeCast(expected_node, precision = slv_precision), precision = ML_String),
+                precision = ML_String
+              ),
+              precision = ML_String
+            ),
+            precision = ML_String
+          )
+        )
+      ),
+      Assert(
+        test_pass_cond,
+        assert_msg,
+        severity = Assert.Failure
+      )
+    )
+
+  def get_streaming_schedule(self, tc_list):
+    """ build the cycle-by-cycle schedule of a streaming testbench:
+        a new test vector is issued every cycle (unless a random bubble
+        is inserted, in which case the inputs of a random test vector are
+        issued but never checked) and pushed into a scoreboard queue,
+        the vector issued stage_num cycles earlier is popped and checked.
+        Bubbles are drawn from a generator seeded with self.auto_test_seed
+        so the schedule is reproducible.
+
+        Args:
+            tc_list (list): list of (input values, output values) test cases
+
+        Returns:
+            list: one (input values, checked test case or None) per cycle,
+                  input values being None once every vector has been issued
+    """
+    bubble_random = random.Random(self.auto_test_seed)
+    issue_list = []
+    for tc in tc_list:
+      while self.tb_bubble_rate and bubble_random.random() < self.tb_bubble_rate:
+        issue_list.append((bubble_random.choice(tc_list)[0], None))
+      input_values, _ = tc
+      issue_list.append((input_values, tc))
+    # scoreboard: test cases in-flight in the pipeline (None for bubbles)
+    scoreboard = collections.deque()
+    schedule = []
+    for cycle in range(len(issue_list) + self.stage_num):
+      checked_tc = scoreboard.popleft() if len(scoreboard) == self.stage_num else None
+      if cycle < len(issue_list):
+        input_values, issued_tc = issue_list[cycle]
+      else:
+        # draining the pipeline
+        input_values, issued_tc = None, None
+      scoreboard.append(issued_tc)
+      schedule.append((input_values, checked_tc))
+    return schedule
+
+  def generate_streaming_test_statement(self, tc_list, io_map, output_signals, time_step):
+    """ generate a streaming test statement which embeds every test vector:
+        inputs are driven back-to-back (one vector per clock cycle) and
+        outputs checked stage_num cycles later (see get_streaming_schedule)
+
+        Args:
+            tc_list (list): list of (input values, output values) test cases
+            io_map (dict): tag -> testbench signal
+            output_signals (dict): tag -> output signal
+            time_step (int): duration of a stage (in ns)
+
+        Returns:
+            Statement: test statement
+    """
+    schedule = self.get_streaming_schedule(tc_list)
+    self.tb_cycle_num = len(schedule)
+    test_statement = Statement()
+    for cycle, (input_values, checked_tc) in enumerate(schedule):
+      # checking the vector issued stage_num cycles ago (before inputs
+      # of the current cycle are driven)
+      if not checked_tc is None:
+        tc_input_values, tc_output_values = checked_tc
+        input_msg = " ".join(
+          "{}={}".format(tag, hex(io_map[tag].get_precision().get_base_format().get_integer_coding(tc_input_values[tag])))
+          for tag in sorted(tc_input_values)
+        )
+        for output_tag in output_signals:
+          output_signal = output_signals[output_tag]
+          test_statement.add(
+            self.generate_output_check(
+              output_tag, output_signal,
+              Constant(tc_output_values[output_tag], precision = output_signal.get_precision()),
+              "\"unexpected value at cycle {cycle} for inputs {input_msg}, output {output_tag}\"".format(
+                cycle = cycle, input_msg = input_msg, output_tag = output_tag
+              )
+            )
+          )
+      if not input_values is None:
+        for input_tag in input_values:
+          input_signal = io_map[input_tag]
+          test_statement.add(ReferenceAssign(input_signal, Constant(input_values[input_tag], precision = input_signal.get_precision())))
+      test_statement.add(Wait(time_step))
+    return test_statement
+
+  def generate_streaming_file_test_statement(self, tc_list, io_map, input_signals, output_signals, time_step):
+    """ streaming version of generate_file_test_statement: the
+        schedule of get_streaming_schedule is dumped into
+        self.tb_stimulus_file (one line per cycle: check flag, inputs to be
+        driven, expected outputs of the vector issued stage_num cycles
+        earlier) and read back by a std.textio loop
 
+        Args:
+            tc_list (list): list of (input values, output values) test cases
+            io_map (dict): tag -> testbench signal
+            input_signals (dict): tag -> input signal
+            output_signals (dict): tag -> output signal
+            time_step (int): duration of a stage (in ns)
 
+        Returns:
+            Statement: test statement
+    """
+    input_tags = sorted(input_signals.keys())
+    output_tags = sorted(output_signals.keys())
+
+    schedule = self.get_streaming_schedule(tc_list)
+    self.tb_cycle_num = len(schedule)
+    Log.report(Log.Info, "writing {} streaming cycles in {}".format(len(schedule), self.tb_stimulus_file))
+    last_input_values = tc_list[0][0] if tc_list else {}
+    with open(self.tb_stimulus_file, "w") as stimulus_stream:
+      for input_values, checked_tc in schedule:
+        # pipeline drain: inputs are held
+        last_input_values = last_input_values if input_values is None else input_values
+        check_flag = "0" if checked_tc is None else "1"
+        expected_strings = [
+          self.get_stimulus_bit_string(
+            output_signals[tag].get_precision(),
+            0 if checked_tc is None else checked_tc[1][tag]
+          ) for tag in output_tags
+        ]
+        stimulus_stream.write(" ".join(
+          [check_flag] +
+          [self.get_stimulus_bit_string(io_map[tag].get_precision(), last_input_values[tag]) for tag in input_tags] +
+          expected_strings
+        ) + "\n")
+
+    stimulus_file = Variable("stimulus_file", precision = HDL_TextFileFormat(self.tb_stimulus_file), var_type = Variable.Local)
+    stimulus_line = Variable("stimulus_line", precision = HDL_Line, var_type = Variable.Local)
+    check_var = Variable("check_v", precision = ML_StdLogic, var_type = Variable.Local)
+    input_vars = dict(
+      (tag, Variable(tag + "_v", precision = io_map[tag].get_precision(), var_type = Variable.Local))
+      for tag in input_tags
+    )
+    expected_vars = dict(
+      (tag, Variable(tag + "_expected", precision = output_signals[tag].get_precision(), var_type = Variable.Local))
+      for tag in output_tags
+    )
 
+    loop_body = Statement(
+      ReadLine(stimulus_file, stimulus_line),
+      ReadValue(stimulus_line, check_var)
+    )
+    for tag in input_tags:
+      loop_body.add(ReadValue(stimulus_line, input_vars[tag]))
+    for tag in output_tags:
+      loop_body.add(ReadValue(stimulus_line, expected_vars[tag]))
+    check_statement = Statement()
+    for tag in output_tags:
+      check_statement.add(
+        self.generate_output_check(
+          tag, output_signals[tag], expected_vars[tag],
+          "\"unexpected value for output {}\"".format(tag)
+        )
+      )
+    loop_body.add(
+      ConditionBlock(
+        Comparison(
+          check_var, Constant(1, precision = ML_StdLogic),
+          specifier = Comparison.Equal, precision = ML_Bool
+        ),
+        check_statement
+      )
+    )
+    for tag in input_tags:
+      loop_body.add(ReferenceAssign(io_map[tag], input_vars[tag]))
+    loop_body.add(Wait(time_step))
+
+    return Statement(
+      WhileLoop(
+        LogicalNot(EndOfFile(stimulus_file), precision = ML_Bool),
+        loop_body
+      )
+    )
+
+  def generate_auto_test(self, test_num = 10, test_range = Interval(-1.0, 1.0), debug = False, time_step = 10):
+    """ time_step: duration of a stage (in ns) """
+    # instanciating tested component
+    # map of input_tag -> input_signal and output_tag -> output_signal
+    io_map = {}
+    # map of input_tag -> input_signal, excludind commodity signals
+    # (e.g. clock and reset)
+    input_signals = {}
+    # map of output_tag -> output_signal
+    output_signals = {}
+    # excluding clock and reset signals from argument list
+    # reduced_arg_list = [input_port for input_port in self.implementation.get_arg_list() if not input_port.get_tag() in ["clk", "reset"]]
+    reduced_arg_list = self.implementation.get_arg_list()
+    for input_port in reduced_arg_list:
+      input_tag = input_port.get_tag()
+      input_signal = Signal(input_tag + "_i", precision = input_port.get_precision(), var_type = Signal.Local)
+      io_map[input_tag] = input_signal
+      if not input_tag in ["clk", "reset"]:
+        input_signals[input_tag] = input_signal
+    for output_port in self.implementation.get_output_port():
+      output_tag = output_port.get_tag()
+      output_signal = Signal(
+        output_tag + "_o",
+        precision=output_port.get_precision(),
+        var_type=Signal.Local
+      )
+      io_map[output_tag] = output_signal
+      output_signals[output_tag] = output_signal
+
+    # building list of test cases
+    tc_list = []
+
+    self_component = self.implementation.get_component_object()
+    self_instance = self_component(io_map = io_map, tag = "tested_entity")
+
+    # seeding random test case generation
+    if self.auto_test_seed is None:
+      self.auto_test_seed = random.randrange(2**32)
+    Log.report(Log.Info, "auto-test seed is {}".format(self.auto_test_seed))
+    random.seed(self.auto_test_seed)
+
+    # initializing random test case generator
+    self.init_test_generator()
+
+    # Appending standard test cases if required
+    if self.auto_test_std:
+      tc_list += self.standard_test_cases
+
+    for i in range(test_num):
+      input_values = self.generate_test_case(input_signals, io_map, i, test_range)
+      tc_list.append((input_values,None))
+
+    # filling output values
+    tc_list = self.compute_expected_outputs(tc_list)
+
+    if self.tb_streaming and self.tb_stimulus_file:
+      test_statement = self.generate_streaming_file_test_statement(
+        tc_list, io_map, input_signals, output_signals, time_step)
+    elif self.tb_streaming:
+      test_statement = self.generate_streaming_test_statement(
+        tc_list, io_map, output_signals, time_step)
+    elif self.tb_stimulus_file:
+      test_statement = self.generate_file_test_statement(
+        tc_list, io_map, input_signals, output_signals, time_step)
+    else:
+      test_statement = self.generate_unrolled_test_statement(
+        tc_list, io_map, output_signals, time_step)
 
     testbench = CodeEntity("testbench") 
     test_process = Process(
@@ -957,6 +957,10 @@ class ML_Compound_Format(ML_Format):
     def get_sollya_object(self):
       return self.sollya_object
 
+    ## return the format bit size (sum of the fields bit sizes)
+    def get_bit_size(self):
+        return sum(field_format.get_bit_size() for field_format in self.field_format_list)
+
     ## forces constant declaration during code generation
     def is_cst_decl_required(self):
         return True
@@ -51,11 +51,13 @@ from metalibm_core.code_generation.mpfr_backend import MPFRProcessor
 from metalibm_core.code_generation.c_code_generator import CCodeGenerator
 from metalibm_core.code_generation.code_constant import C_Code
 #from metalibm_core.code_generation.generator_utility import *
-from metalibm_core.core.passes import Pass
+from metalibm_core.core.passes import Pass, PassScheduler
+from metalibm_core.core.ml_snapshot import save_snapshot, load_snapshot
 
 from metalibm_core.code_generation.gappa_code_generator import GappaCodeGenerator
 
-from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.log_report import Log, ToolchainError, VerificationError
+from metalibm_core.utility.pass_profiler import PassProfiler
 from metalibm_core.utility.debug_utils import *
 from metalibm_core.utility.ml_template import DefaultArgTemplate
 
@@ -92,6 +94,13 @@ def libc_naming(base_name, io_precisions, in_arity = 1, out_arity = 1):
       previous_format = precision
     counter += 1
   return base_name + format_suffix
+
+## apply @p pass_object optimization pass to the scheme
+#  of each CodeFunction in @p code_function_list
+def function_execute_pass(scheduler, pass_object, code_function_list):
+  for code_function in code_function_list:
+    code_function.set_scheme(pass_object.apply_on_graph(code_function.get_scheme()))
+  return code_function_list
   
 
 ## Base class for all metalibm function (metafunction)
@@ -168,8 +177,23 @@ class ML_FunctionBasis(object):
     self.dot_product_enabled = args.dot_product_enabled
     self.fast_path_extract = args.fast_path_extract
 
+    # map of metrics (e.g. polynomial degree, approximation error)
+    # describing the implementation design choices, filled by generate_scheme
+    # and used by design-space exploration
+    self.design_metrics = {}
+
     # instance of CodeFunction containing the function implementation
     self.implementation = CodeFunction(self.function_name, output_format=self.get_output_precision())
+    # I.R snapshot files (optimized functions saved before / loaded
+    # instead of scheme generation and optimization)
+    self.save_snapshot = args.save_snapshot
+    self.load_snapshot = args.load_snapshot
+
+    # per-pass / per-phase instrumentation
+    self.profile_trace = args.profile_trace
+    self.pass_profiler = PassProfiler(enabled = args.profile_passes or not args.profile_trace is None)
+    # scheduler executing pre-generation passes over the function list
+    self.pass_scheduler = PassScheduler(profiler = self.pass_profiler, verify = args.verify_passes, jobs = args.pass_jobs)
     # instance of OptimizationEngine
     self.opt_engine = OptimizationEngine(self.processor, dot_product_enabled=self.dot_product_enabled)
     # instance of GappaCodeGenerator to perform inline proofs
@@ -288,24 +312,31 @@ class ML_FunctionBasis(object):
     """ default scheme optimization """
     # copying when required
     scheme = pre_scheme if copy is None else pre_scheme.copy(copy)
+    profiler = self.pass_profiler
     # fusing FMA
     if self.fuse_fma:
       Log.report(Log.Verbose, "MDL fusing FMA")
-      scheme = self.opt_engine.fuse_multiply_add(scheme, silence = True)
+      with profiler.profile("fuse_multiply_add", "opt_engine", scheme) as section:
+        scheme = self.opt_engine.fuse_multiply_add(scheme, silence = True)
+        section.set_outputs(scheme)
 
     Log.report(Log.Verbose, "MDL abstract scheme")
-    self.opt_engine.instantiate_abstract_precision(scheme,
-                                                   default_precision = None)
+    with profiler.profile("instantiate_abstract_precision", "opt_engine", scheme):
+      self.opt_engine.instantiate_abstract_precision(scheme,
+                                                     default_precision = None)
 
     Log.report(Log.Verbose, "MDL instantiated scheme")
-    self.opt_engine.instantiate_precision(scheme, default_precision = None)
+    with profiler.profile("instantiate_precision", "opt_engine", scheme):
+      self.opt_engine.instantiate_precision(scheme, default_precision = None)
 
     if enable_subexpr_sharing:
       Log.report(Log.Verbose, "subexpression sharing")
-      self.opt_engine.subexpression_sharing(scheme)
+      with profiler.profile("subexpression_sharing", "opt_engine", scheme):
+        self.opt_engine.subexpression_sharing(scheme)
 
     Log.report(Log.Verbose, "silencing operation")
-    self.opt_engine.silence_fp_operations(scheme)
+    with profiler.profile("silence_fp_operations", "opt_engine", scheme):
+      self.opt_engine.silence_fp_operations(scheme)
 
     return scheme
 
@@ -315,6 +346,19 @@ class ML_FunctionBasis(object):
   def get_main_code_object(self):
     return self.main_code_object
 
+  ## replace the main code object (e.g. to share a compilation unit
+  #  between several functions)
+  def set_main_code_object(self, code_object):
+    self.main_code_object = code_object
+
+  ## add the headers required by every generated function
+  #  to @p code_object
+  def add_default_headers(self, code_object):
+    code_object.add_header("support_lib/ml_special_values.h")
+    code_object.add_header("math.h")
+    code_object.add_header("stdio.h")
+    code_object.add_header("inttypes.h")
+
 
   def generate_C(self, code_function_list):
     return self.generate_code(code_function_list, language = C_Code)
@@ -337,30 +381,45 @@ class ML_FunctionBasis(object):
                                                  static_cst = True)
 
     # adding headers
-    self.result.add_header("support_lib/ml_special_values.h")
-    self.result.add_header("math.h")
-    self.result.add_header("stdio.h")
-    self.result.add_header("inttypes.h")
+    self.add_default_headers(self.result)
 
     Log.report(Log.Info, "Generating C code in " + self.output_file)
     output_stream = open(self.output_file, "w")
     output_stream.write(self.result.get(self.C_code_generator))
     output_stream.close()
 
-  def gen_implementation(self, display_after_gen=False,
-                         display_after_opt=False,
-                         enable_subexpr_sharing=True):
-    """ generate implementation 
+  def get_pre_gen_pass_list(self):
+    """ instanciate the pre-generation passes, return a list of
+        pairs (pass tag, pass object).
+        pre-generation passes are instanciated once per compilation unit
+        so that they can share state between functions (e.g. table merging) """
+    return [
+      (pass_tag, Pass.get_pass_by_tag(pass_tag)(self.processor)) for pass_tag in self.pre_gen_passes
+    ]
+
+  def generate_implementation_list(self, pre_gen_pass_list,
+                                   display_after_gen=False,
+                                   display_after_opt=False,
+                                   enable_subexpr_sharing=True):
+    """ generate and optimize the CodeFunction objects implementing
+        the function (main function and sub-functions, test and bench
+        wrappers excluded)
 
         Args:
+            pre_gen_pass_list (list): pairs (pass tag, pass object) executed
+               on each function before code generation
             display_after_gen enable (bool): I.R dump after generation
             display_after_opt enable (bool): I.R dump after optimization
             enable_subexpr_sharing (bool): I.R enable sub-expression sharing
-               optimization 
+               optimization
 
+        Returns:
+            list of optimized CodeFunction
         """
     # generate scheme
-    code_function_list = self.generate_function_list()
+    with self.pass_profiler.profile("generate_scheme", "phase") as section:
+      code_function_list = self.generate_function_list()
+      section.set_outputs(code_function_list)
     if self.get_vector_size() != 1:
       scalar_scheme = self.implementation.get_scheme()
       scalar_arg_list = self.implementation.get_arg_list()
@@ -381,17 +440,43 @@ class ML_FunctionBasis(object):
       opt_scheme = self.optimise_scheme(
         scheme, enable_subexpr_sharing = enable_subexpr_sharing
       )
-      # pre-generation optimization
-      for pass_tag in self.pre_gen_passes:
-        pass_class = Pass.get_pass_by_tag(pass_tag)
-        pass_object = pass_class(self.processor)
-        Log.report(Log.Info, "executing opt pass: {}".format(pass_tag))
-        opt_scheme = pass_object.execute(opt_scheme)
       code_function.set_scheme(opt_scheme)
 
-      if self.display_after_opt or display_after_opt:
+    # pre-generation optimization: each pass is executed over every
+    # function (main function and sub-functions are independent graphs)
+    for pass_tag, pass_object in pre_gen_pass_list:
+      Log.report(Log.Info, "executing opt pass: {}".format(pass_tag))
+      code_function_list = self.pass_scheduler.execute_pass_list(
+        [pass_object], code_function_list, function_execute_pass
+      )
+
+    if self.display_after_opt or display_after_opt:
+      for code_function in code_function_list:
         print("function %s, after opt " % code_function.get_name())
-        print(opt_scheme.get_str(depth = None, display_precision = True, memoization_map = {}, display_id=True))
+        print(code_function.get_scheme().get_str(depth = None, display_precision = True, memoization_map = {}, display_id=True))
+    return code_function_list
+
+  def generate_optimized_function_list(self, display_after_gen=False,
+                                       display_after_opt=False,
+                                       enable_subexpr_sharing=True):
+    """ generate and optimize every CodeFunction of the implementation
+        (test and bench wrappers included)
+
+        Args:
+            display_after_gen enable (bool): I.R dump after generation
+            display_after_opt enable (bool): I.R dump after optimization
+            enable_subexpr_sharing (bool): I.R enable sub-expression sharing
+               optimization
+
+        Returns:
+            list of CodeFunction ready for code generation
+        """
+    code_function_list = self.generate_implementation_list(
+      self.get_pre_gen_pass_list(),
+      display_after_gen=display_after_gen,
+      display_after_opt=display_after_opt,
+      enable_subexpr_sharing=enable_subexpr_sharing
+    )
 
     # generate auto-test wrapper
     if self.auto_test_enable:
@@ -429,10 +514,38 @@ class ML_FunctionBasis(object):
     if self.check_processor_support:
       for code_function in code_function_list:
         Log.report(Log.Verbose, "checking processor support {}".format(self.language))
-        self.opt_engine.check_processor_support(code_function.get_scheme(), language = self.language)
+        with self.pass_profiler.profile("check_processor_support", "opt_engine", code_function):
+          self.opt_engine.check_processor_support(code_function.get_scheme(), language = self.language)
+    return code_function_list
+
+  def gen_implementation(self, display_after_gen=False,
+                         display_after_opt=False,
+                         enable_subexpr_sharing=True):
+    """ generate implementation 
+
+        Args:
+            display_after_gen enable (bool): I.R dump after generation
+            display_after_opt enable (bool): I.R dump after optimization
+            enable_subexpr_sharing (bool): I.R enable sub-expression sharing
+               optimization 
+
+        """
+    if self.load_snapshot:
+      # resuming generation from optimized functions
+      code_function_list, _ = load_snapshot(self.load_snapshot, kind = "function")
+    else:
+      code_function_list = self.generate_optimized_function_list(
+        display_after_gen=display_after_gen,
+        display_after_opt=display_after_opt,
+        enable_subexpr_sharing=enable_subexpr_sharing
+      )
+    if self.save_snapshot:
+      save_snapshot(self.save_snapshot, code_function_list, "function")
 
     # generate C code to implement scheme
-    self.generate_code(code_function_list, language = self.language)
+    with self.pass_profiler.profile("codegen", "phase", code_function_list):
+      self.generate_code(code_function_list, language = self.language)
+    self.pass_profiler.report(self.profile_trace)
 
     if self.build_enable or self.auto_test_execute or self.execute_trigger:
       compiler = self.processor.get_compiler()
@@ -466,37 +579,42 @@ class ML_FunctionBasis(object):
           if not test_result:
             Log.report(Log.Info, "VALIDATION SUCCESS")
           else:
-            Log.report(Log.Info, "VALIDATION FAILURE [{}]".format(test_result))
-            sys.exit(1)
+            Log.report(Log.Error, "VALIDATION FAILURE [{}]".format(test_result), error=VerificationError)
         else:
           Log.report(Log.Info, "VALIDATION {} command line: {}".format(
             self.get_name(), test_command
           ))
       elif build_result:
-        Log.report(Log.Error, "build failed: {}".format(build_result))
+        Log.report(Log.Error, "build failed: {}".format(build_result), error=ToolchainError)
 
     elif self.bench_enabled:
-      compiler = self.processor.get_compiler()
-      bench_obj = "./bench_%s.bin" % self.function_name
-      compiler_options = " ".join(self.processor.get_compilation_options())
-      Log.report(Log.Info, "Compiler options: \"{}\"".format(compiler_options))
-      bench_command =  "{compiler} {options} -O2 -DML_DEBUG -I$ML_SRC_DIR/metalibm_core \
-      $ML_SRC_DIR/metalibm_core/support_lib/ml_libm_compatibility.c  \
-      $ML_SRC_DIR/metalibm_core/support_lib/ml_multi_prec_lib.c \
-      {src_file} -o {bench_obj} -lm ".format(compiler = compiler, src_file = self.output_file, bench_obj = bench_obj, options = compiler_options) 
-      bench_command += " && {} ".format(self.processor.get_execution_command(bench_obj))
+      bench_command = self.get_bench_command()
       if self.bench_execute:
         Log.report(Log.Info, "BENCH {}, cmd={}".format(self.get_name, bench_command))
         bench_result = subprocess.call(bench_command, shell = True)
         if not bench_result:
           Log.report(Log.Info, "BENCH FINISHED")
         else:
-          Log.report(Log.Error, "BENCH FAILURE [{}]".format(bench_result))
-          sys.exit(1)
+          Log.report(Log.Error, "BENCH FAILURE [{}]".format(bench_result), error=ToolchainError)
       else:
         Log.report(Log.Info, "BENCH {} command line: {}".format(self.get_name(), bench_command))
 
 
+  ## @return shell command building and executing the performance bench
+  #          generated in self.output_file
+  def get_bench_command(self):
+    compiler = self.processor.get_compiler()
+    bench_obj = "./bench_%s.bin" % self.function_name
+    compiler_options = " ".join(self.processor.get_compilation_options())
+    Log.report(Log.Info, "Compiler options: \"{}\"".format(compiler_options))
+    bench_command =  "{compiler} {options} -O2 -DML_DEBUG -I$ML_SRC_DIR/metalibm_core \
+    $ML_SRC_DIR/metalibm_core/support_lib/ml_libm_compatibility.c  \
+    $ML_SRC_DIR/metalibm_core/support_lib/ml_multi_prec_lib.c \
+    {src_file} -o {bench_obj} -lm ".format(compiler = compiler, src_file = self.output_file, bench_obj = bench_obj, options = compiler_options) 
+    bench_command += " && {} ".format(self.processor.get_execution_command(bench_obj))
+    return bench_command
+
+
   ## externalized an optree: generate a CodeFunction which compute the 
   #  given optree inside a sub-function and returns it as a result
   # @param optree ML_Operation object to be externalized
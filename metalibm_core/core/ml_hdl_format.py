@@ -157,6 +157,38 @@ class ML_StdLogicClass(ML_Format):
 ML_StdLogic = ML_StdLogicClass()
 
 
+## Format class for std.textio file objects
+class HDL_TextFileFormat(ML_Format):
+  """ format of a text file opened in @p mode (std.textio) """
+  def __init__(self, file_name, mode = "read_mode"):
+    ML_Format.__init__(self)
+    self.file_name = file_name
+    self.mode = mode
+    self.name[VHDL_Code] = "text open {mode} is \"{file_name}\"".format(mode = mode, file_name = file_name)
+
+  def __str__(self):
+    return "TextFile({})".format(self.file_name)
+  def get_name(self, language = VHDL_Code):
+    return self.name[language]
+  def get_file_name(self):
+    return self.file_name
+
+## Class of std.textio line (text buffer) format
+class HDL_LineClass(ML_Format):
+  """ class of std.textio line variables """
+  def __init__(self):
+    ML_Format.__init__(self)
+    self.name[VHDL_Code] = "line"
+
+  def __str__(self):
+    return self.name[VHDL_Code]
+  def get_name(self, language = VHDL_Code):
+    return self.name[language]
+
+## std.textio line type singleton
+HDL_Line = HDL_LineClass()
+
+
 ## Helper to build RTL fixed-point formats
 def fixed_point(int_size, frac_size, signed = True, support_format = None):
     """ Generate a fixed-point format """
@@ -289,6 +289,35 @@ class Wait(AbstractOperationConstructor("Wait")):
   def finish_copy(self, new_copy, copy_map = {}):
     new_copy.time_ns = self.time_ns
 
+## Loop executing its body (2nd operand) as long as its condition
+#  (1st operand) is true
+class WhileLoop(AbstractOperationConstructor("WhileLoop")):
+  def get_condition(self):
+    return self.get_input(0)
+  def get_body(self):
+    return self.get_input(1)
+
+## Read the next line of a text file (1st operand) into
+#  a line variable (2nd operand), std.textio's readline
+class ReadLine(AbstractOperationConstructor("ReadLine")):
+  def __init__(self, file_var, line_var, **kw):
+    ReadLine.__base__.__init__(self, file_var, line_var, **kw)
+    self.set_precision(ML_Void)
+
+## Read a value from a line variable (1st operand) into
+#  a variable (2nd operand), std.textio's read
+class ReadValue(AbstractOperationConstructor("ReadValue")):
+  def __init__(self, line_var, value_var, **kw):
+    ReadValue.__base__.__init__(self, line_var, value_var, **kw)
+    self.set_precision(ML_Void)
+
+## Test if the end of a text file has been reached,
+#  std.textio's endfile
+class EndOfFile(AbstractOperationConstructor("EndOfFile", arity = 1)):
+  def __init__(self, file_var, **kw):
+    EndOfFile.__base__.__init__(self, file_var, **kw)
+    self.set_precision(ML_Bool)
+
 ## TypeCast for signal values
 class SignCast(TypeCast):
   name = "SignCast"
@@ -34,7 +34,7 @@ import sys
 
 from sollya import inf, sup
 
-from ..utility.log_report import Log
+from ..utility.log_report import Log, UnsupportedOperationError
 from .ml_operations import *
 from .ml_hdl_operations import *
 from .ml_formats import *
@@ -1081,8 +1081,8 @@ class OptimizationEngine(object):
                     # look for possible simplification
                     if self.has_support_simplification(optree):
                         simplified_tree = self.get_support_simplification(optree)
-                        Log.report(Log.Verbose, "simplifying %s" % optree.get_str(depth = 2, display_precision = True))
-                        Log.report(Log.Verbose, "into %s" % simplified_tree.get_str(depth = 2, display_precision = True))
+                        Log.report(Log.Verbose, lambda: "simplifying %s" % optree.get_str(depth = 2, display_precision = True))
+                        Log.report(Log.Verbose, lambda: "into %s" % simplified_tree.get_str(depth = 2, display_precision = True))
                         optree.change_to(simplified_tree)
                         if self.processor.is_supported_operation(optree):
                             memoization_map[optree] = True
@@ -1092,7 +1092,7 @@ class OptimizationEngine(object):
                     print("pre escalation: ", old_list) # Error print
                     print(self.processor.get_operation_keys(optree)) # Error print
                     print(optree.get_str(display_precision = True, display_id = True, memoization_map = {})) # Error print
-                    Log.report(Log.Error, "unsupported operation\n")
+                    Log.report(Log.Error, "unsupported operation\n", error=UnsupportedOperationError)
         # memoization
         memoization_map[optree] = True
         return True
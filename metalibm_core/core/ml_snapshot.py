@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: versioned serialization of the intermediate representation
+#              (operation graphs, CodeFunction and CodeEntity objects)
+###############################################################################
+
+import importlib
+import pickle
+import sys
+
+import sollya
+
+from metalibm_core.core.ml_operations import AbstractOperation
+from metalibm_core.core.attributes import Attributes
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.version_info import VERSION_NUM
+
+
+## Log level for snapshot reports
+LOG_SNAPSHOT_INFO = Log.LogLevel("Info", "snapshot")
+
+## snapshot format version, must be incremented each time a change in
+#  the I.R classes breaks the loading of previous snapshots
+SNAPSHOT_VERSION = 2
+## magic string identifying snapshot files
+SNAPSHOT_MAGIC = "metalibm-ir-snapshot"
+
+## prefixes of the modules whose globals (formats, rounding modes, debug
+#  objects, ...) are stored by name rather than by value
+GLOBAL_MODULE_PREFIXES = (
+    "metalibm_core", "metalibm_functions", "metalibm_hw_blocks"
+)
+## types always stored by value (immutable or owned by the graph)
+VALUE_TYPES = (
+    type(None), bool, int, float, str, bytes, tuple, list, dict, set,
+    AbstractOperation, Attributes
+)
+
+
+class IRPickler(pickle.Pickler):
+    """ I.R pickler: objects known to @p reference_map are stored by
+        reference (format singletons must remain unique once loaded) and
+        sollya objects as exact hexadecimal strings.
+        @p reference_map must implement get_key(obj), returning the
+        reference key of obj or None if obj must be stored by value,
+        and __getitem__(key) (see IRUnpickler) """
+    def __init__(self, stream, reference_map):
+        pickle.Pickler.__init__(self, stream, pickle.HIGHEST_PROTOCOL)
+        self.reference_map = reference_map
+
+    def persistent_id(self, obj):
+        if isinstance(obj, VALUE_TYPES):
+            return None
+        key = self.reference_map.get_key(obj)
+        if not key is None:
+            return ("ref", key)
+        if isinstance(obj, sollya.SollyaObject):
+            display = sollya.settings.display
+            sollya.settings.display = sollya.hexadecimal
+            try:
+                return ("sollya", str(obj))
+            finally:
+                sollya.settings.display = display
+        return None
+
+
+class IRUnpickler(pickle.Unpickler):
+    """ reverse of IRPickler """
+    def __init__(self, stream, reference_map):
+        pickle.Unpickler.__init__(self, stream)
+        self.reference_map = reference_map
+
+    def persistent_load(self, pid):
+        kind, value = pid
+        if kind == "ref":
+            return self.reference_map[value]
+        elif kind == "sollya":
+            return sollya.parse(value)
+        raise pickle.UnpicklingError("unknown persistent id {}".format(pid))
+
+
+class GlobalNameMap(object):
+    """ module-level objects of the metalibm packages, referenced by
+        (module name, global name). Modules are scanned on the first
+        get_key call (loading only needs module imports) """
+    def __init__(self):
+        self.name_map = None
+
+    def scan_modules(self):
+        self.name_map = {}
+        for module_name in sorted(sys.modules.keys()):
+            module = sys.modules[module_name]
+            if module is None or not module_name.startswith(GLOBAL_MODULE_PREFIXES):
+                continue
+            for global_name, obj in list(vars(module).items()):
+                if isinstance(obj, VALUE_TYPES) or global_name.startswith("__"):
+                    continue
+                # first definition wins (objects re-exported by star imports
+                # are stored under the name of their first module)
+                self.name_map.setdefault(id(obj), (obj, module_name, global_name))
+
+    def get_key(self, obj):
+        """ return the (module name, global name) pair of @p obj, None if
+            obj is not a module-level object """
+        if self.name_map is None:
+            self.scan_modules()
+        global_entry = self.name_map.get(id(obj))
+        if not global_entry is None and global_entry[0] is obj:
+            return global_entry[1], global_entry[2]
+        return None
+
+    def __getitem__(self, key):
+        module_name, global_name = key
+        return getattr(importlib.import_module(module_name), global_name)
+
+
+def get_max_node_index(value):
+    """ return the maximal node index in the graphs of @p value (a graph,
+        a CodeFunction/CodeEntity or a list of those) """
+    max_index = -1
+    processed = set()
+    node_stack = [value]
+    while len(node_stack) > 0:
+        node = node_stack.pop()
+        if isinstance(node, (list, tuple)):
+            node_stack.extend(node)
+            continue
+        if hasattr(node, "get_scheme"):
+            node = node.get_scheme()
+        if not isinstance(node, AbstractOperation) or id(node) in processed:
+            continue
+        processed.add(id(node))
+        max_index = max(max_index, node.index)
+        node_stack.extend(node.get_inputs())
+    return max_index
+
+
+def save_snapshot(filename, value, kind, **metadata):
+    """ save @p value (operation graph, CodeFunction, CodeEntity, or list
+        of those) in snapshot file @p filename
+
+        Args:
+            kind (str): snapshot kind (e.g. "function", "entity"), checked
+                when loading
+            metadata: extra picklable information stored with value
+    """
+    header = {
+        "magic": SNAPSHOT_MAGIC,
+        "version": SNAPSHOT_VERSION,
+        "metalibm_version": VERSION_NUM,
+        "kind": kind,
+    }
+    Log.report(LOG_SNAPSHOT_INFO, "saving {} snapshot in {}".format(kind, filename))
+    with open(filename, "wb") as snapshot_stream:
+        pickle.dump(header, snapshot_stream, pickle.HIGHEST_PROTOCOL)
+        IRPickler(snapshot_stream, GlobalNameMap()).dump((value, metadata))
+
+
+def load_snapshot(filename, kind=None):
+    """ load a snapshot saved by save_snapshot, node index allocation is
+        advanced beyond the loaded nodes
+
+        Args:
+            kind (str): expected snapshot kind (None to accept any)
+
+        Returns:
+            tuple: (value, metadata dict)
+    """
+    Log.report(LOG_SNAPSHOT_INFO, "loading snapshot {}".format(filename))
+    with open(filename, "rb") as snapshot_stream:
+        try:
+            header = pickle.load(snapshot_stream)
+        except Exception:
+            header = None
+        if not isinstance(header, dict) or header.get("magic") != SNAPSHOT_MAGIC:
+            Log.report(Log.Error, "{} is not a metalibm snapshot".format(filename))
+        if header["version"] != SNAPSHOT_VERSION:
+            Log.report(
+                Log.Error,
+                "snapshot {} has version {} (metalibm {}), expected version {}".format(
+                    filename, header["version"], header["metalibm_version"], SNAPSHOT_VERSION))
+        if not kind is None and header["kind"] != kind:
+            Log.report(Log.Error, "snapshot {} contains a {}, expected a {}".format(
+                filename, header["kind"], kind))
+        value, metadata = IRUnpickler(snapshot_stream, GlobalNameMap()).load()
+    AbstractOperation.global_index = max(AbstractOperation.global_index, get_max_node_index(value) + 1)
+    return value, metadata
@@ -134,6 +134,13 @@ class ML_Table(ML_LeafNode):
     def get_precision(self):
         return self.get_storage_precision()
 
+    ## return the memory footprint of the table (in bytes)
+    def get_byte_size(self):
+        num_elements = 1
+        for dim in self.dimensions:
+            num_elements *= dim
+        return num_elements * self.get_storage_precision().get_bit_size() // 8
+
     def get_tag(self):
         return self.attributes.get_tag()
 
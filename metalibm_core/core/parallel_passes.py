@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: execution of an optimization pass over independent
+#              graphs (entities, functions) in forked worker processes
+###############################################################################
+
+import io
+import multiprocessing
+import sys
+
+import sollya
+
+from metalibm_core.core.ml_operations import AbstractOperation
+from metalibm_core.core.ml_snapshot import IRPickler, IRUnpickler, VALUE_TYPES
+from metalibm_core.core.passes import get_pass_name
+from metalibm_core.utility.log_report import Log
+
+
+## Log level for parallel pass execution reports
+LOG_PARALLEL_PASS = Log.LogLevel("Info", "parallel_passes")
+
+## prefixes of the modules whose globals (formats, rounding modes,
+#  debug objects ...) are always exchanged by reference
+REFERENCE_MODULE_PREFIXES = (
+    "sollya", "metalibm_core", "metalibm_functions", "metalibm_hw_blocks"
+)
+## node attributes which store immutable values shared between graphs
+REFERENCE_ATTRIBUTES = (
+    "precision", "interval", "debug", "rounding_mode", "max_abs_error"
+)
+
+## state inherited by worker processes through fork
+#  (see parallel_execute_pass)
+_WORKER_STATE = None
+
+
+def iterate_nodes(optree):
+    """ iterate over the distinct nodes of graph @p optree """
+    processed = set()
+    node_stack = [optree]
+    while len(node_stack) > 0:
+        node = node_stack.pop()
+        if node is None or id(node) in processed:
+            continue
+        processed.add(id(node))
+        yield node
+        if isinstance(node, AbstractOperation):
+            node_stack.extend(reversed(node.get_inputs()))
+
+
+def get_value_state(value):
+    """ return the part of a pass value replaced by a graph-rebuilding
+        pass: the scheme and argument list of a CodeFunction/CodeEntity,
+        or the value itself if it is an operation graph """
+    if hasattr(value, "get_scheme"):
+        return value.get_scheme(), value.arg_list
+    return value
+
+
+def set_value_state(value, state):
+    """ reverse of get_value_state, return the updated value """
+    if hasattr(value, "get_scheme"):
+        scheme, arg_list = state
+        value.set_scheme(scheme)
+        value.set_arg_list(arg_list)
+        return value
+    return state
+
+
+class ReferenceMap(object):
+    """ objects existing before the workers are forked, which are not
+        modified by passes and are thus exchanged by reference (the
+        object identifier being the same in parent and workers) """
+    def __init__(self, value_list):
+        self.object_map = {}
+        for module_name in list(sys.modules.keys()):
+            if module_name.startswith(REFERENCE_MODULE_PREFIXES):
+                module = sys.modules[module_name]
+                for obj in list(vars(module).values()) if not module is None else []:
+                    self.add(obj)
+        for value in value_list:
+            self.add(value)
+            root = value.get_scheme() if hasattr(value, "get_scheme") else value
+            for node in iterate_nodes(root):
+                self.add_node_references(node)
+
+    def add(self, obj):
+        if not isinstance(obj, VALUE_TYPES):
+            self.object_map[id(obj)] = obj
+
+    def add_node_references(self, node):
+        for attr_name in REFERENCE_ATTRIBUTES:
+            self.add(getattr(node.attributes, attr_name, None))
+        for attr_value in vars(node).values():
+            if isinstance(attr_value, sollya.SollyaObject):
+                self.add(attr_value)
+            # generator of component instance / function call
+            self.add(getattr(attr_value, "generator_object", None))
+
+    def get_key(self, obj):
+        """ return the reference key of @p obj, None if obj must be
+            exchanged by value """
+        key = id(obj)
+        return key if self.object_map.get(key) is obj else None
+
+    def __getitem__(self, key):
+        return self.object_map[key]
+
+
+def execute_pass_worker(value_index):
+    """ worker process: execute the pass on a single value and return
+        the serialized result, or None if the execution or the
+        serialization failed (the value is then processed by the parent
+        process). Only passes which rebuild their graph send a graph
+        back, the parent graph of an in-place (check) pass is left
+        untouched """
+    scheduler, pass_object, value_list, execution_function, reference_map = _WORKER_STATE
+    try:
+        value = value_list[value_index]
+        result = execution_function(scheduler, pass_object, [value])[0]
+        if not pass_object.rebuild_graph:
+            payload = ("unchanged", None)
+        elif result is value:
+            payload = ("state", get_value_state(value))
+        else:
+            payload = ("value", result)
+        stream = io.BytesIO()
+        IRPickler(stream, reference_map).dump((payload, AbstractOperation.global_index))
+        return stream.getvalue()
+    except (Exception, SystemExit):
+        # an ML_Error (Log.Error) or a SystemExit must not terminate
+        # the pool worker
+        return None
+
+
+def renumber_new_nodes(root, first_new_index):
+    """ allocate fresh (parent) indexes to the nodes of @p root created
+        by a worker, in a deterministic traversal order """
+    for node in iterate_nodes(root):
+        if isinstance(node, AbstractOperation) and node.index >= first_new_index:
+            node.index = AbstractOperation.global_index
+            AbstractOperation.global_index += 1
+
+
+def parallel_execute_pass(scheduler, pass_object, value_list, execution_function, jobs):
+    """ execute @p pass_object over each value of @p value_list (graphs,
+        CodeFunction or CodeEntity objects) in up to @p jobs forked
+        processes. Each worker runs execution_function on a single value;
+        a graph-rebuilding pass (rebuild_graph) sends back the resulting
+        graph, results being merged in value list order, an in-place pass
+        only reports its success and the values are kept as is (values whose result can not be exchanged are
+        processed sequentially in the parent process)
+
+        Returns:
+            list: values produced by the pass
+    """
+    global _WORKER_STATE
+    if jobs <= 1 or len(value_list) <= 1 or not "fork" in multiprocessing.get_all_start_methods():
+        return execution_function(scheduler, pass_object, value_list)
+    reference_map = ReferenceMap(value_list)
+    first_new_index = AbstractOperation.global_index
+    Log.report(LOG_PARALLEL_PASS, "executing pass {} over {} values with {} processes".format(
+        get_pass_name(pass_object), len(value_list), jobs))
+    _WORKER_STATE = scheduler, pass_object, value_list, execution_function, reference_map
+    try:
+        with multiprocessing.get_context("fork").Pool(min(jobs, len(value_list))) as pool:
+            serialized_list = pool.map(execute_pass_worker, range(len(value_list)))
+    finally:
+        _WORKER_STATE = None
+
+    result_list = []
+    max_worker_index = first_new_index
+    for value, serialized in zip(value_list, serialized_list):
+        if serialized is None:
+            Log.report(LOG_PARALLEL_PASS, "falling back to sequential execution of {}".format(get_pass_name(pass_object)))
+            result_list.append(execution_function(scheduler, pass_object, [value])[0])
+            continue
+        (kind, payload), worker_index = IRUnpickler(io.BytesIO(serialized), reference_map).load()
+        if kind == "unchanged":
+            # worker nodes are discarded, no index to reserve
+            result_list.append(value)
+            continue
+        max_worker_index = max(max_worker_index, worker_index)
+        result_list.append(set_value_state(value, payload) if kind == "state" else payload)
+    if not pass_object.rebuild_graph:
+        return result_list
+    # worker node indexes may overlap: new nodes are renumbered
+    # after every node index allocated by a worker
+    AbstractOperation.global_index = max(AbstractOperation.global_index, max_worker_index)
+    for result in result_list:
+        renumber_new_nodes(result.get_scheme() if hasattr(result, "get_scheme") else result, first_new_index)
+    return result_list
@@ -26,7 +26,9 @@
 ###############################################################################
 
 import sys
-from metalibm_core.utility.log_report import Log
+import importlib
+from metalibm_core.utility.log_report import Log, VerificationError
+from metalibm_core.utility.pass_profiler import PassProfiler
 
 """ custom warning log level for pass management """
 LOG_PASS_INFO = Log.LogLevel("Info", "passes")
@@ -89,7 +91,61 @@ class PassWrapper:
 
 ## default execution pass function
 def default_execute_pass(pass_scheduler, pass_object, inputs):
-  return [pass_object.execute(pass_input) for pass_input in inputs]
+  return [pass_object.apply_on_graph(pass_input) for pass_input in inputs]
+
+## @return name used to report @p pass_object execution
+def get_pass_name(pass_object):
+  return pass_object.pass_tag or pass_object.__class__.__name__
+
+## @return the list of operation graphs of @p values: pass scheduler
+#          values are either graphs or objects with a get_scheme method
+#          (CodeFunction, CodeEntity)
+def get_graph_list(values):
+  return [value.get_scheme() if hasattr(value, "get_scheme") else value for value in values]
+
+## iterate over the distinct nodes of graph @p optree
+def iterate_graph_nodes(optree):
+  processed = set()
+  node_stack = [optree]
+  while len(node_stack) > 0:
+    node = node_stack.pop()
+    if id(node) in processed:
+      continue
+    processed.add(id(node))
+    yield node
+    if hasattr(node, "get_inputs"):
+      node_stack.extend(node.get_inputs())
+
+## graph invariant: every operation input is defined
+#  @return list of error messages (empty if the invariant holds)
+def check_defined_inputs(optree):
+  return [
+    "undefined input(s) for node {}".format(node.get_str(depth = 2, display_precision = True))
+    for node in iterate_graph_nodes(optree)
+    if hasattr(node, "get_inputs") and None in node.get_inputs()
+  ]
+
+## graph invariant: the operation graph is acyclic
+#  @return list of error messages (empty if the invariant holds)
+def check_acyclic_graph(optree):
+  # iterative depth-first search, node state: 1 open, 2 closed
+  node_state = {}
+  node_stack = [(optree, False)]
+  while len(node_stack) > 0:
+    node, closing = node_stack.pop()
+    if closing:
+      node_state[id(node)] = 2
+      continue
+    state = node_state.get(id(node))
+    if state == 2:
+      continue
+    elif state == 1:
+      return ["cycle detected through node {}".format(node.get_str(depth = 2))]
+    node_state[id(node)] = 1
+    node_stack.append((node, True))
+    if hasattr(node, "get_inputs"):
+      node_stack.extend((op, False) for op in node.get_inputs() if not op is None and node_state.get(id(op)) != 2)
+  return []
 
 class PassScheduler:
   class Start: 
@@ -113,7 +169,18 @@ class PassScheduler:
       PassScheduler.AfterPipelining.tag: PassScheduler.AfterPipelining,
     }[tag]
 
-  def __init__(self):
+  ## @param profiler PassProfiler instance measuring pass executions
+  #         (None disables profiling)
+  #  @param verify enable graph invariant verification after each pass
+  #  @param jobs maximal number of processes used to execute a
+  #         parallel-safe pass over the independent slot values
+  def __init__(self, profiler = None, verify = False, jobs = 1):
+    self.profiler = PassProfiler(enabled = False) if profiler is None else profiler
+    self.verify = verify
+    self.jobs = jobs
+    ## list of graph invariant checks, each check takes an operation graph
+    #  and returns the list of violation messages
+    self.verification_hooks = [check_defined_inputs, check_acyclic_graph]
     self.pass_map = {
       None: [], # should remain empty
       PassScheduler.Start: [],
@@ -138,6 +205,23 @@ class PassScheduler:
   def get_executed_passes(self):
     return self.executed_passes
 
+  ## register a new graph invariant check, executed after each pass
+  #  when verification is enabled
+  #  @param hook function (optree -> list of error messages)
+  def add_verification_hook(self, hook):
+    self.verification_hooks.append(hook)
+
+  ## check every registered invariant on the graphs of @p values
+  #  as produced by @p pass_object
+  def verify_pass_result(self, pass_object, values):
+    for graph in get_graph_list(values):
+      for hook in self.verification_hooks:
+        error_list = hook(graph)
+        if len(error_list) > 0:
+          Log.report(Log.Error, "invariant {} violated after pass {}:\n{}".format(
+            hook.__name__, get_pass_name(pass_object), "\n".join(error_list)),
+            error=VerificationError)
+
   def get_rdy_pass_list(self):
     annotated_list = [(pass_wrapper, pass_wrapper.get_dependency().is_dep_resolved(self)) for pass_wrapper in self.waiting_pass_wrappers ]
     self.ready_passes += [pass_wrapper.get_pass_object() for (pass_wrapper, rdy_flag) in annotated_list if rdy_flag]
@@ -153,17 +237,30 @@ class PassScheduler:
     self.waiting_pass_wrappers += self.pass_map[pass_slot]
     self.pass_map[pass_slot] = []
 
-  ## @param pass_slot, add all remaining passes supposed to 
-  #  start after pass_slot to the waiting list
-  #  than update the ready passe list and execute ready passes
-  #  each updating @p pass_input in turn
-  #  the final result is returned
+  ## execute each pass of @p pass_list in turn, the values produced
+  #  by a pass are the inputs of the next one
+  #  @param inputs values processed by the first pass
+  #  @param execution_function (scheduler, pass, values) -> new values
+  #  @return the values produced by the last pass
   def execute_pass_list(self, pass_list, inputs, execution_function):
     inter_values = inputs
     for pass_object in pass_list:
-      inter_values = execution_function(self, pass_object, inputs)
+      with self.profiler.profile(get_pass_name(pass_object), "pass", inter_values) as section:
+        inter_values = self.execute_pass(pass_object, inter_values, execution_function)
+        section.set_outputs(inter_values)
+      if self.verify:
+        self.verify_pass_result(pass_object, inter_values)
     return inter_values
 
+  ## execute @p pass_object over @p values, in several processes
+  #  if the pass is parallel-safe and multiple jobs are allowed
+  def execute_pass(self, pass_object, values, execution_function):
+    if self.jobs > 1 and pass_object.parallel_safe and len(values) > 1:
+      # imported on demand: requires operation graph support
+      from metalibm_core.core.parallel_passes import parallel_execute_pass
+      return parallel_execute_pass(self, pass_object, values, execution_function, self.jobs)
+    return execution_function(self, pass_object, values)
+
   def flush_rdy_pass_list(self):
     ready_passes = self.ready_passes
     self.ready_passes = []
@@ -199,6 +296,9 @@ class Pass:
   pass_tag = None
   ## map of all registered pass
   pass_map = {}
+  ## map pass tag -> module defining the pass, modules are only
+  #  imported when the pass is requested
+  lazy_pass_map = {}
   pass_id_iterator = -1
 
   @staticmethod
@@ -228,17 +328,38 @@ class Pass:
   #  @return[Pass] pass object 
   @staticmethod
   def get_pass_by_tag(tag):
+    if not tag in Pass.pass_map and tag in Pass.lazy_pass_map:
+      Log.report(LOG_PASS_INFO, "loading module {} for pass {}".format(Pass.lazy_pass_map[tag], tag))
+      importlib.import_module(Pass.lazy_pass_map[tag])
     return Pass.pass_map[tag]
 
-  ## return the list of tags of registered passes
+  ## declare that importing module @p module_name registers
+  #  the pass associated with @p tag
+  @staticmethod
+  def register_lazy(tag, module_name):
+    if not tag in Pass.pass_map:
+      Pass.lazy_pass_map[tag] = module_name
+
+  ## return the list of tags of registered (or declared) passes
   @staticmethod
   def get_pass_tag_list():
-    return [tag for tag in Pass.pass_map]
+    return [tag for tag in Pass.pass_map] + [tag for tag in Pass.lazy_pass_map if not tag in Pass.pass_map]
 
 
 ## Abstract parent to optimization pass
 class OptimizationPass(Pass):
   """ Virtual parent to all optjmization pass """
+  ## pass contract: True if execute returns a (possibly) new graph which
+  #  replaces its input, False if execute modifies its input in place (its
+  #  result, e.g. a check status, is then not part of the dataflow)
+  rebuild_graph = False
+  ## True if executions of the pass on independent graphs can be
+  #  distributed across processes: the pass object state must not
+  #  be required after the execution, and an in-place pass
+  #  (rebuild_graph False) must not modify its input (only its success
+  #  is reported back)
+  parallel_safe = False
+
   def __init__(self, descriptor = ""):
     Pass.__init__(self)
     self.descriptor = descriptor
@@ -248,6 +369,12 @@ class OptimizationPass(Pass):
   def get_descriptor(self):
     return self.descriptor
 
+  ## execute @p self on graph @p optree
+  #  @return the graph to be processed by the following passes
+  def apply_on_graph(self, optree):
+    result = self.execute(optree)
+    return result if self.rebuild_graph else optree
+
 
 ## Operation tree Optimization pass
 class OptreeOptimization(OptimizationPass):
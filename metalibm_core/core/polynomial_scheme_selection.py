@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: latency-driven selection of polynomial evaluation scheme
+###############################################################################
+
+from sollya import sup
+
+from .ml_operations import (
+    ML_ArithmeticOperation, ML_LeafNode,
+    Addition, Multiplication, Subtraction
+)
+from .polynomials import PolynomialSchemeEvaluator, is_cgpe_available
+from ..code_generation.code_constant import C_Code
+from ..utility.log_report import Log
+
+## Log level used to report scheme selection decisions
+LOG_POLY_SCHEME = Log.LogLevel("Info", "poly_scheme")
+
+
+class LatencyEvaluator(object):
+    """ Critical path latency estimator for an operation graph.
+        The latency of each operation is extracted from the
+        speed_measure of its implementation on the target """
+    ## default latency for operations whose implementation can
+    #  not be determined (e.g. un-instantiated precision)
+    default_latency = {
+        Addition: 1.0,
+        Subtraction: 1.0,
+        Multiplication: 2.0,
+    }
+    def __init__(self, target, language=C_Code):
+        self.target = target
+        ## dictionnary storing pair (optree, latency) of already
+        #  evaluated nodes
+        self.latency_map = {}
+        self.language = language
+
+    def get_operation_latency(self, optree):
+        """ return the latency of the single operation @p optree
+            (inputs excluded) """
+        if not optree.get_precision() is None and \
+           self.target.is_supported_operation(optree, language=self.language):
+            optree_impl = self.target.get_recursive_implementation(
+                optree, language=self.language)
+            return optree_impl.get_speed_measure()
+        return self.default_latency.get(optree.__class__, 1.0)
+
+    ## Evaluate the critical path latency of
+    #  the evaluation of @p optree
+    def evaluate(self, optree):
+        if optree in self.latency_map:
+            return self.latency_map[optree]
+        elif isinstance(optree, ML_LeafNode):
+            return 0.0
+        else:
+            inputs_latency = max(
+                [self.evaluate(inp) for inp in optree.get_inputs()] + [0.0]
+            )
+            if isinstance(optree, ML_ArithmeticOperation):
+                latency = self.get_operation_latency(optree) + inputs_latency
+            else:
+                latency = inputs_latency
+            self.latency_map[optree] = latency
+            return latency
+
+
+def count_arithmetic_operations(optree, memoization_set=None):
+    """ return the number of distinct arithmetic operation nodes in the graph
+        of @p optree """
+    memoization_set = set() if memoization_set is None else memoization_set
+    if optree in memoization_set or isinstance(optree, ML_LeafNode):
+        return 0
+    memoization_set.add(optree)
+    local_count = 1 if isinstance(optree, ML_ArithmeticOperation) else 0
+    return local_count + sum(
+        count_arithmetic_operations(op, memoization_set) for op in optree.get_inputs()
+    )
+
+
+class PolynomialSchemeCandidate(object):
+    """ Candidate evaluation scheme for a polynomial """
+    def __init__(self, name, scheme, latency, op_count):
+        self.name = name
+        self.scheme = scheme
+        self.latency = latency
+        self.op_count = op_count
+        ## evaluation error, only computed if required
+        self.eval_error = None
+
+    def __str__(self):
+        return "{}(latency={}, op_count={}, eval_error={})".format(
+            self.name, self.latency, self.op_count, self.eval_error)
+
+
+class PolynomialSchemeSelector(object):
+    """ Automatic selection of the polynomial evaluation scheme with
+        the lowest latency on a given target which verifies an evaluation
+        error constraint """
+    def __init__(self, target, language=C_Code, scheme_optimizer=None,
+                 mixed_leaf_sizes=(2, 3)):
+        """
+            Args:
+                target: backend used to estimate operation latencies
+                language: code generation language
+                scheme_optimizer: callable applied to each candidate before
+                                  latency evaluation (e.g. FMA fusion),
+                                  it must not modify its argument in place
+                mixed_leaf_sizes: list of Horner leaf sizes used to build
+                                  mixed Estrin/Horner candidates
+        """
+        self.target = target
+        self.language = language
+        self.scheme_optimizer = scheme_optimizer
+        self.mixed_leaf_sizes = mixed_leaf_sizes
+
+    def get_scheme_builders(self):
+        """ return the list of (name, builder) of candidate schemes,
+            builder being a function (polynomial_object, variable,
+            unified_precision) -> ML_Operation """
+        builder_list = [
+            ("horner", lambda p, v, prec: PolynomialSchemeEvaluator.generate_horner_scheme(p, v, prec)),
+            ("horner2", lambda p, v, prec: PolynomialSchemeEvaluator.generate_horner2_scheme(p, v, prec)),
+            ("estrin", lambda p, v, prec: PolynomialSchemeEvaluator.generate_estrin_scheme(p, v, prec)),
+        ]
+        for leaf_size in self.mixed_leaf_sizes:
+            builder_list.append((
+                "mixed_{}".format(leaf_size),
+                lambda p, v, prec, leaf_size=leaf_size:
+                    PolynomialSchemeEvaluator.generate_mixed_scheme(p, v, prec, leaf_size=leaf_size)
+            ))
+        if is_cgpe_available():
+            builder_list.append(
+                ("cgpe", lambda p, v, prec: PolynomialSchemeEvaluator.generate_cgpe_scheme(p, v, prec))
+            )
+        return builder_list
+
+    def evaluate_scheme_cost(self, scheme):
+        """ return the pair (latency, operation count) of scheme """
+        cost_scheme = scheme if self.scheme_optimizer is None else self.scheme_optimizer(scheme)
+        latency = LatencyEvaluator(self.target, self.language).evaluate(cost_scheme)
+        op_count = count_arithmetic_operations(cost_scheme)
+        return latency, op_count
+
+    def generate_candidate_list(self, polynomial_object, variable, unified_precision):
+        """ build every candidate scheme and return the list of
+            PolynomialSchemeCandidate sorted by increasing latency (then
+            increasing operation count) """
+        candidate_list = []
+        for name, builder in self.get_scheme_builders():
+            scheme = builder(polynomial_object, variable, unified_precision)
+            if scheme is None:
+                continue
+            latency, op_count = self.evaluate_scheme_cost(scheme)
+            candidate = PolynomialSchemeCandidate(name, scheme, latency, op_count)
+            Log.report(LOG_POLY_SCHEME, "candidate scheme: {}".format(candidate))
+            candidate_list.append(candidate)
+        candidate_list.sort(key=lambda c: (c.latency, c.op_count))
+        return candidate_list
+
+    def select_candidate(self, polynomial_object, variable, unified_precision,
+                         eval_error_function=None, error_bound=None):
+        """ select the fastest candidate scheme whose evaluation error
+            (as computed by eval_error_function, e.g. with Gappa) is
+            less than or equal to error_bound.
+            If no error function is provided, the fastest scheme is
+            returned. If no scheme satisfies the constraint the most
+            accurate one is returned. """
+        candidate_list = self.generate_candidate_list(
+            polynomial_object, variable, unified_precision)
+        if eval_error_function is None or error_bound is None:
+            return candidate_list[0]
+        for candidate in candidate_list:
+            candidate.eval_error = sup(abs(eval_error_function(candidate.scheme)))
+            Log.report(LOG_POLY_SCHEME, "candidate scheme: {}".format(candidate))
+            if candidate.eval_error <= error_bound:
+                return candidate
+        Log.report(
+            Log.Warning,
+            "no polynomial scheme meets the error bound {}, selecting most accurate".format(error_bound))
+        return min(candidate_list, key=lambda c: c.eval_error)
+
+    def select_scheme(self, polynomial_object, variable, unified_precision,
+                      eval_error_function=None, error_bound=None):
+        """ return the evaluation scheme (ML_Operation) of the selected
+            candidate (see select_candidate) """
+        candidate = self.select_candidate(
+            polynomial_object, variable, unified_precision,
+            eval_error_function, error_bound)
+        Log.report(LOG_POLY_SCHEME, "selected scheme: {}".format(candidate))
+        return candidate.scheme
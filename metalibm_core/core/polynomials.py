@@ -31,10 +31,12 @@
 # author(s): Nicolas Brunie (nicolas.brunie@kalray.eu)
 ###############################################################################
 
+import collections
+
 import sollya
 
-from sollya import S2, SollyaObject, coeff
-from ..utility.log_report import Log
+from sollya import S2, SollyaObject, coeff, sup
+from ..utility.log_report import Log, ApproximationError
 
 
 def is_cst_with_value(coeff, value):
@@ -63,17 +65,62 @@ except ImportError:
   cpge_available = False
   Log.report(Log.Warning, "CPGE import failed")
 
-from .ml_operations import Constant, Variable, Multiplication, Addition, Subtraction
-from .ml_formats import ML_Format, ML_FP_Format, ML_Fixed_Format
+from .ml_operations import (
+    Constant, Variable, Multiplication, Addition, Subtraction, Conversion
+)
+from .ml_formats import (
+    ML_Format, ML_FP_Format, ML_Fixed_Format, ML_Compound_Format
+)
 
 
 def is_cgpe_available():
   return cpge_available
 
-class SollyaError(Exception):
+def get_precision_bits(precision):
+    """ return the number of significand bits of the floating-point (possibly
+        compound, e.g. ML_DoubleDouble) format precision """
+    if isinstance(precision, ML_Compound_Format):
+        return sum(field_format.get_mantissa_size() for field_format in precision.field_format_list)
+    return precision.get_mantissa_size()
+
+class SollyaError(ApproximationError):
     """ Exception to indicate an error in pythonsollya """
     pass
 
+## cache of fpminimax results, indexed by the exact (hexadecimal) display
+#  of the approximation parameters and of the sollya settings they depend
+#  on. It lives as long as the process, so it is kept warm across
+#  generations by the generation server; the least recently used entries
+#  are evicted beyond FPMINIMAX_CACHE_SIZE entries
+FPMINIMAX_CACHE = collections.OrderedDict()
+FPMINIMAX_CACHE_SIZE = 4096
+
+def get_sollya_key(value):
+    """ return an exact string key for @p value (sollya object, number or
+        list/tuple of such values) """
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(get_sollya_key(v) for v in value) + "]"
+    return str(value)
+
+def cached_fpminimax(function, poly_degree, precision_list, approx_interval, *modifiers):
+    """ memoized version of sollya.fpminimax """
+    display = sollya.settings.display
+    sollya.settings.display = sollya.hexadecimal
+    key = get_sollya_key(
+        (function, poly_degree, precision_list, approx_interval, modifiers,
+         sollya.settings.prec, sollya.settings.points))
+    sollya.settings.display = display
+    if key in FPMINIMAX_CACHE:
+        # re-inserted as most recently used
+        result = FPMINIMAX_CACHE.pop(key)
+    else:
+        result = sollya.fpminimax(
+            function, poly_degree, precision_list, approx_interval, *modifiers)
+    FPMINIMAX_CACHE[key] = result
+    while len(FPMINIMAX_CACHE) > FPMINIMAX_CACHE_SIZE:
+        FPMINIMAX_CACHE.popitem(last=False)
+    return result
+
 class Polynomial(object):
     """ Mathematical polynomial object class """
 
@@ -185,7 +232,7 @@ class Polynomial(object):
           else:
             precision_list.append(c)
 
-        sollya_poly = sollya.fpminimax(function, poly_degree, precision_list,
+        sollya_poly = cached_fpminimax(function, poly_degree, precision_list,
                                        approx_interval, *modifiers)
         while sollya_poly.is_error() and sollya.settings.points < 10000:
             # We don't want sollya.settings.points to be too large. A value <
@@ -199,7 +246,7 @@ class Polynomial(object):
             Log.report(Log.Warning,
                        "Trying with more points: {}"
                        .format(sollya.settings.points))
-            sollya_poly = sollya.fpminimax(function, poly_degree,
+            sollya_poly = cached_fpminimax(function, poly_degree,
                                            precision_list, approx_interval,
                                            *modifiers)
 
@@ -245,7 +292,7 @@ class Polynomial(object):
                 precision_list.append(c.get_sollya_object())
             else:
                 precision_list.append(c)
-        sollya_poly = sollya.fpminimax(function, poly_degree, precision_list, approx_interval, *modifiers)
+        sollya_poly = cached_fpminimax(function, poly_degree, precision_list, approx_interval, *modifiers)
         if sollya_poly.is_error():
             print("function: {}, poly_degree: {}, precision_list: {}, approx_interval: {}, modifiers: {}".format(function, poly_degree, precision_list, approx_interval, modifiers))
             raise SollyaError()
@@ -367,15 +414,79 @@ class PolynomialSchemeEvaluator(object):
 
         return current_scheme
 
+    @staticmethod
+    def get_adaptative_horner_split(coeff_list, approx_interval,
+                                    error_constraint, start_precision):
+        """ Determine how many coefficients of coeff_list (list of
+            (index, coeff) pairs in decreasing index order) can be
+            evaluated in start_precision while the accumulated evaluation
+            error stays below error_constraint.
+
+            The rounding error of the Horner step i (one multiplication and
+            one addition) is bounded by 2 * 2^-p * |P_i(x)|, where P_i is the
+            partial polynomial evaluated so far, and is scaled by |x|^i in
+            the final result """
+        max_x = sup(abs(approx_interval))
+        unit_roundoff = S2**-get_precision_bits(start_precision)
+        partial_bound = abs(coeff_list[0][1])
+        current_index = coeff_list[0][0]
+        acc_error = 0
+        split_step = 1
+        for index, coeff in coeff_list[1:]:
+            partial_bound = abs(coeff) + max_x**(current_index - index) * partial_bound
+            acc_error += 2 * unit_roundoff * partial_bound * max_x**index
+            if acc_error > error_constraint:
+                break
+            current_index = index
+            split_step += 1
+        return split_step
+
+    @staticmethod
+    def generate_adaptative_horner_scheme2(coeff_list, variable, split_step,
+            out_precision, start_precision, power_map_=None):
+        """ generate a Horner evaluation scheme for the list of pairs
+            (index, coeff) <coeff_list> (decreasing index order), the
+            <split_step> first coefficients (highest degrees) are evaluated
+            in <start_precision>, the remaining ones in <out_precision> """
+        power_map = power_map_ if power_map_ != None else {}
+        def get_step_precision(step):
+            return start_precision if step < split_step else out_precision
+
+        current_index, coeff = coeff_list[0]
+        current_scheme = Constant(coeff, precision=get_step_precision(0), tag="c_{}".format(current_index))
+        for step, (index, coeff) in enumerate(coeff_list[1:], 1):
+            step_precision = get_step_precision(step)
+            diff_power = generate_power(variable, current_index - index, power_map, precision=start_precision)
+            mult_op = Multiplication(diff_power, current_scheme, precision=step_precision, tag="pm_%d" % index)
+            current_scheme = Addition(
+                Constant(coeff, precision=step_precision, tag="c_{}".format(index)),
+                mult_op, precision=step_precision, tag="pa_%d" % index)
+            current_index = index
+
+        if current_index > 0:
+            last_power = generate_power(variable, current_index, power_map, precision=start_precision)
+            current_scheme = Multiplication(last_power, current_scheme, precision=out_precision)
+        elif current_scheme.get_precision() != out_precision:
+            current_scheme = Conversion(current_scheme, precision=out_precision)
+        return current_scheme
+
     @staticmethod
     def generate_adaptative_horner_scheme(poly_object, variable,
             error_constraint,
             out_precision=None,
             start_precision=None,
-            approx_interval=None):
+            approx_interval=None,
+            eval_error_function=None):
         """ Generate a horner evaluation scheme for poly_object
             which enforces the error_constraint : the overall evaluation
-            error must be less than error_constraint"""
+            error must be less than error_constraint.
+
+            Higher degree monomials are evaluated in start_precision (e.g.
+            ML_Binary64) and lower degree ones in out_precision (e.g.
+            ML_DoubleDouble). The precision switch is first determined by a
+            static error bound, if eval_error_function (scheme -> error, e.g.
+            a Gappa evaluation) is provided, the switch is moved towards
+            higher degrees until the evaluation error meets error_constraint """
         # setting output precision
         out_precision = out_precision or variable.get_precision()
         # setting start precision (higher degree monomial)
@@ -384,10 +495,26 @@ class PolynomialSchemeEvaluator(object):
         approx_interval = approx_interval or variable.get_interval()
         # coefficients in reverse order
         coeff_list = poly_object.get_ordered_coeff_list()[::-1]
-        # initial approx
-        highest_coeff = coeff_list.pop(0)
-        initial_error_constraint = error_constraint
-        raise NotImplementedError
+
+        split_step = PolynomialSchemeEvaluator.get_adaptative_horner_split(
+            coeff_list, approx_interval, error_constraint, start_precision)
+        while True:
+            Log.report(
+                Log.Verbose,
+                "adaptative horner: {}/{} coefficient(s) evaluated in {}".format(
+                    split_step, len(coeff_list), start_precision))
+            scheme = PolynomialSchemeEvaluator.generate_adaptative_horner_scheme2(
+                coeff_list, variable, split_step, out_precision, start_precision)
+            if eval_error_function is None or split_step == 0:
+                return scheme
+            eval_error = sup(abs(eval_error_function(scheme)))
+            if eval_error <= error_constraint:
+                return scheme
+            Log.report(
+                Log.Verbose,
+                "adaptative horner: eval error {} exceeds {}".format(
+                    eval_error, error_constraint))
+            split_step -= 1
 
 
     @staticmethod
@@ -415,6 +542,70 @@ class PolynomialSchemeEvaluator(object):
             offset_degree_monomial = generate_power(variable, offset_degree, power_map, unified_precision)
             return Addition(lo_node, Multiplication(offset_degree_monomial, hi_node, precision = unified_precision), precision = unified_precision)
 
+    @staticmethod
+    def generate_horner2_scheme(polynomial_object, variable,
+            unified_precision=None, power_map_=None):
+        """ generate a second-order Horner evaluation scheme:
+            P(x) = P_even(x^2) + x * P_odd(x^2), where P_even and P_odd
+            are both evaluated with a Horner scheme on x^2. The two
+            sub-schemes are independent, which halves the dependency chain
+            length compared to the standard Horner scheme """
+        power_map = power_map_ if power_map_ != None else {}
+        even_coeff_map = {}
+        odd_coeff_map = {}
+        for index, coeff_value in polynomial_object.get_ordered_coeff_list():
+            if index % 2 == 0:
+                even_coeff_map[index // 2] = coeff_value
+            else:
+                odd_coeff_map[index // 2] = coeff_value
+        if len(odd_coeff_map) == 0 or len(even_coeff_map) == 0:
+            # no benefit in splitting the polynomial
+            return PolynomialSchemeEvaluator.generate_horner_scheme(
+                polynomial_object, variable, unified_precision, power_map)
+        square = generate_power(variable, 2, power_map, precision=unified_precision)
+        # power of square are memoized in a dedicated map as
+        # power_map is indexed by exponent and not by variable
+        square_power_map = {}
+        even_scheme = PolynomialSchemeEvaluator.generate_horner_scheme(
+            Polynomial(even_coeff_map), square, unified_precision,
+            square_power_map)
+        odd_scheme = PolynomialSchemeEvaluator.generate_horner_scheme(
+            Polynomial(odd_coeff_map), square, unified_precision,
+            square_power_map)
+        return Addition(
+            even_scheme,
+            Multiplication(variable, odd_scheme, precision=unified_precision),
+            precision=unified_precision
+        )
+
+    @staticmethod
+    def generate_mixed_scheme(polynomial_object, variable, unified_precision,
+                              leaf_size=2, power_map_=None):
+        """ generate a mixed Estrin/Horner evaluation scheme: the polynomial
+            is recursively split as in Estrin's scheme until sub-polynomials
+            span at most <leaf_size> coefficients, those sub-polynomials
+            are evaluated with a Horner scheme """
+        power_map = power_map_ if power_map_ != None else {}
+        min_degree = int(polynomial_object.get_min_monomial_degree())
+        max_degree = int(polynomial_object.get_degree())
+        if max_degree - min_degree + 1 <= leaf_size:
+            return PolynomialSchemeEvaluator.generate_horner_scheme(
+                polynomial_object, variable, unified_precision, power_map)
+        poly_degree = (max_degree - min_degree + 2) // 2 + min_degree - 1
+        offset_degree = poly_degree + 1 - min_degree
+        sub_poly_lo = polynomial_object.sub_poly(stop_index=poly_degree)
+        sub_poly_hi = polynomial_object.sub_poly(start_index=poly_degree + 1, offset=offset_degree)
+        offset_degree_monomial = generate_power(variable, offset_degree, power_map, unified_precision)
+        hi_node = Multiplication(
+            offset_degree_monomial,
+            PolynomialSchemeEvaluator.generate_mixed_scheme(
+                sub_poly_hi, variable, unified_precision, leaf_size, power_map),
+            precision=unified_precision
+        )
+        lo_node = PolynomialSchemeEvaluator.generate_mixed_scheme(
+            sub_poly_lo, variable, unified_precision, leaf_size, power_map)
+        return Addition(lo_node, hi_node, precision=unified_precision)
+
     @staticmethod
     def generate_cgpe_scheme(polynomial_object, variable,
                              unified_precision=None, power_map={},
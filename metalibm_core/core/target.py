@@ -31,18 +31,38 @@
 # author(s): Nicolas Brunie (nicolas.brunie@kalray.eu)
 ###############################################################################
 
+import importlib
+
+
 class TargetRegister(object):
     target_map = {}
+    ## map target name -> module defining the target, modules are
+    #  only imported when the target is requested
+    lazy_target_map = {}
 
     @staticmethod
     def get_target_name_list():
-        for target_name in TargetRegister.target_map:
+        for target_name in TargetRegister.get_target_names():
             print(target_name)
 
+    @staticmethod
+    def get_target_names():
+        """ return the names of registered (or declared) targets """
+        return sorted(set(TargetRegister.target_map) | set(TargetRegister.lazy_target_map))
+
     @staticmethod
     def get_target_by_name(target_name):
+        if not target_name in TargetRegister.target_map and target_name in TargetRegister.lazy_target_map:
+            importlib.import_module(TargetRegister.lazy_target_map[target_name])
         return TargetRegister.target_map[target_name]
 
     @staticmethod
     def register_new_target(target_name, target_build_function):
         TargetRegister.target_map[target_name] = target_build_function
+
+    @staticmethod
+    def register_lazy_target(target_name, module_name):
+        """ declare that importing @p module_name registers target
+            @p target_name """
+        if not target_name in TargetRegister.target_map:
+            TargetRegister.lazy_target_map[target_name] = module_name
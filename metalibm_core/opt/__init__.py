@@ -52,6 +52,14 @@ pass_list = [get_module_name(possible_pass) for possible_pass in os.listdir(pass
     
 __all__ = pass_list
 
+# declaring pass entry points: a pass module is only imported once
+# its pass is requested (see Pass.get_pass_by_tag)
+from metalibm_core.core.passes import Pass
+from metalibm_core.utility.entry_points import scan_entry_points, PASS_TAG_REGEX
+
+for pass_tag, module_name in scan_entry_points(["metalibm_core.opt.{}".format(p) for p in sorted(pass_list)], PASS_TAG_REGEX):
+  Pass.register_lazy(pass_tag, module_name)
+
 # listing submodule
 
 if __name__ == "__main__":
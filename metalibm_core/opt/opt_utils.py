@@ -43,30 +43,38 @@ def is_comparison(optree):
 
 ## Assuming @p optree has no pre-defined range, recursively compute a range
 #  from the node inputs
-def evaluate_range(optree):
+def evaluate_range(optree, memoization_map=None):
     """ evaluate the range of an Operation node
 
         Args:
             optree (ML_Operation): input Node
+            memoization_map (dict): optional map node -> already
+                                    evaluated range (shared nodes are
+                                    then evaluated once)
 
         Return:
             sollya Interval: evaluated range of optree or None if no range
                              could be determined
     """
+    if not memoization_map is None and optree in memoization_map:
+        return memoization_map[optree]
     init_interval =  optree.get_interval()
     if not init_interval is None:
-        return init_interval
+        result = init_interval
     else:
         if isinstance(optree, ML_LeafNode):
-            return optree.get_interval()
+            result = optree.get_interval()
         elif is_comparison(optree):
-            return evaluate_comparison_range(optree)
+            result = evaluate_comparison_range(optree)
         else:
             args_interval = tuple(
-                evaluate_range(op) for op in
+                evaluate_range(op, memoization_map) for op in
                 optree.get_inputs()
             )
-            return optree.apply_bare_range_function(args_interval)
+            result = optree.apply_bare_range_function(args_interval)
+    if not memoization_map is None:
+        memoization_map[optree] = result
+    return result
 
 
 def forward_attributes(src, dst):
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: static bit-width analysis report of RTL datapaths
+###############################################################################
+""" Report pass listing, after datapath sizing, the fixed-point format and
+    range of each node, flagging nodes wider than their range requires
+    or whose fractional LSBs are truncated by every consumer, and summing estimated register and adder bits per pipeline stage """
+
+import math
+
+import sollya
+
+from metalibm_core.utility.log_report import Log
+
+from metalibm_core.core.passes import OptreeOptimization, Pass
+from metalibm_core.core.ml_operations import (
+    ML_LeafNode, Constant, Addition, Subtraction, Negation, Comparison,
+    Conversion
+)
+from metalibm_core.core.ml_hdl_format import is_fixed_point
+
+from metalibm_core.opt.opt_utils import evaluate_range
+from metalibm_core.opt.p_timing_pipelining import (
+    get_topological_order, get_bit_width, get_register_bits
+)
+
+
+## Log level for bit-width reports
+LOG_BITWIDTH_REPORT = Log.LogLevel("Info", "bitwidth_report")
+
+## operations whose width contributes to adder (carry-propagate) bits
+ADDER_CLASSES = (Addition, Subtraction, Negation, Comparison)
+
+
+def get_required_integer_size(interval):
+    """ return the pair (integer size, signedness) required to store
+        values of @p interval, or (None, None) if interval is undefined or
+        unbounded """
+    if interval is None:
+        return None, None
+    try:
+        lo = float(sollya.inf(interval))
+        hi = float(sollya.sup(interval))
+    except (TypeError, ValueError):
+        return None, None
+    if math.isinf(lo) or math.isinf(hi) or math.isnan(lo) or math.isnan(hi):
+        return None, None
+    # floor(log2(hi)) + 1 bit(s) are required to store hi > 0
+    hi_size = math.frexp(hi)[1] if hi > 0 else 0
+    if lo >= 0:
+        return hi_size, False
+    # -lo requires ceil(log2(-lo)) bits, plus one sign bit
+    mantissa, exponent = math.frexp(-lo)
+    lo_size = exponent - 1 if mantissa == 0.5 else exponent
+    return max(lo_size, hi_size) + 1, True
+
+
+def get_used_frac_size(node, consumer_list):
+    """ return the number of fractional bits of @p node used by
+        @p consumer_list: if every consumer is a fixed-point Conversion,
+        LSBs beyond the largest consumer fractional size are truncated """
+    frac_size = node.get_precision().get_frac_size()
+    if not consumer_list or not all(isinstance(op, Conversion) and is_fixed_point(op.get_precision()) for op in consumer_list):
+        return frac_size
+    return min(frac_size, max(op.get_precision().get_frac_size() for op in consumer_list))
+
+
+class BitWidthInfo(object):
+    """ bit-width analysis of a single node """
+    def __init__(self, node, interval, consumer_list=None):
+        self.node = node
+        self.interval = interval
+        precision = node.get_precision()
+        self.integer_size = precision.get_integer_size()
+        self.frac_size = precision.get_frac_size()
+        self.signed = precision.get_signed()
+        self.required_integer_size, self.required_signed = \
+            get_required_integer_size(interval)
+        self.used_frac_size = get_used_frac_size(node, consumer_list or [])
+
+    def get_excess_bits(self):
+        """ return the number of integer bits exceeding what the node
+            interval requires (0 if unknown) """
+        if self.required_integer_size is None:
+            return 0
+        return max(0, self.integer_size - self.required_integer_size)
+
+    def get_excess_frac_bits(self):
+        """ return the number of fractional bits truncated by every
+            consumer of the node """
+        return self.frac_size - self.used_frac_size
+
+    def get_excess_str(self):
+        excess_list = []
+        if self.get_excess_bits():
+            excess_list.append("{} excess integer bit(s)".format(self.get_excess_bits()))
+        if self.get_excess_frac_bits():
+            excess_list.append("{} unused fractional bit(s)".format(self.get_excess_frac_bits()))
+        return "  [{}]".format(", ".join(excess_list)) if excess_list else ""
+
+    def get_str(self):
+        return "{:<32} int={:>4} frac={:>4} {:<8} interval={}{}".format(
+            str(self.node.get_tag()) + " (" + self.node.__class__.__name__ + ")",
+            self.integer_size, self.frac_size,
+            "signed" if self.signed else "unsigned",
+            self.interval,
+            self.get_excess_str()
+        )
+
+
+class Pass_BitWidthReport(OptreeOptimization):
+    """ Report pass (to be scheduled after size_datapath): it does not
+        modify the graph """
+    pass_tag = "bitwidth_report"
+
+    def __init__(self, target):
+        OptreeOptimization.__init__(self, "bitwidth_report", target)
+        ## list of BitWidthInfo built during last execution
+        self.info_list = []
+
+    def get_node_info_list(self, node_list):
+        """ return the list of BitWidthInfo of the fixed-point nodes of
+            node_list """
+        range_map = {}
+        consumer_map = {}
+        for node in node_list:
+            if not isinstance(node, ML_LeafNode):
+                for op in node.get_inputs():
+                    consumer_map.setdefault(op, []).append(node)
+        return [
+            BitWidthInfo(node, evaluate_range(node, range_map), consumer_map.get(node))
+            for node in node_list
+            if is_fixed_point(node.get_precision()) and not isinstance(node, Constant)
+        ]
+
+    def get_stage_bits(self, node_list):
+        """ return the maps stage -> estimated register bits (values
+            crossing the end of the stage) and stage -> adder bits """
+        stage_of = lambda node: node.attributes.init_stage or 0
+        adder_bits = {}
+        for node in node_list:
+            if isinstance(node, ADDER_CLASSES):
+                stage = stage_of(node)
+                adder_bits[stage] = adder_bits.get(stage, 0) + max(get_bit_width(op) for op in node.get_inputs())
+        return get_register_bits(node_list, stage_of), adder_bits
+
+    def get_report(self, optree):
+        node_list = get_topological_order([optree])
+        info_list = self.get_node_info_list(node_list)
+        self.info_list = info_list
+        register_bits, adder_bits = self.get_stage_bits(node_list)
+        lines = ["bit-width report:"]
+        lines += ["  " + info.get_str() for info in info_list]
+        oversized = [info for info in info_list if info.get_excess_bits() or info.get_excess_frac_bits()]
+        lines.append("  {} oversized node(s), {} excess integer bit(s), {} unused fractional bit(s)".format(
+            len(oversized), sum(info.get_excess_bits() for info in oversized),
+            sum(info.get_excess_frac_bits() for info in oversized)))
+        for stage in sorted(set(register_bits) | set(adder_bits)):
+            lines.append("  stage {:>3}: register bits {:>6}, adder bits {:>6}".format(
+                stage, register_bits.get(stage, 0), adder_bits.get(stage, 0)))
+        return "\n".join(lines)
+
+    def execute(self, optree):
+        Log.report(Log.Info, "executing Pass_BitWidthReport")
+        Log.report(LOG_BITWIDTH_REPORT, self.get_report(optree))
+        return optree
+
+
+# register pass
+Log.report(
+    Log.Info,
+    "Registering {} pass".format(Pass_BitWidthReport.pass_tag)
+)
+Pass.register(Pass_BitWidthReport)
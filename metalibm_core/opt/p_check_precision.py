@@ -32,7 +32,7 @@ from metalibm_core.core.ml_operations import (
     ML_LeafNode, Statement, ConditionBlock, ReferenceAssign
 )
 from metalibm_core.core.ml_hdl_operations import (
-    Process, Loop, ComponentInstance, Assert, Wait
+    Process, Loop, ComponentInstance, Assert, Wait, WhileLoop
 )
 from metalibm_core.core.passes import OptreeOptimization, Pass, LOG_PASS_INFO
 
@@ -42,7 +42,7 @@ def check_precision_validity(optree):
   none_class_list = [
     Statement, ConditionBlock, Process,
     ReferenceAssign, Loop, ComponentInstance,
-    Assert, Wait,
+    Assert, Wait, WhileLoop,
   ]
   if reduce(lambda x, y: x or y, [isinstance(optree, none_class) for none_class in none_class_list], False):
     return optree.get_precision() is None
@@ -52,6 +52,7 @@ def check_precision_validity(optree):
 ## Generic vector promotion pass
 class Pass_CheckGeneric(OptreeOptimization):
   pass_tag = "check_generic"
+  parallel_safe = True
   def __init__(self, target, check_function = lambda optree: True, description = "check_generic pass"):
     OptreeOptimization.__init__(self, description, target)
     self.memoization_map = {}
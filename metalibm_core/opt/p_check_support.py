@@ -26,12 +26,13 @@
 ###############################################################################
 from metalibm_core.core.passes import OptreeOptimization, Pass, LOG_PASS_INFO
 from metalibm_core.core.ml_operations import *
-from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.log_report import Log, UnsupportedOperationError
 
 
 ## Check support of operation graph on a given target
 class Pass_CheckSupport(OptreeOptimization):
   pass_tag = "check_target_support"
+  parallel_safe = True
 
   def __init__(self, target):
     OptreeOptimization.__init__(self, "check_target_support", target)
@@ -72,7 +73,7 @@ class Pass_CheckSupport(OptreeOptimization):
       elif not self.get_target().is_supported_operation(optree, debug = debug):
         print(self.processor.get_operation_keys(optree)) # Error print
         print(optree.get_str(display_precision = True, display_id = True, memoization_map = {})) # Error print
-        Log.report(Log.Error, "unsupported operation\n")
+        Log.report(Log.Error, "unsupported operation\n", error=UnsupportedOperationError)
     # memoization
     memoization_map[optree] = True
     return True
@@ -100,6 +100,8 @@ def dirty_multi_node_expand(node, precision, mem_map=None):
 class Pass_ExpandMultiPrecision(OptreeOptimization):
     """ Generic Multi-Precision expansion pass """
     pass_tag = "expand_multi_precision"
+    rebuild_graph = True
+    parallel_safe = True
 
     def __init__(self, target):
         OptreeOptimization.__init__(
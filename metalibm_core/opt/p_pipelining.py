@@ -46,8 +46,8 @@ class RetimeMap:
         # map of stage_index -> list of pipelined forward
         # from <stage_index> -> <stage_index + 1>
         self.stage_forward = {}
-        # list of nodes already retimed
-        self.processed = []
+        # set of nodes already retimed
+        self.processed = set()
         #
         self.pre_statement = set()
 
@@ -60,9 +60,9 @@ class RetimeMap:
         return self.get_op_key(op) in self.processed
 
     def addToProcessed(self, op):
-        """ add op to the list of processed nodes """
+        """ add op to the set of processed nodes """
         op_key = self.get_op_key(op)
-        return self.processed.append(op_key)
+        self.processed.add(op_key)
 
     def contains(self, op, stage):
         """ check if the pair (op, stage) is defined in the stage map """
@@ -76,8 +76,8 @@ class RetimeMap:
         self.stage_map[(op_key, stage)] = op
 
     def add_stage_forward(self, op_dst, op_src, stage):
-        Log.report(Log.Verbose, " adding stage forward {op_src} to {op_dst} @ stage {stage}".format(
-            op_src=op_src, op_dst=op_dst, stage=stage))
+        Log.report(Log.Verbose, " adding stage forward {op_src} to {op_dst} @ stage {stage}",
+            op_src=op_src, op_dst=op_dst, stage=stage)
         if not stage in self.stage_forward:
             self.stage_forward[stage] = []
         self.stage_forward[stage].append(
@@ -89,8 +89,8 @@ class RetimeMap:
 #  in @p stage
 def propagate_op(op, stage, retime_map):
     op_key = retime_map.get_op_key(op)
-    Log.report(Log.Verbose, " propagating {op} (key={op_key}) to stage {stage}".format(
-        op=op, op_key=op_key, stage=stage))
+    Log.report(Log.Verbose, " propagating {op} (key={op_key}) to stage {stage}",
+        op=op, op_key=op_key, stage=stage)
     # look for the latest stage where op is defined
     current_stage = op_key.attributes.init_stage
     while retime_map.contains(op_key, current_stage + 1):
@@ -126,55 +126,76 @@ def node_has_inputs(optree):
         return True
 
 
-def retime_op(op, retime_map):
-    """ Process each input of op and if necessary generate necessary
-        forwarding stage """
-    Log.report(Log.Verbose, "retiming op %s " % (op.get_str(depth=1)))
-    if retime_map.hasBeenProcessed(op):
-        Log.report(Log.Verbose, "  retiming already processed")
-        return
+def retime_input(op, in_id, retime_map):
+    """ Generate (if necessary) the forwarding stages required to use the
+        in_id-th input of op (already retimed) at op's stage """
     op_stage = op.attributes.init_stage
-    if node_has_inputs(op):
-        for in_id in range(op.get_input_num()):
-            in_op = op.get_input(in_id)
-            in_stage = in_op.attributes.init_stage
-            Log.report(
-                Log.Verbose,
-                "retiming input {inp} of {op} stage {in_stage} -> {op_stage}".format(
-                    inp=in_op.get_str(depth=1), op=op, in_stage=in_stage,
-                    op_stage=op_stage
-                )
+    in_op = op.get_input(in_id)
+    in_stage = in_op.attributes.init_stage
+    if not node_should_be_pipelined(in_op):
+        pass
+    elif in_stage < op_stage:
+        assert not isinstance(in_op, FixedPointPosition)
+        if not retime_map.contains(in_op, op_stage):
+            propagate_op(in_op, op_stage, retime_map)
+        new_in = retime_map.get(in_op, op_stage)
+        Log.report(Log.Verbose, "new version of input {inp} for {op} is {new_in}",
+            inp=in_op, op=op, new_in=new_in)
+        op.set_input(in_id, new_in)
+    elif in_stage > op_stage:
+        Log.report(Log.Error, "stages {in_stage} -> {op_stage}, input {inp} of {op} is defined at a later stage".format(
+            in_stage=in_stage, op_stage=op_stage,
+            inp=in_op.get_str(
+                display_precision=True,
+                custom_callback=lambda op: " [S={}] ".format(
+                    op.attributes.init_stage)
+            ),
+            op=op.get_str(
+                display_precision=True,
+                custom_callback=lambda op: " [S={}] ".format(
+                    op.attributes.init_stage)
             )
+        )
+        )
+
+
+def retime_op(op, retime_map):
+    """ Process each input of op and if necessary generate necessary
+        forwarding stage.
+        The traversal is iterative (explicit stack of (node, next input
+        index) frames) but processes inputs in the same order as a
+        depth-first recursion, so the generated stages are identical """
+    stack = [[op, 0]]
+    while stack:
+        frame = stack[-1]
+        current_op, in_id = frame
+        if in_id == 0:
+            Log.report(Log.Verbose, lambda: "retiming op %s " % (current_op.get_str(depth=1)))
+            if retime_map.hasBeenProcessed(current_op):
+                Log.report(Log.Verbose, "  retiming already processed")
+                stack.pop()
+                continue
+        if node_has_inputs(current_op) and in_id < current_op.get_input_num():
+            in_op = current_op.get_input(in_id)
             if not retime_map.hasBeenProcessed(in_op):
-                retime_op(in_op, retime_map)
-
-            if not node_should_be_pipelined(in_op):
-                pass
-            elif in_stage < op_stage:
-                assert not isinstance(in_op, FixedPointPosition)
-                if not retime_map.contains(in_op, op_stage):
-                    propagate_op(in_op, op_stage, retime_map)
-                new_in = retime_map.get(in_op, op_stage)
-                Log.report(Log.Verbose, "new version of input {inp} for {op} is {new_in}".format(
-                    inp=in_op, op=op, new_in=new_in))
-                op.set_input(in_id, new_in)
-            elif in_stage > op_stage:
-                Log.report(Log.Error, "stages {in_stage} -> {op_stage}, input {inp} of {op} is defined at a later stage".format(
-                    in_stage=in_stage, op_stage=op_stage,
-                    inp=in_op.get_str(
-                        display_precision=True,
-                        custom_callback=lambda op: " [S={}] ".format(
-                            op.attributes.init_stage)
-                    ),
-                    op=op.get_str(
-                        display_precision=True,
-                        custom_callback=lambda op: " [S={}] ".format(
-                            op.attributes.init_stage)
+                Log.report(
+                    Log.Verbose,
+                    "retiming input {inp} of {op} stage {in_stage} -> {op_stage}".format(
+                        inp=in_op.get_str(depth=1), op=current_op,
+                        in_stage=in_op.attributes.init_stage,
+                        op_stage=current_op.attributes.init_stage
                     )
                 )
-                )
-    retime_map.set(op, op_stage)
-    retime_map.addToProcessed(op)
+                # input must be retimed first, this frame is resumed
+                # (with the same input index) once it is done
+                stack.append([in_op, 0])
+                continue
+            retime_input(current_op, in_id, retime_map)
+            frame[1] += 1
+        else:
+            retime_map.set(current_op, current_op.attributes.init_stage)
+            retime_map.addToProcessed(current_op)
+            stack.pop()
 
 
 def generate_pipeline_stage(entity):
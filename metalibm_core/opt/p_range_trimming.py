@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: range-driven bit-width trimming of RTL datapaths
+###############################################################################
+""" Optimization pass which narrows the fixed-point formats inferred by
+    size_datapath using interval analysis: integer MSBs which can never
+    be set are removed and fractional LSBs discarded by every consumer
+    are truncated at the source. To be scheduled between size_datapath
+    and rtl_legalize """
+
+import sollya
+
+from metalibm_core.utility.log_report import Log
+
+from metalibm_core.core.passes import OptreeOptimization, Pass
+from metalibm_core.core.ml_operations import (
+    ML_LeafNode, Addition, Subtraction, Multiplication, Conversion,
+    Comparison, Select, Min, Max, BitLogicLeftShift
+)
+from metalibm_core.core.ml_hdl_format import is_fixed_point, fixed_point
+
+from metalibm_core.opt.p_bitwidth_report import (
+    get_required_integer_size, get_used_frac_size
+)
+from metalibm_core.opt.p_timing_pipelining import get_topological_order
+
+## Log level for range trimming reports
+LOG_RANGE_TRIMMING = Log.LogLevel("Info", "range_trimming")
+
+## operations whose format can be narrowed: the VHDL backend computes them
+#  at full width and adapts (SubSignalSelection) the raw result to the node
+#  format, so trimming bits which are never set is value-preserving
+TRIMMABLE_CLASSES = (Addition, Subtraction, Multiplication, BitLogicLeftShift)
+
+## consumers which adapt their fixed-point inputs whatever their formats
+FORMAT_AGNOSTIC_CONSUMERS = (
+    Addition, Subtraction, Multiplication, Conversion, Comparison, Select,
+    Min, Max
+)
+
+
+def get_range(node, range_map):
+    """ return the interval of @p node: evaluated from its inputs when
+        an interval function is available, else deduced from its
+        fixed-point format (None if unknown) """
+    if node in range_map:
+        return range_map[node]
+    result = node.get_interval()
+    if result is None and not isinstance(node, ML_LeafNode) and hasattr(node, "bare_range_function"):
+        input_ranges = tuple(range_map.get(op) for op in node.get_inputs())
+        if not any(input_range is None for input_range in input_ranges):
+            try:
+                result = node.apply_bare_range_function(input_ranges)
+            except (TypeError, ValueError, ZeroDivisionError) as e:
+                # interval arithmetic not supported for these ranges
+                # (e.g. unbounded or ill-formed intervals)
+                Log.report(Log.Verbose, "range of {} could not be evaluated from its inputs: {}", node.get_tag() or node.__class__.__name__, e)
+                result = None
+    precision = node.get_precision()
+    if result is None and is_fixed_point(precision):
+        result = sollya.Interval(precision.get_min_value(), precision.get_max_value())
+    range_map[node] = result
+    return result
+
+
+class Pass_RangeTrimming(OptreeOptimization):
+    """ range-driven bit-width trimming """
+    pass_tag = "range_trimming"
+
+    def __init__(self, target):
+        OptreeOptimization.__init__(self, "range_trimming", target)
+        ## number of trimmed bits during last execution
+        self.trimmed_bits = 0
+
+    def get_trimmed_integer_size(self, node, interval):
+        """ return the integer size of node once unused MSBs are removed """
+        precision = node.get_precision()
+        required_size, required_signed = get_required_integer_size(interval)
+        if required_size is None:
+            return precision.get_integer_size()
+        if precision.get_signed() and not required_signed:
+            # sign bit is kept
+            required_size += 1
+        elif required_signed and not precision.get_signed():
+            return precision.get_integer_size()
+        return min(precision.get_integer_size(), required_size)
+
+    def get_trimmed_frac_size(self, node, consumer_list):
+        """ return the fractional size of node once LSBs discarded by every
+            consumer (truncating Conversion) are removed """
+        precision = node.get_precision()
+        if isinstance(node, BitLogicLeftShift):
+            # shift input is converted to the node format before being
+            # shifted: its LSBs can not be truncated
+            return precision.get_frac_size()
+        return get_used_frac_size(node, consumer_list)
+
+    def execute(self, optree):
+        node_list = get_topological_order([optree])
+        consumer_map = {}
+        range_map = {}
+        for node in node_list:
+            get_range(node, range_map)
+            if not isinstance(node, ML_LeafNode):
+                for op in node.get_inputs():
+                    consumer_map.setdefault(op, []).append(node)
+        self.trimmed_bits = 0
+        for node in node_list:
+            precision = node.get_precision()
+            if not isinstance(node, TRIMMABLE_CLASSES) or not is_fixed_point(precision):
+                continue
+            consumer_list = consumer_map.get(node, [])
+            if not all(isinstance(op, FORMAT_AGNOSTIC_CONSUMERS) for op in consumer_list):
+                continue
+            integer_size = self.get_trimmed_integer_size(node, range_map[node])
+            frac_size = self.get_trimmed_frac_size(node, consumer_list)
+            if integer_size + frac_size < 1:
+                continue
+            trimmed = precision.get_bit_size() - (integer_size + frac_size)
+            if trimmed > 0:
+                new_precision = fixed_point(integer_size, frac_size, signed=precision.get_signed())
+                Log.report(
+                    LOG_RANGE_TRIMMING,
+                    "trimming {} from {} to {} (range {})".format(
+                        node.get_tag() or node.__class__.__name__, precision,
+                        new_precision, range_map[node]))
+                node.set_precision(new_precision)
+                self.trimmed_bits += trimmed
+        Log.report(LOG_RANGE_TRIMMING, "{} bit(s) trimmed".format(self.trimmed_bits))
+        return optree
+
+
+# register pass
+Log.report(
+    Log.Info,
+    "Registering {} pass".format(Pass_RangeTrimming.pass_tag)
+)
+Pass.register(Pass_RangeTrimming)
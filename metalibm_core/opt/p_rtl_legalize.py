@@ -118,7 +118,7 @@ def legalize_operation_rec(optree, memoization_map = None):
 
     # looking into memoization map
     if optree in memoization_map:
-        return optree
+        return memoization_map[optree]
 
     # has the npde been modified ?
     arg_changed = False
@@ -127,15 +127,16 @@ def legalize_operation_rec(optree, memoization_map = None):
         pass
     else:
         for index, op_input in enumerate(optree.get_inputs()):
-            is_modified, new_node = legalize_operation_rec(op_input)
+            is_modified, new_node = legalize_operation_rec(op_input, memoization_map)
             if is_modified:
                 optree.set_input(index, new_node)
                 arg_changed = True
 
     local_changed, new_optree = legalize_single_operation(optree)
 
-    memoization_map[optree] = optree 
-    return local_changed or arg_changed, new_optree
+    result = local_changed or arg_changed, new_optree
+    memoization_map[optree] = result
+    return result
 
 
 ## Legalize the precision of a datapath by finely tuning the size
@@ -143,6 +144,8 @@ def legalize_operation_rec(optree, memoization_map = None):
 class Pass_RTLLegalize(OptreeOptimization):
     """ implementation of datapath sizing pass """
     pass_tag = "rtl_legalize"
+    rebuild_graph = True
+    parallel_safe = True
 
     def __init__(self, target):
         """ pass initialization """
@@ -150,7 +153,8 @@ class Pass_RTLLegalize(OptreeOptimization):
 
     def execute(self, optree):
         """ pass execution """
-        return legalize_operation_rec(optree, {})
+        _, new_optree = legalize_operation_rec(optree, {})
+        return new_optree
 
 Log.report(LOG_PASS_INFO, "Registering size_datapath pass")
 # register pass
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: I.R snapshot at a pass boundary
+###############################################################################
+""" Optimization pass which saves the graph it is applied on as an I.R
+    snapshot (see metalibm_core.core.ml_snapshot), e.g. to share the
+    graph processed by a given slot in a bug report. Snapshots are stored
+    in files named <prefix><pass id>_<execution index>.mlsnap """
+
+import os
+
+from metalibm_core.core.passes import OptreeOptimization, Pass
+from metalibm_core.core.ml_snapshot import save_snapshot
+
+from metalibm_core.utility.log_report import Log
+
+
+class Pass_SaveSnapshot(OptreeOptimization):
+    """ save the processed graph in a snapshot file """
+    pass_tag = "save_snapshot"
+    ## snapshot file prefix, can be overloaded through the
+    #  ML_SNAPSHOT_PREFIX environment variable
+    default_prefix = "ml_snapshot_"
+
+    def __init__(self, target):
+        OptreeOptimization.__init__(self, "save_snapshot", target)
+        self.prefix = os.environ.get("ML_SNAPSHOT_PREFIX", self.default_prefix)
+        ## number of executions (saved snapshots)
+        self.execution_count = 0
+
+    def execute(self, optree):
+        filename = "{}{}_{}.mlsnap".format(self.prefix, self.get_pass_id(), self.execution_count)
+        self.execution_count += 1
+        Log.report(Log.Info, "saving graph snapshot in {}".format(filename))
+        save_snapshot(filename, optree, "graph")
+        return optree
+
+
+# register pass
+Log.report(
+    Log.Info,
+    "Registering {} pass".format(Pass_SaveSnapshot.pass_tag)
+)
+Pass.register(Pass_SaveSnapshot)
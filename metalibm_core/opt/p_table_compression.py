@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+""" Optimization pass which compresses constant tables: identical or
+    overlapping tables are merged and table entries are stored in the
+    narrowest format which represents them exactly """
+
+from sollya import S2
+
+from metalibm_core.utility.log_report import Log
+
+from metalibm_core.core.passes import OptreeOptimization, Pass, LOG_PASS_INFO
+from metalibm_core.core.ml_operations import (
+    ML_LeafNode, TableLoad, Addition, Constant, Conversion
+)
+from metalibm_core.core.ml_table import ML_Table, ML_NewTable, ML_ApproxTable
+from metalibm_core.core.ml_formats import (
+    ML_FP_Format, is_std_integer_format,
+    ML_Binary32, ML_Binary64,
+    ML_Int8, ML_Int16, ML_Int32, ML_Int64,
+    ML_UInt8, ML_UInt16, ML_UInt32, ML_UInt64,
+)
+from metalibm_core.core.special_values import FP_SpecialValue
+
+
+## Log level for table compression reports
+LOG_TABLE_COMPRESSION = Log.LogLevel("Info", "table_compression")
+
+## narrower storage formats which can be tried for each table format,
+#  listed from the narrowest to the widest. Only formats whose conversion
+#  to the original format is supported by the generic backend are listed
+NARROWER_FORMAT_MAP = {
+    ML_Binary64: [ML_Binary32],
+    ML_Int64: [ML_Int8, ML_Int16, ML_Int32],
+    ML_Int32: [ML_Int8, ML_Int16],
+    ML_Int16: [ML_Int8],
+    ML_UInt64: [ML_UInt8, ML_UInt16, ML_UInt32],
+    ML_UInt32: [ML_UInt8, ML_UInt16],
+    ML_UInt16: [ML_UInt8],
+}
+
+
+def flatten_table_data(data, dimensions):
+    """ return the flat list of values of a multi-dimensional table """
+    if len(dimensions) == 1:
+        return list(data)
+    return sum([flatten_table_data(row, dimensions[1:]) for row in data], [])
+
+
+def is_exactly_representable(value, precision):
+    """ test if @p value can be stored in @p precision without any error """
+    if FP_SpecialValue.is_special_value(value):
+        return False
+    elif ML_FP_Format.is_fp_format(precision):
+        if value == 0:
+            return True
+        # subnormal values are conservatively discarded
+        return abs(value) <= precision.get_omega() and \
+               abs(value) >= S2**precision.get_emin_normal() and \
+               precision.round_sollya_object(value) == value
+    elif is_std_integer_format(precision):
+        return int(value) == value and \
+               precision.get_min_value() <= value <= precision.get_max_value()
+    return False
+
+
+def get_narrowest_format(value_list, precision):
+    """ return the narrowest format able to store exactly every value
+        of @p value_list (@p precision if no narrower format is found) """
+    for narrow_precision in NARROWER_FORMAT_MAP.get(precision, []):
+        if all(is_exactly_representable(v, narrow_precision) for v in value_list):
+            return narrow_precision
+    return precision
+
+
+def find_sub_list(sub_list, main_list):
+    """ return the offset of the first occurence of @p sub_list as
+        a contiguous slice of @p main_list, None if there is none """
+    sub_len = len(sub_list)
+    for offset in range(len(main_list) - sub_len + 1):
+        if main_list[offset:offset + sub_len] == sub_list:
+            return offset
+    return None
+
+
+def get_overlap_size(lhs_list, rhs_list):
+    """ return the size of the largest suffix of @p lhs_list
+        which is also a prefix of @p rhs_list """
+    for size in range(min(len(lhs_list), len(rhs_list)), 0, -1):
+        if lhs_list[-size:] == rhs_list[:size]:
+            return size
+    return 0
+
+
+class TableLoadInfo(object):
+    """ Information required to re-target a TableLoad node towards
+        a merged table """
+    def __init__(self, load_node):
+        self.load_node = load_node
+        self.index_list = load_node.get_inputs()[1:]
+        self.precision = load_node.get_precision()
+
+    def has_offsetable_index(self):
+        """ test if the load index can be shifted by a scalar integer
+            offset """
+        return len(self.index_list) == 1 and \
+               is_std_integer_format(self.index_list[0].get_precision())
+
+
+class TableGroup(object):
+    """ Set of original tables sharing a single storage table,
+        each original table being mapped to an offset in the shared
+        table """
+    def __init__(self, table, storage_precision, value_list, allow_offset):
+        self.dimensions = tuple(table.dimensions)
+        self.storage_precision = storage_precision
+        self.value_list = value_list
+        self.key_list = [storage_precision.get_cst(v) for v in value_list]
+        ## True if every load of the group supports index offsetting
+        self.allow_offset = allow_offset
+        self.tag = table.get_tag()
+        ## multi-dimensional content (only identical tables are merged
+        #  in multi-dimensional groups)
+        self.init_data = table.get_data()
+        ## original table -> offset of its first element in group table
+        self.offset_map = {table: 0}
+        self.table = table if storage_precision == table.get_storage_precision() \
+                     else self.build_table()
+
+    def build_table(self):
+        """ build the shared table from the group current content """
+        if len(self.dimensions) == 1:
+            dimensions, init_data = (len(self.value_list),), self.value_list
+        else:
+            dimensions, init_data = self.dimensions, self.init_data
+        return ML_NewTable(
+            dimensions=dimensions,
+            storage_precision=self.storage_precision,
+            init_data=init_data,
+            tag=self.tag
+        )
+
+    def get_byte_size(self):
+        return self.table.get_byte_size()
+
+    def shift_offsets(self, shift):
+        for table in self.offset_map:
+            self.offset_map[table] += shift
+
+    def try_merge(self, table, value_list, key_list, allow_offset):
+        """ try to merge @p table (whose content is described by
+            @p value_list and @p key_list) in @p self.
+            Return True if the merge succeeded, False otherwise """
+        if len(self.dimensions) != len(table.dimensions):
+            return False
+        if len(self.dimensions) > 1 or not (allow_offset and self.allow_offset):
+            # only identical tables can be merged
+            if self.dimensions == tuple(table.dimensions) and self.key_list == key_list:
+                self.offset_map[table] = 0
+                return True
+            return False
+        # table is a sub-table of the group
+        offset = find_sub_list(key_list, self.key_list)
+        if offset != None:
+            self.offset_map[table] = offset
+            return True
+        # group is a sub-table of table
+        offset = find_sub_list(self.key_list, key_list)
+        if offset != None:
+            self.shift_offsets(offset)
+            self.update_content(value_list, key_list)
+            self.offset_map[table] = 0
+            return True
+        # table is appended to group content
+        overlap = get_overlap_size(self.key_list, key_list)
+        if overlap > 0:
+            self.offset_map[table] = len(self.key_list) - overlap
+            self.update_content(
+                self.value_list + value_list[overlap:],
+                self.key_list + key_list[overlap:])
+            return True
+        # table is prepended to group content
+        overlap = get_overlap_size(key_list, self.key_list)
+        if overlap > 0:
+            self.shift_offsets(len(key_list) - overlap)
+            self.update_content(
+                value_list + self.value_list[overlap:],
+                key_list + self.key_list[overlap:])
+            self.offset_map[table] = 0
+            return True
+        return False
+
+    def update_content(self, value_list, key_list):
+        self.value_list = value_list
+        self.key_list = key_list
+        self.table = self.build_table()
+
+
+class Pass_TableCompression(OptreeOptimization):
+    """ Merge identical and overlapping constant tables and pack table
+        entries into narrower formats when possible.
+        The pass object keeps its state across executions so that tables
+        are shared between all the functions of a compilation unit
+        processed by the same pass object """
+    pass_tag = "table_compression"
+    rebuild_graph = True
+
+    def __init__(self, target):
+        OptreeOptimization.__init__(self, "table compression", target)
+        ## list of TableGroup built so far
+        self.group_list = []
+        ## original table -> TableGroup
+        self.table_group_map = {}
+        ## original table -> list of TableLoadInfo
+        self.load_map = {}
+        ## tables which can not be modified (stored to, passed as
+        #  argument ...)
+        self.pinned_tables = set()
+        ## TableLoad node -> Conversion node to the original load precision
+        self.conversion_map = {}
+        self.conversion_node_set = set()
+
+    @staticmethod
+    def is_candidate_table(table):
+        return isinstance(table, ML_NewTable) and \
+               not isinstance(table, ML_ApproxTable) and \
+               not table.is_empty()
+
+    def collect_tables(self, optree, memoization_set):
+        """ list tables used in the graph of @p optree, registering
+            TableLoad nodes and pinning tables with other uses """
+        if optree in memoization_set or isinstance(optree, ML_LeafNode):
+            return
+        memoization_set.add(optree)
+        for index, op in enumerate(optree.get_inputs()):
+            if isinstance(op, ML_Table):
+                if any(op is group.table for group in self.group_list):
+                    # table already built by this pass
+                    continue
+                elif index == 0 and isinstance(optree, TableLoad) and self.is_candidate_table(op):
+                    load_list = self.load_map.setdefault(op, [])
+                    if not any(info.load_node is optree for info in load_list):
+                        load_list.append(TableLoadInfo(optree))
+                else:
+                    self.pinned_tables.add(op)
+            else:
+                self.collect_tables(op, memoization_set)
+
+    def process_table(self, table):
+        """ pack @p table and merge it in a compatible group """
+        load_list = self.load_map[table]
+        value_list = flatten_table_data(table.get_data(), table.dimensions)
+        scalar_loads = all(
+            info.precision == table.get_storage_precision() for info in load_list)
+        storage_precision = table.get_storage_precision()
+        if scalar_loads:
+            storage_precision = get_narrowest_format(value_list, storage_precision)
+        allow_offset = all(info.has_offsetable_index() for info in load_list)
+        key_list = [storage_precision.get_cst(v) for v in value_list]
+        for group in self.group_list:
+            if group.storage_precision == storage_precision and \
+               group.try_merge(table, value_list, key_list, allow_offset):
+                self.table_group_map[table] = group
+                return
+        group = TableGroup(table, storage_precision, value_list, allow_offset)
+        self.group_list.append(group)
+        self.table_group_map[table] = group
+
+    def retarget_loads(self):
+        """ make every registered load point to its group table """
+        for table in self.table_group_map:
+            group = self.table_group_map[table]
+            offset = group.offset_map[table]
+            for info in self.load_map[table]:
+                load_node = info.load_node
+                load_node.set_input(0, group.table)
+                if offset != 0:
+                    index = info.index_list[0]
+                    load_node.set_input(1, Addition(
+                        index, Constant(offset, precision=index.get_precision()),
+                        precision=index.get_precision()))
+                if group.storage_precision != info.precision:
+                    load_node.set_precision(group.storage_precision)
+                    if not load_node in self.conversion_map:
+                        conversion = Conversion(load_node, precision=info.precision)
+                        self.conversion_map[load_node] = conversion
+                        self.conversion_node_set.add(conversion)
+
+    def insert_conversions(self, optree, memoization_set):
+        """ replace uses of packed loads by their conversion node """
+        if optree in memoization_set or isinstance(optree, ML_LeafNode):
+            return
+        memoization_set.add(optree)
+        if optree in self.conversion_node_set:
+            return
+        for index, op in enumerate(optree.get_inputs()):
+            self.insert_conversions(op, memoization_set)
+            if op in self.conversion_map:
+                optree.set_input(index, self.conversion_map[op])
+
+    def get_table_byte_sizes(self):
+        """ return the pair (byte size before compression, byte size
+            after compression) of the tables processed so far """
+        original_size = sum(
+            table.get_byte_size() for table in set(self.load_map).union(self.pinned_tables))
+        compressed_size = sum(group.get_byte_size() for group in self.group_list) + \
+            sum(table.get_byte_size() for table in self.pinned_tables)
+        return original_size, compressed_size
+
+    def execute(self, optree):
+        self.collect_tables(optree, set())
+        for table in self.pinned_tables:
+            if table in self.load_map and not table in self.table_group_map:
+                # pinned tables are left untouched
+                self.load_map.pop(table)
+        for table in self.load_map:
+            if not table in self.table_group_map and not table in self.pinned_tables:
+                self.process_table(table)
+        self.retarget_loads()
+        self.insert_conversions(optree, set())
+        if optree in self.conversion_map:
+            optree = self.conversion_map[optree]
+
+        original_size, compressed_size = self.get_table_byte_sizes()
+        Log.report(
+            LOG_TABLE_COMPRESSION,
+            "table compression: {} table(s), {} bytes -> {} group(s), {} bytes".format(
+                len(self.load_map) + len(self.pinned_tables), original_size,
+                len(self.group_list) + len(self.pinned_tables), compressed_size))
+        return optree
+
+
+Log.report(LOG_PASS_INFO, "Registering table_compression pass")
+# register pass
+Pass.register(Pass_TableCompression)
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: timing-driven automatic pipeline stage insertion
+###############################################################################
+""" Optimization pass which assigns pipeline stage ids (init_stage) to
+    the nodes of an entity so that the estimated combinational delay of
+    each stage fits within a target clock period """
+
+import json
+import math
+
+from metalibm_core.utility.log_report import Log
+
+from metalibm_core.core.passes import OptreeOptimization, Pass
+from metalibm_core.core.ml_operations import (
+    ML_LeafNode, ReferenceAssign, Statement
+)
+
+from metalibm_core.opt.p_pipelining import node_should_be_pipelined
+
+## Log level for timing-driven pipelining reports
+LOG_TIMING_PIPELINING = Log.LogLevel("Info", "timing_pipelining")
+
+
+class OperationDelayModel(object):
+    """ Per-operation combinational delay model (in ns): the delay of an
+        operation is base + log_coeff * log2(size) where size is the
+        operation bit width (product of input widths for a multiplication).
+        Coefficients are indexed by operation class name and can be
+        calibrated from a JSON file {"Addition": [base, log_coeff], ...} """
+    ## default (base, log_coeff) coefficients
+    default_coeffs = {
+        # carry-propagate operators
+        "Addition": (0.2, 0.1),
+        "Subtraction": (0.2, 0.1),
+        "Negation": (0.2, 0.1),
+        "Comparison": (0.2, 0.08),
+        "Test": (0.1, 0.05),
+        "Min": (0.3, 0.1),
+        "Max": (0.3, 0.1),
+        # partial product generation + reduction tree
+        "Multiplication": (0.5, 0.12),
+        # leading zero count and barrel shifters
+        "CountLeadingZeros": (0.1, 0.12),
+        "BitLogicLeftShift": (0.1, 0.15),
+        "BitLogicRightShift": (0.1, 0.15),
+        "BitArithmeticRightShift": (0.1, 0.15),
+        # single level of logic
+        "BitLogicAnd": (0.05, 0.0),
+        "BitLogicOr": (0.05, 0.0),
+        "BitLogicXor": (0.05, 0.0),
+        "BitLogicNegate": (0.05, 0.0),
+        "LogicalAnd": (0.05, 0.0),
+        "LogicalOr": (0.05, 0.0),
+        "LogicalNot": (0.05, 0.0),
+        "Select": (0.1, 0.0),
+        # wiring
+        "ReferenceAssign": (0.0, 0.0),
+        "TypeCast": (0.0, 0.0),
+        "Conversion": (0.0, 0.0),
+        "SubSignalSelection": (0.0, 0.0),
+        "VectorElementSelection": (0.0, 0.0),
+        "Concatenation": (0.0, 0.0),
+        "ZeroExt": (0.0, 0.0),
+        "SignExt": (0.0, 0.0),
+        "FixedPointPosition": (0.0, 0.0),
+    }
+    ## coefficients of operations missing from the model
+    unknown_coeffs = (0.2, 0.05)
+
+    def __init__(self, coeffs=None):
+        self.coeffs = dict(self.default_coeffs)
+        if coeffs:
+            self.coeffs.update(coeffs)
+
+    @staticmethod
+    def load(filename):
+        """ build a delay model from the calibration file @p filename """
+        with open(filename, "r") as model_stream:
+            calibration = json.load(model_stream)
+        return OperationDelayModel(
+            dict((name, tuple(coeffs)) for name, coeffs in calibration.items())
+        )
+
+    def get_size(self, optree):
+        """ return the size parameter of the delay of @p optree """
+        if optree.__class__.__name__ == "Multiplication":
+            return get_bit_width(optree.get_input(0)) * get_bit_width(optree.get_input(1))
+        return max([get_bit_width(optree)] + [get_bit_width(op) for op in optree.get_inputs()])
+
+    def get_delay(self, optree):
+        """ return the estimated combinational delay of @p optree
+            (inputs excluded) """
+        if isinstance(optree, ML_LeafNode):
+            return 0.0
+        base, log_coeff = self.coeffs.get(optree.__class__.__name__, self.unknown_coeffs)
+        return base + log_coeff * math.log(max(self.get_size(optree), 2), 2)
+
+
+def get_bit_width(optree):
+    """ return the bit width of @p optree result (1 if undefined) """
+    try:
+        return optree.get_precision().get_bit_size()
+    except AttributeError:
+        return 1
+
+
+def get_topological_order(root_list):
+    """ return the list of nodes of the graphs of @p root_list, each node
+        appearing after its inputs (iterative traversal) """
+    node_list = []
+    visited = set()
+    stack = [(root, False) for root in reversed(root_list)]
+    while stack:
+        node, inputs_done = stack.pop()
+        if inputs_done:
+            node_list.append(node)
+        elif not node in visited:
+            visited.add(node)
+            stack.append((node, True))
+            if not isinstance(node, ML_LeafNode):
+                stack.extend((op, False) for op in reversed(node.get_inputs()) if not op in visited)
+    return node_list
+
+
+class StageSchedule(object):
+    """ result of a stage assignment: stage id and arrival time (delay
+        since the beginning of its stage) of each node """
+    def __init__(self):
+        self.stage_map = {}
+        self.arrival_map = {}
+
+    def get_stage_num(self):
+        return max(self.stage_map.values()) + 1 if self.stage_map else 1
+
+    def get_stage(self, node):
+        return self.stage_map[node]
+
+
+def schedule_nodes(node_list, delay_model, clock_period):
+    """ greedy as-soon-as-possible stage assignment: a node is placed in the
+        latest stage of its inputs unless its arrival time exceeds
+        @p clock_period, in which case a stage boundary is inserted before
+        it (its inputs are registered) """
+    schedule = StageSchedule()
+    for node in node_list:
+        if isinstance(node, ML_LeafNode):
+            schedule.stage_map[node] = 0
+            schedule.arrival_map[node] = 0.0
+            continue
+        inputs = node.get_inputs()
+        stage = max([schedule.stage_map[op] for op in inputs] + [0])
+        input_arrival = max(
+            [schedule.arrival_map[op] for op in inputs if schedule.stage_map[op] == stage] + [0.0]
+        )
+        delay = delay_model.get_delay(node)
+        arrival = input_arrival + delay
+        if arrival > clock_period and input_arrival > 0.0 and node_should_be_pipelined(node):
+            stage += 1
+            arrival = delay
+        if arrival > clock_period:
+            Log.report(
+                Log.Warning,
+                "estimated delay {:.3f} ns of {} exceeds clock period {} ns".format(
+                    delay, node.get_str(depth=1), clock_period))
+        schedule.stage_map[node] = stage
+        schedule.arrival_map[node] = arrival
+    return schedule
+
+
+def get_arrival_map(node_list, stage_of, delay_model):
+    """ return the map node -> arrival time (delay since the beginning of
+        its stage) for the stage assignment @p stage_of (node -> stage id)
+        of the topologically sorted @p node_list """
+    arrival_map = {}
+    for node in node_list:
+        if isinstance(node, ML_LeafNode):
+            arrival_map[node] = 0.0
+            continue
+        stage = stage_of(node)
+        input_arrival = max(
+            [arrival_map[op] for op in node.get_inputs() if stage_of(op) == stage] + [0.0]
+        )
+        arrival_map[node] = input_arrival + delay_model.get_delay(node)
+    return arrival_map
+
+
+def get_register_bits(node_list, stage_of):
+    """ return the map stage id -> number of register bits inserted
+        at the end of this stage (values crossing the stage boundary),
+        @p stage_of returning the stage id of a node """
+    last_use = {}
+    for node in node_list:
+        if isinstance(node, ML_LeafNode):
+            continue
+        stage = stage_of(node)
+        for op in node.get_inputs():
+            last_use[op] = max(last_use.get(op, stage), stage)
+    register_bits = {}
+    for op in last_use:
+        if not node_should_be_pipelined(op):
+            continue
+        for stage in range(stage_of(op), last_use[op]):
+            register_bits[stage] = register_bits.get(stage, 0) + get_bit_width(op)
+    return register_bits
+
+
+class Pass_TimingDrivenPipelining(OptreeOptimization):
+    """ Assign pipeline stages to an entity scheme from a delay model and a
+        target clock period. The stage count is the minimal one found by the
+        greedy ASAP assignment, stages are then balanced by looking for the
+        smallest period achieving this stage count. Finally stage boundaries
+        are moved to narrow pipeline registers, as long as the critical
+        stage delay is not worsened """
+    pass_tag = "timing_driven_pipelining"
+    ## default target clock period (ns)
+    default_clock_period = 10.0
+
+    def __init__(self, target, clock_period=None, delay_model=None):
+        OptreeOptimization.__init__(self, "timing_driven_pipelining", target)
+        self.clock_period = self.default_clock_period if clock_period is None else clock_period
+        self.delay_model = OperationDelayModel() if delay_model is None else delay_model
+
+    def get_output_values(self, optree):
+        """ return the list of output assignations of the entity scheme
+            @p optree """
+        if isinstance(optree, ReferenceAssign):
+            return [optree]
+        elif isinstance(optree, Statement):
+            return [op for op in optree.get_inputs() if isinstance(op, ReferenceAssign)]
+        return []
+
+    def balance_schedule(self, node_list, schedule, iteration_num=20):
+        """ bisect the smallest clock period which keeps the stage count
+            of @p schedule, so the critical delay is spread across stages """
+        stage_num = schedule.get_stage_num()
+        low = max([0.0] + [self.delay_model.get_delay(node) for node in node_list])
+        high = self.clock_period
+        best_schedule = schedule
+        for _ in range(iteration_num):
+            if high - low < 1e-3:
+                break
+            period = (low + high) / 2.0
+            candidate = schedule_nodes(node_list, self.delay_model, period)
+            if candidate.get_stage_num() <= stage_num:
+                best_schedule, high = candidate, period
+            else:
+                low = period
+        return best_schedule
+
+    def minimize_register_bits(self, node_list, schedule, iteration_num=100):
+        """ move single nodes of @p schedule to the previous or next stage
+            when it does not worsen the critical stage delay: among the
+            candidate cuts the one with the narrowest registers is kept,
+            until no move reduces the register bit count """
+        consumer_map = {}
+        for node in node_list:
+            if not isinstance(node, ML_LeafNode):
+                for op in node.get_inputs():
+                    consumer_map.setdefault(op, []).append(node)
+        stage_num = schedule.get_stage_num()
+        critical_delay = max([0.0] + list(schedule.arrival_map.values()))
+        stage_map = dict(schedule.stage_map)
+        def get_local_bits(node_set):
+            # register bits of the values of node_set
+            return sum(
+                get_bit_width(op) * max([0] + [stage_map[consumer] - stage_map[op] for consumer in consumer_map.get(op, [])])
+                for op in node_set if node_should_be_pipelined(op)
+            )
+        for _ in range(iteration_num):
+            candidate_list = []
+            for node in node_list:
+                if isinstance(node, ML_LeafNode):
+                    continue
+                stage = stage_map[node]
+                min_stage = max([stage_map[op] for op in node.get_inputs()] + [0])
+                max_stage = min([stage_map[consumer] for consumer in consumer_map.get(node, [])] + [stage_num - 1])
+                # inputs and the node itself are the only registered
+                # values whose width depends on the node stage
+                affected = set(node.get_inputs()) | set([node])
+                current_bits = get_local_bits(affected)
+                for new_stage in (stage - 1, stage + 1):
+                    if new_stage < min_stage or new_stage > max_stage:
+                        continue
+                    if new_stage > min_stage and not node_should_be_pipelined(node):
+                        # a stage can only start at a pipelinable node
+                        continue
+                    stage_map[node] = new_stage
+                    bit_delta = get_local_bits(affected) - current_bits
+                    stage_map[node] = stage
+                    if bit_delta < 0:
+                        candidate_list.append((bit_delta, len(candidate_list), node, new_stage))
+            moved = False
+            for _, _, node, new_stage in sorted(candidate_list, key=lambda candidate: candidate[:2]):
+                stage = stage_map[node]
+                stage_map[node] = new_stage
+                arrival_map = get_arrival_map(node_list, stage_map.__getitem__, self.delay_model)
+                if max([0.0] + list(arrival_map.values())) <= critical_delay:
+                    moved = True
+                    break
+                stage_map[node] = stage
+            if not moved:
+                break
+            Log.report(LOG_TIMING_PIPELINING, "moving {} to stage {}", node.get_tag() or node.__class__.__name__, new_stage)
+        if stage_map == schedule.stage_map:
+            return schedule
+        best_schedule = StageSchedule()
+        best_schedule.stage_map = stage_map
+        best_schedule.arrival_map = get_arrival_map(node_list, stage_map.__getitem__, self.delay_model)
+        return best_schedule
+
+    def get_report(self, node_list, schedule):
+        """ return a string describing per-stage delay and register bits """
+        register_bits = get_register_bits(node_list, schedule.get_stage)
+        lines = ["timing-driven pipelining: {} stage(s) for a {} ns clock period".format(
+            schedule.get_stage_num(), self.clock_period)]
+        for stage in range(schedule.get_stage_num()):
+            stage_delay = max(
+                [0.0] + [schedule.arrival_map[node] for node in node_list if schedule.stage_map[node] == stage])
+            lines.append("  stage {:>3}: delay {:7.3f} ns, register bits {:>6}".format(
+                stage, stage_delay, register_bits.get(stage, 0)))
+        lines.append("  total register bits: {}".format(sum(register_bits.values())))
+        return "\n".join(lines)
+
+    def execute(self, optree):
+        output_list = self.get_output_values(optree)
+        node_list = get_topological_order(output_list)
+        schedule = self.balance_schedule(
+            node_list, schedule_nodes(node_list, self.delay_model, self.clock_period))
+        schedule = self.minimize_register_bits(node_list, schedule)
+        for node in node_list:
+            node.attributes.init_stage = schedule.stage_map[node]
+        # output ports are defined at the stage of their value
+        for output_assign in output_list:
+            output_assign.get_input(0).attributes.init_stage = schedule.stage_map[output_assign]
+        Log.report(LOG_TIMING_PIPELINING, self.get_report(node_list, schedule))
+        self.schedule = schedule
+        return optree
+
+
+# register pass
+Log.report(
+    Log.Info,
+    "Registering {} pass".format(Pass_TimingDrivenPipelining.pass_tag)
+)
+Pass.register(Pass_TimingDrivenPipelining)
@@ -54,6 +54,8 @@ def insert_conversion_when_required(op_input, final_precision):
 ## Generic vector promotion pass
 class Pass_Vector_Promotion(OptreeOptimization):
   pass_tag = "vector_promotion"
+  rebuild_graph = True
+  parallel_safe = True
   ## Return the translation table of formats
   #  to be used for promotion
   def get_translation_table(self):
@@ -117,9 +119,10 @@ class Pass_Vector_Promotion(OptreeOptimization):
 
     support_status = self.target.is_supported_operation(optree, key_getter=key_getter)
     if not support_status:
-      Log.report(Log.Verbose, "not supported in vector_promotion: {}".format(optree.get_str(depth = 2, display_precision = True, memoization_map = {})))
-      op, formats, specifier = key_getter(None, optree)
-      Log.report(Log.Verbose, "with key: {}, {}, {}".format(str(op), [str(f) for f in formats], str(specifier)))
+      Log.report(Log.Verbose, lambda: "not supported in vector_promotion: {}".format(optree.get_str(depth = 2, display_precision = True, memoization_map = {})))
+      if Log.is_enabled(Log.Verbose):
+        op, formats, specifier = key_getter(None, optree)
+        Log.report(Log.Verbose, "with key: {}, {}, {}", op, [str(f) for f in formats], specifier)
     return support_status
 
   ## memoize converted     
@@ -71,6 +71,16 @@ ml_dd_t ml_mult_dd_d2(double x, double y) {
     return result;
 }
 
+ml_dd_t ml_mult_dd_d_dd(double x, ml_dd_t y) {
+    /** ml_dd_t * double -> ml_dd_t
+     *  exact product of the high parts, corrected by
+     *  the (rounded) product with the low part */
+    ml_dd_t t1 = ml_mult_dd_d2(x, y.hi);
+    double t2 = t1.lo + x * y.lo;
+
+    return ml_add_dd_d2_fast(t1.hi, t2);
+}
+
 ml_dd_t ml_add_dd_d2(double x, double y) {
     /* implementation of the 2sum algorithm */
     double s = x + y;
@@ -24,6 +24,10 @@ ml_ds_t ml_split_ds_s(float x);
  *  representation to store the result */
 ml_dd_t ml_mult_dd_d2(double x, double y);
 
+/** Compute an approximation of @p x * @p y, with y a double double
+ *  number, using a double double representation to store the result */
+ml_dd_t ml_mult_dd_d_dd(double x, ml_dd_t y);
+
 
 /** Compute the exact result a @p x + @p y, using a double double
  *  representation to store the result. This function uses 
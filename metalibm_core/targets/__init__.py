@@ -37,6 +37,27 @@ target_list = [possible_target for possible_target in os.listdir(targets_dirname
 
 __all__ = target_list
 
+# declaring target (and target specific pass) entry points: a target
+# module is only imported once the target is requested
+from metalibm_core.core.target import TargetRegister
+from metalibm_core.core.passes import Pass
+from metalibm_core.utility.entry_points import (
+    list_package_modules, scan_entry_points,
+    TARGET_NAME_REGEX, PASS_TAG_REGEX
+)
+
+## backends defined outside of the targets package
+BACKEND_MODULE_LIST = [
+    "metalibm_core.code_generation.vhdl_backend",
+    "metalibm_core.code_generation.mpfr_backend",
+]
+
+target_module_list = list_package_modules("metalibm_core.targets")
+for target_name, module_name in scan_entry_points(target_module_list + BACKEND_MODULE_LIST, TARGET_NAME_REGEX):
+    TargetRegister.register_lazy_target(target_name, module_name)
+for pass_tag, module_name in scan_entry_points(target_module_list, PASS_TAG_REGEX):
+    Pass.register_lazy(pass_tag, module_name)
+
 # listing submodule
 
 if __name__ == "__main__":
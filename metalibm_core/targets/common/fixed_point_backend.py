@@ -99,7 +99,7 @@ def mul_modifier(optree):
   tmp_conv = Multiplication(op0_conv, op1_conv, precision = get_std_integer_support_format(tmp_format), tag = optree.get_tag())
   tmp = TypeCast(tmp_conv, precision = tmp_format)
   result = Conversion(tmp, precision = optree_format)
-  Log.report(Log.Verbose, "result of mul_modifier on\n%s IS\n %s" % (optree.get_str(depth = 2, display_precision = True, memoization_map = {}), result.get_str(depth = 4, display_precision = True)))
+  Log.report(Log.Verbose, lambda: "result of mul_modifier on\n%s IS\n %s" % (optree.get_str(depth = 2, display_precision = True, memoization_map = {}), result.get_str(depth = 4, display_precision = True)))
 
   return result
 
@@ -145,7 +145,7 @@ def conv_modifier(optree):
       result = TypeCast(Conversion(in_s, precision = out_sformat), precision = out_format)
 
   result.set_tag(optree.get_tag())
-  Log.report(Log.Verbose, "result of conv_modifier on \n %s IS: \n  %s " % (optree.get_str(display_precision = True, depth = 3, memoization_map = {}), result.get_str(display_precision = True, depth = 4)))
+  Log.report(Log.Verbose, lambda: "result of conv_modifier on \n %s IS: \n  %s " % (optree.get_str(display_precision = True, depth = 3, memoization_map = {}), result.get_str(display_precision = True, depth = 4)))
   return result
 
 
@@ -166,7 +166,7 @@ def conv_from_fp_modifier(optree):
   scaling_input = NearestInteger(Multiplication(scaling_factor, op, precision = in_format), precision = out_sformat)
   result = TypeCast(scaling_input, precision = out_format)
 
-  Log.report(Log.Verbose, "result of conv_from_fp_modifier on %s IS\n %s " % (optree.get_str(display_precision = True, depth = 2, memoization_map = {}), result.get_str(display_precision = True, depth = 3)))
+  Log.report(Log.Verbose, lambda: "result of conv_from_fp_modifier on %s IS\n %s " % (optree.get_str(display_precision = True, depth = 2, memoization_map = {}), result.get_str(display_precision = True, depth = 3)))
   return result
 
 
@@ -183,7 +183,7 @@ def conv_fixed_to_fp_modifier(optree):
   scaled_factor = Constant(S2**-op.get_precision().get_frac_size(), precision = optree.get_precision())
   scaled_result = Multiplication(converted_input, scaled_factor, precision = optree.get_precision())
 
-  Log.report(Log.Verbose, "result of conv_fixed_to_fp_modifier on %s IS\n %s " % (optree.get_str(display_precision = True, depth = 2, memoization_map = {}), scaled_result.get_str(display_precision = True, depth = 3)))
+  Log.report(Log.Verbose, lambda: "result of conv_fixed_to_fp_modifier on %s IS\n %s " % (optree.get_str(display_precision = True, depth = 2, memoization_map = {}), scaled_result.get_str(display_precision = True, depth = 3)))
 
   return scaled_result
 
@@ -1220,7 +1220,7 @@ class VectorBackend(GenericProcessor):
     Log.report(Log.Verbose, "[VectorBackend] Tested architecture(s) for language %s:" % str(language))
     for parent_proc in self.parent_architecture:
       Log.report(Log.Verbose, "  %s " % parent_proc)
-    Log.report(Log.Error, "the following operation is not supported by %s: \n%s" % (self.__class__, optree.get_str(depth = 2, display_precision = True, memoization_map = {}))) 
+    Log.report(Log.Error, "the following operation is not supported by %s: \n%s" % (self.__class__, optree.get_str(depth = 2, display_precision = True, memoization_map = {})), error=UnsupportedOperationError)
 
 # debug message
 Log.report(LOG_BACKEND_INIT, "Initializing vector backend target")
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: design space exploration of meta-function parameters
+#              (e.g. table index width versus polynomial degree)
+###############################################################################
+
+import argparse
+import importlib
+import itertools
+import json
+import os
+import re
+import subprocess
+
+from metalibm_core.core.ml_operations import ML_LeafNode
+from metalibm_core.core.ml_table import ML_Table
+from metalibm_core.utility.log_report import Log, ML_Error
+from metalibm_core.utility.ml_template import precision_parser, target_instanciate
+
+
+## Log level for design space exploration reports
+LOG_DSE_INFO = Log.LogLevel("Info", "dse")
+
+## objectives (to be minimized) used to build the Pareto front
+DSE_OBJECTIVES = ["cpe", "table_bytes", "approx_error"]
+
+
+def get_table_list(optree, memoization_set=None):
+    """ return the list of distinct tables (ML_Table) appearing
+        in the graph of optree """
+    memoization_set = set() if memoization_set is None else memoization_set
+    if optree in memoization_set:
+        return []
+    memoization_set.add(optree)
+    if isinstance(optree, ML_Table):
+        return [optree]
+    elif isinstance(optree, ML_LeafNode):
+        return []
+    return sum([get_table_list(op, memoization_set) for op in optree.get_inputs()], [])
+
+
+def get_table_bytes(optree):
+    """ return the memory footprint (in bytes) of the tables
+        used by optree """
+    return sum(table.get_byte_size() for table in get_table_list(optree))
+
+
+def to_json_value(value):
+    """ convert a metric value to a JSON-compatible value """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def parse_bench_cpe(bench_output):
+    """ extract the CPE value printed by the generated bench wrapper
+        (see ML_FunctionBasis.generate_bench_wrapper) """
+    match = re.search(r"=> ([0-9.]+) CPE", bench_output)
+    return float(match.group(1)) if match else None
+
+
+def get_arg_description(arg_value):
+    """ return a string describing the meta-function argument
+        arg_value (targets are described by their name) """
+    target_name = getattr(arg_value, "target_name", None)
+    return target_name if target_name else str(arg_value)
+
+
+def get_point_key(point_params, config=None):
+    """ return the (string) cache key of an exploration point,
+        config describes the exploration configuration (meta-function
+        and base arguments) so that points measured for another
+        configuration are not re-used """
+    return json.dumps({"config": config, "params": point_params}, sort_keys=True)
+
+
+def get_objective_value(point, objective):
+    """ return the value of objective for point, a missing metric
+        (e.g. CPE of a point whose bench failed) is considered as +inf """
+    value = point.get(objective)
+    return float("inf") if value is None else value
+
+
+def is_dominated(point, other, objectives):
+    """ test if point is dominated by other (all objectives being
+        minimized) """
+    point_values = [get_objective_value(point, obj) for obj in objectives]
+    other_values = [get_objective_value(other, obj) for obj in objectives]
+    no_worse = all(o <= p for o, p in zip(other_values, point_values))
+    better = any(o < p for o, p in zip(other_values, point_values))
+    return no_worse and better
+
+
+def pareto_front(point_list, objectives=DSE_OBJECTIVES):
+    """ return the sub-list of non-dominated points of point_list,
+        missing metrics are considered as +inf (so a point without CPE
+        does not remove the CPE objective for the other points) """
+    return [
+        point for point in point_list
+        if not any(is_dominated(point, other, objectives) for other in point_list)
+    ]
+
+
+class ExplorationCache(object):
+    """ JSON file storing already explored points, so an exploration
+        can be resumed """
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.point_map = {}
+        if filename and os.path.exists(filename):
+            with open(filename, "r") as cache_stream:
+                self.point_map = json.load(cache_stream)
+
+    def __contains__(self, key):
+        return key in self.point_map
+
+    def __getitem__(self, key):
+        return self.point_map[key]
+
+    def add_point(self, key, point):
+        self.point_map[key] = point
+        self.save()
+
+    def save(self):
+        if self.filename:
+            with open(self.filename, "w") as cache_stream:
+                json.dump(self.point_map, cache_stream, indent=2, sort_keys=True)
+
+
+class DesignSpaceExplorer(object):
+    """ Sweep a meta-function parameter space (e.g. tbl_index_size),
+        generate and benchmark each candidate and report the
+        Pareto front of CPE versus table bytes versus accuracy """
+    def __init__(self, ctor, param_space, base_args=None, bench_test_number=1000,
+                 cache_file=None):
+        """
+            Args:
+                ctor (ML_FunctionBasis class): meta-function constructor
+                param_space (dict): parameter name -> list of values to be
+                                    explored (cartesian product is swept)
+                base_args (dict): arguments common to every point
+                bench_test_number (int): number of bench inputs
+                cache_file (str): JSON file used to store explored points
+        """
+        self.ctor = ctor
+        self.param_space = param_space
+        self.base_args = base_args or {}
+        self.bench_test_number = bench_test_number
+        self.cache = ExplorationCache(cache_file)
+        ## description of the configuration shared by every point
+        self.config = {
+            "function": "{}.{}".format(ctor.__module__, ctor.__name__),
+            "base_args": dict(
+                (name, get_arg_description(value)) for name, value in self.base_args.items()),
+            "bench_test_number": bench_test_number,
+        }
+
+    def get_point_param_list(self):
+        """ return the list of parameter dicts to be explored """
+        param_names = sorted(self.param_space.keys())
+        return [
+            dict(zip(param_names, values)) for values in
+            itertools.product(*(self.param_space[name] for name in param_names))
+        ]
+
+    def evaluate_point(self, point_params, point_id):
+        """ generate and bench the meta-function instance for point_params,
+            return the dict of metrics """
+        function_name = "{}_dse{}".format(self.ctor.get_name(), point_id)
+        arg_dict = dict(self.base_args)
+        arg_dict.update(point_params)
+        arg_dict.update({
+            "function_name": function_name,
+            "output_file": "{}.c".format(function_name),
+            "bench_test_number": self.bench_test_number,
+            "bench_execute": 0,
+        })
+        fct = self.ctor(self.ctor.get_default_args(**arg_dict))
+        fct.gen_implementation()
+
+        point = {"params": point_params}
+        point["table_bytes"] = get_table_bytes(fct.implementation.get_scheme())
+        for metric in fct.design_metrics:
+            point[metric] = to_json_value(fct.design_metrics[metric])
+        try:
+            bench_output = subprocess.check_output(
+                fct.get_bench_command(), shell=True, stderr=subprocess.STDOUT
+            ).decode("utf-8", "replace")
+            point["cpe"] = parse_bench_cpe(bench_output)
+        except subprocess.CalledProcessError as bench_error:
+            Log.report(Log.Warning, "bench failed for {}: {}".format(point_params, bench_error))
+            point["cpe"] = None
+        return point
+
+    def explore(self):
+        """ evaluate every point of the parameter space (re-using cached
+            points) and return the list of explored points.
+            A point whose generation fails is recorded with an "error"
+            entry (and is not cached, so it is retried on resume) """
+        point_list = []
+        for point_id, point_params in enumerate(self.get_point_param_list()):
+            key = get_point_key(point_params, self.config)
+            if key in self.cache:
+                Log.report(LOG_DSE_INFO, "re-using cached point {}".format(key))
+                point = self.cache[key]
+            else:
+                Log.report(LOG_DSE_INFO, "exploring point {}".format(key))
+                try:
+                    point = self.evaluate_point(point_params, point_id)
+                except ML_Error as error:
+                    Log.report(Log.Warning, "generation failed for {}: {}".format(
+                        point_params, error.__class__.__name__))
+                    point = {"params": point_params, "error": error.__class__.__name__}
+                else:
+                    self.cache.add_point(key, point)
+            point_list.append(point)
+        return point_list
+
+    @staticmethod
+    def get_report(point_list, front):
+        """ return a string table describing explored points, Pareto-optimal
+            points are flagged with '*' """
+        metric_names = sorted(set(
+            metric for point in point_list for metric in point
+            if metric != "params"
+        ))
+        lines = ["   {:<40} {}".format("params", " ".join("{:>14}".format(m) for m in metric_names))]
+        for point in point_list:
+            flag = "*" if point in front else " "
+            lines.append("{}  {:<40} {}".format(
+                flag, json.dumps(point["params"], sort_keys=True),
+                " ".join("{:>14}".format(str(point.get(m))) for m in metric_names)
+            ))
+        return "\n".join(lines)
+
+
+def parse_param_values(param_desc):
+    """ parse a "name=v0,v1,..." parameter sweep description """
+    name, values = param_desc.split("=")
+    return name, [int(v) for v in values.split(",")]
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(" Metalibm design space exploration")
+    arg_parser.add_argument(
+        "--function", dest="function", action="store", required=True,
+        help="meta-function to explore as module:class, e.g. "
+             "metalibm_functions.ml_vectorizable_log:ML_Log")
+    arg_parser.add_argument(
+        "--sweep", dest="sweep", action="append", type=parse_param_values,
+        required=True,
+        help="parameter sweep name=v0,v1,... (can be repeated)")
+    arg_parser.add_argument(
+        "--precision", dest="precision", type=precision_parser, default=None,
+        help="meta-function precision")
+    arg_parser.add_argument(
+        "--target", dest="target", type=target_instanciate, default=None,
+        help="meta-function target")
+    arg_parser.add_argument(
+        "--bench-test-number", dest="bench_test_number", type=int,
+        default=1000, help="number of bench inputs per point")
+    arg_parser.add_argument(
+        "--cache", dest="cache_file", action="store", default=None,
+        help="JSON file storing explored points (allows to resume a sweep)")
+    args = arg_parser.parse_args()
+
+    module_name, class_name = args.function.split(":")
+    ctor = getattr(importlib.import_module(module_name), class_name)
+    base_args = {}
+    if args.precision:
+        base_args["precision"] = args.precision
+    if args.target:
+        base_args["target"] = args.target
+
+    explorer = DesignSpaceExplorer(
+        ctor, dict(args.sweep), base_args=base_args,
+        bench_test_number=args.bench_test_number,
+        cache_file=args.cache_file
+    )
+    point_list = explorer.explore()
+    front = pareto_front([point for point in point_list if not "error" in point])
+    print(DesignSpaceExplorer.get_report(point_list, front))
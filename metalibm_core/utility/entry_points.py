@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: discovery of target and pass entry points from module
+#              sources, so that modules are only imported when selected
+###############################################################################
+
+import os
+import re
+
+## root directory of the metalibm_core package
+METALIBM_CORE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+## class attribute declaring the name of a target (see TargetRegister)
+TARGET_NAME_REGEX = re.compile(r"^\s+target_name\s*=\s*\"(\w+)\"", re.MULTILINE)
+## class attribute declaring the tag of a pass (see Pass.register)
+PASS_TAG_REGEX = re.compile(r"^\s+pass_tag\s*=\s*\"(\w+)\"", re.MULTILINE)
+
+
+def get_module_filename(module_name):
+    """ return the source file of metalibm_core module @p module_name
+        (e.g. metalibm_core.opt.p_size_datapath) without importing it """
+    return os.path.join(METALIBM_CORE_DIR, *module_name.split(".")[1:]) + ".py"
+
+
+def list_package_modules(package_name):
+    """ return the (recursive) list of modules of metalibm_core package
+        @p package_name, without importing them """
+    package_dir = os.path.join(METALIBM_CORE_DIR, *package_name.split(".")[1:])
+    module_list = []
+    for dirpath, dirnames, filenames in os.walk(package_dir):
+        dirnames[:] = sorted(dirname for dirname in dirnames if dirname != "__pycache__")
+        rel_path = os.path.relpath(dirpath, package_dir)
+        prefix = package_name if rel_path == "." else ".".join([package_name] + rel_path.split(os.sep))
+        module_list += [
+            "{}.{}".format(prefix, filename[:-3]) for filename in sorted(filenames)
+            if filename.endswith(".py") and filename != "__init__.py"
+        ]
+    return module_list
+
+
+def scan_entry_points(module_list, tag_regex):
+    """ return the list of pairs (tag, module name) for each tag
+        matched by @p tag_regex in the sources of @p module_list """
+    entry_list = []
+    for module_name in module_list:
+        with open(get_module_filename(module_name), "r") as module_stream:
+            module_source = module_stream.read()
+        entry_list += [(tag, module_name) for tag in tag_regex.findall(module_source)]
+    return entry_list
@@ -37,6 +37,8 @@ import sys
 
 import sollya
 
+from metalibm_core.utility.log_report import Log, ToolchainError
+
 def parse_gappa_interval(interval_value):
     # search for middle ","
     end_index = len(interval_value)
@@ -55,7 +57,12 @@ def execute_gappa_script_extract(gappa_code, gappa_filename = "gappa_tmp.g"):
     gappa_stream.write(gappa_code)
     gappa_stream.close()
     gappa_cmd = "gappa {}".format(gappa_filename)
-    cmd_result = subprocess.check_output(gappa_cmd, stderr=subprocess.STDOUT, shell=True)
+    try:
+        cmd_result = subprocess.check_output(gappa_cmd, stderr=subprocess.STDOUT, shell=True)
+    except subprocess.CalledProcessError as gappa_error:
+        Log.report(Log.Error, "gappa execution failed [{}]:\n{}".format(
+            gappa_error.returncode, gappa_error.output.decode("utf-8", "replace")),
+            error=ToolchainError)
     if sys.version_info >= (3, 0):
         gappa_result = str(cmd_result, 'utf-8')
     else:
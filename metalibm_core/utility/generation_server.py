@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: long-lived generation server, keeping targets and
+#              approximation caches warm across meta-function generations
+###############################################################################
+
+""" Generation server
+
+    Requests are JSON objects (one per line), received either on stdin
+    or on a Unix socket:
+        {"id": 0, "function": "metalibm_functions.ml_exp:ML_Exp",
+         "args": {"precision": "binary32", "target": "x86_avx2",
+                  "output_file": "exp_b32.c"}}
+    args are meta-function arguments (DefaultArgTemplate attribute names),
+    formats, targets, intervals, accuracies and language are given as
+    their command-line string description.
+    Each request is answered by a JSON line:
+        {"id": 0, "status": "ok", "time": 0.53, "output": "..."}
+    or, if generation failed:
+        {"id": 0, "status": "error", "error": "UnsupportedOperationError",
+         "message": "...", "time": 0.12, "output": "..."}
+    {"command": "quit"} stops the server.
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+try:
+    import socketserver
+except ImportError:
+    # python2
+    import SocketServer as socketserver
+
+try:
+    # python2: print writes byte strings, which io.StringIO rejects
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import sollya
+
+from metalibm_core.core.ml_operations import AbstractOperation
+from metalibm_core.core.ml_component_registry import COMPONENT_REGISTRY
+from metalibm_core.utility.log_report import Log, ML_Error
+from metalibm_core.utility.ml_template import (
+    precision_parser, format_list_parser, accuracy_parser, interval_parser,
+    language_parser, target_instanciate
+)
+
+
+## Log level for generation server reports
+LOG_SERVER_INFO = Log.LogLevel("Info", "server")
+
+
+def parse_format_list(value):
+    """ format list given either as a JSON list or as a comma separated
+        string """
+    if isinstance(value, list):
+        return [precision_parser(prec_str) for prec_str in value]
+    return format_list_parser(value)
+
+## conversion functions for the arguments whose JSON value is
+#  the command-line description
+ARG_PARSER_MAP = {
+    "precision": precision_parser,
+    "io_precision": precision_parser,
+    "input_precisions": parse_format_list,
+    "accuracy": accuracy_parser,
+    "input_interval": interval_parser,
+    "auto_test_range": interval_parser,
+    "bench_test_range": interval_parser,
+    "language": language_parser,
+}
+## arguments describing a target (instances are shared between requests)
+TARGET_ARG_LIST = ["target", "backend"]
+
+## types of JSON strings (unicode objects under python2)
+try:
+    STRING_TYPES = (str, unicode)
+except NameError:
+    STRING_TYPES = (str,)
+
+
+class RunState(object):
+    """ process-wide state which must not leak from one generation to the
+        next: log configuration, sollya settings, node numbering and
+        shared RTL components """
+    def __init__(self):
+        self.enabled_levels = list(Log.enabled_levels)
+        self.log_stream = Log.log_stream
+        self.json_stream = Log.json_stream
+        self.sollya_prec = sollya.settings.prec
+        self.sollya_points = sollya.settings.points
+        self.sollya_display = sollya.settings.display
+        self.global_index = AbstractOperation.global_index
+
+    def restore(self):
+        Log.enabled_levels = list(self.enabled_levels)
+        Log.update_enabled_sets()
+        Log.log_stream = self.log_stream
+        Log.json_stream = self.json_stream
+        sollya.settings.prec = self.sollya_prec
+        sollya.settings.points = self.sollya_points
+        sollya.settings.display = self.sollya_display
+        # every run numbers its nodes as a fresh process would
+        AbstractOperation.global_index = self.global_index
+        # registered components have been processed by (and belong to the
+        # component library of) the previous request only
+        COMPONENT_REGISTRY.reset()
+
+
+class GenerationServer(object):
+    """ Generate meta-functions on request, keeping imported modules,
+        target instances (and their dispatch indexes) and the fpminimax
+        cache between requests """
+    def __init__(self):
+        ## target name -> target instance
+        self.target_map = {}
+        ## "module:class" -> meta-function class
+        self.ctor_map = {}
+        ## state restored before each run, captured once warmed up
+        self.run_state = None
+
+    def get_target(self, target_name):
+        if not target_name in self.target_map:
+            self.target_map[target_name] = target_instanciate(target_name)
+        return self.target_map[target_name]
+
+    def get_ctor(self, function_desc):
+        """ return the meta-function class described by module:class """
+        if not function_desc in self.ctor_map:
+            module_name, class_name = function_desc.split(":")
+            self.ctor_map[function_desc] = getattr(importlib.import_module(module_name), class_name)
+        return self.ctor_map[function_desc]
+
+    def warm_up(self, function_list=(), target_list=()):
+        """ import meta-function modules and instanciate targets before
+            serving requests """
+        for function_desc in function_list:
+            self.get_ctor(function_desc)
+        for target_name in target_list:
+            self.get_target(target_name)
+        self.run_state = RunState()
+
+    def build_arg_dict(self, raw_args):
+        """ convert the JSON arguments of a request """
+        arg_dict = {}
+        for arg_name, value in raw_args.items():
+            if arg_name in TARGET_ARG_LIST and isinstance(value, STRING_TYPES):
+                value = self.get_target(str(value))
+            elif arg_name in ARG_PARSER_MAP and isinstance(value, STRING_TYPES + (list,)):
+                value = ARG_PARSER_MAP[arg_name](value)
+            arg_dict[arg_name] = value
+        return arg_dict
+
+    def generate(self, request):
+        """ execute the generation request @p request (dict) """
+        ctor = self.get_ctor(request["function"])
+        arg_dict = self.build_arg_dict(request.get("args", {}))
+        if "verbose" in request:
+            for level_str in request["verbose"].split(","):
+                level, _, sub_level = level_str.partition(":")
+                Log.enable_level(level, sub_level=sub_level or None)
+        fct = ctor(ctor.get_default_args(**arg_dict))
+        fct.gen_implementation()
+
+    def process_request(self, request):
+        """ process @p request and return the response dict """
+        if self.run_state is None:
+            self.run_state = RunState()
+        response = {"id": request.get("id")}
+        output = StringIO()
+        start_time = time.time()
+        stdout = sys.stdout
+        try:
+            sys.stdout = output
+            self.generate(request)
+            response["status"] = "ok"
+        except ML_Error as error:
+            response.update(status="error", error=error.__class__.__name__, message=str(error))
+        except Exception as error:
+            response.update(
+                status="error", error=error.__class__.__name__,
+                message=traceback.format_exc())
+        finally:
+            sys.stdout = stdout
+            self.run_state.restore()
+        response["time"] = time.time() - start_time
+        response["output"] = output.getvalue()
+        Log.report(LOG_SERVER_INFO, "request {} processed: {} ({:.3f}s)",
+                   response["id"], response["status"], response["time"])
+        return response
+
+    def serve_stream(self, in_stream, out_stream):
+        """ process JSON line requests from @p in_stream, until end of
+            stream or quit command, writing responses in @p out_stream.
+            Return False if a quit command was received """
+        for line in in_stream:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                response = {"id": None, "status": "error", "error": "ValueError", "message": str(error)}
+            else:
+                if request.get("command") == "quit":
+                    return False
+                response = self.process_request(request)
+            out_stream.write(json.dumps(response) + "\n")
+            out_stream.flush()
+        return True
+
+    def serve_stdio(self):
+        """ serve requests from stdin, responses are written on the
+            original stdout which is redirected to stderr so that external
+            tools (compiler, simulator) output does not corrupt them """
+        response_stream = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+        sys.stdout.flush()
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        self.serve_stream(sys.stdin, response_stream)
+
+    def serve_unix_socket(self, socket_path):
+        """ serve requests on the Unix socket @p socket_path, connections
+            are processed one at a time (generation state is process-wide) """
+        server = self
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                if sys.version_info >= (3, 0):
+                    in_stream = io.TextIOWrapper(self.rfile, encoding="utf-8")
+                    out_stream = io.TextIOWrapper(self.wfile, encoding="utf-8")
+                else:
+                    # python2 socket files already read and write str
+                    in_stream, out_stream = self.rfile, self.wfile
+                if not server.serve_stream(in_stream, out_stream):
+                    self.server.quit_requested = True
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        unix_server = socketserver.UnixStreamServer(socket_path, RequestHandler)
+        unix_server.quit_requested = False
+        try:
+            while not unix_server.quit_requested:
+                unix_server.handle_request()
+        finally:
+            unix_server.server_close()
+            os.remove(socket_path)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(" Metalibm generation server")
+    arg_parser.add_argument(
+        "--socket", dest="socket", action="store", default=None,
+        help="serve requests on the given Unix socket (default: stdin/stdout)")
+    arg_parser.add_argument(
+        "--warm-function", dest="warm_function_list", action="append",
+        default=[], help="meta-function (module:class) to import at startup")
+    arg_parser.add_argument(
+        "--warm-target", dest="warm_target_list", action="append",
+        default=[], help="target to instanciate at startup")
+    args = arg_parser.parse_args()
+
+    generation_server = GenerationServer()
+    generation_server.warm_up(args.warm_function_list, args.warm_target_list)
+    if args.socket:
+        generation_server.serve_unix_socket(args.socket)
+    else:
+        generation_server.serve_stdio()
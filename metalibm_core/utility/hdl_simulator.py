@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: HDL simulator abstraction used to elaborate and simulate
+#              generated RTL (and its auto-test testbench)
+###############################################################################
+
+import re
+import subprocess
+import time
+
+try:
+    from shutil import which
+except ImportError:
+    # python < 3.3
+    from distutils.spawn import find_executable as which
+
+from metalibm_core.utility.log_report import Log, ToolchainError
+
+## Log level for HDL simulator command and timing reports
+LOG_HDL_SIMULATOR = Log.LogLevel("Info", "hdl_simulator")
+
+## message of the assertion closing a successful auto-test testbench
+#  (see ML_EntityBasis.generate_auto_test)
+END_OF_TEST_MESSAGE = "end of test, no error encountered"
+
+
+class SimulationResult(object):
+    """ result of an HDL elaboration/simulation """
+    def __init__(self, success, stage_timing=None, error_list=None, output=""):
+        """
+            Args:
+                success (bool): overall result
+                stage_timing (list): list of (stage name, duration in seconds)
+                error_list (list): list of error / failed assertion messages
+                output (str): raw simulator output
+        """
+        self.success = success
+        self.stage_timing = stage_timing or []
+        self.error_list = error_list or []
+        self.output = output
+
+    def get_timing_report(self):
+        return ", ".join("{}: {:.2f}s".format(stage, duration) for stage, duration in self.stage_timing)
+
+    def __bool__(self):
+        return self.success
+    __nonzero__ = __bool__
+
+
+class HDLSimulator(object):
+    """ Generic HDL simulator: a sequence of analysis/elaboration stages
+        followed by a simulation stage whose output is parsed to extract
+        assertion results """
+    ## simulator name (used for command line selection)
+    name = None
+    ## executable whose presence indicates simulator availability
+    executable = None
+    ## regular expression matching failure/error messages in simulator
+    #  output, the message must be captured as first group
+    failure_regex = None
+
+    @classmethod
+    def is_available(cls):
+        return not which(cls.executable) is None
+
+    def get_elaboration_commands(self, vhdl_file_list, top_entity):
+        """ return the list of commands (each a list of arguments)
+            to analyze (in order) the files of @p vhdl_file_list and
+            elaborate @p top_entity """
+        raise NotImplementedError
+
+    def get_simulation_command(self, top_entity, stop_time, debug_file=None, exit_after_test=True):
+        """ return the command (list of arguments) simulating
+            @p top_entity for @p stop_time ns """
+        raise NotImplementedError
+
+    def run_stage(self, stage_name, cmd, stage_timing):
+        """ execute @p cmd, record its duration in @p stage_timing and
+            return the pair (return code, output) """
+        Log.report(LOG_HDL_SIMULATOR, "{} [{}]: {}".format(self.name, stage_name, " ".join(cmd)))
+        start_time = time.time()
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        raw_output, _ = process.communicate()
+        stage_timing.append((stage_name, time.time() - start_time))
+        output = raw_output.decode("utf-8", "replace")
+        Log.report(LOG_HDL_SIMULATOR, output)
+        return process.returncode, output
+
+    def elaborate(self, vhdl_file, top_entity, stage_timing=None):
+        """ analyze and elaborate @p vhdl_file (a file name or a list of
+            file names), return a SimulationResult """
+        stage_timing = [] if stage_timing is None else stage_timing
+        vhdl_file_list = [vhdl_file] if isinstance(vhdl_file, str) else list(vhdl_file)
+        for stage_name, cmd in self.get_elaboration_commands(vhdl_file_list, top_entity):
+            return_code, output = self.run_stage(stage_name, cmd, stage_timing)
+            if return_code:
+                return SimulationResult(
+                    False, stage_timing,
+                    ["{} failed [{}]".format(stage_name, return_code)], output)
+        return SimulationResult(True, stage_timing)
+
+    def parse_simulation_output(self, output):
+        """ return the pair (end of test reached, list of error messages)
+            extracted from simulation @p output """
+        end_of_test = False
+        error_list = []
+        for match in re.finditer(self.failure_regex, output, re.MULTILINE):
+            message = match.group(1).strip()
+            if END_OF_TEST_MESSAGE in message:
+                end_of_test = True
+            else:
+                error_list.append(message)
+        return end_of_test, error_list
+
+    def simulate(self, vhdl_file, top_entity, stop_time, debug_file=None, exit_after_test=True):
+        """ elaborate and simulate @p top_entity (auto-test testbench) for
+            @p stop_time ns, the simulation succeeds if the end of test
+            assertion is reached without any other error """
+        stage_timing = []
+        elab_result = self.elaborate(vhdl_file, top_entity, stage_timing)
+        if not elab_result:
+            return elab_result
+        cmd = self.get_simulation_command(top_entity, stop_time, debug_file, exit_after_test)
+        _, output = self.run_stage("simulation", cmd, stage_timing)
+        end_of_test, error_list = self.parse_simulation_output(output)
+        if not end_of_test and not error_list:
+            error_list.append("end of test not reached after {} ns".format(stop_time))
+        result = SimulationResult(end_of_test and not error_list, stage_timing, error_list, output)
+        Log.report(LOG_HDL_SIMULATOR, "{} timing: {}".format(self.name, result.get_timing_report()))
+        return result
+
+
+class ModelSimSimulator(HDLSimulator):
+    """ Mentor ModelSim/QuestaSim simulator """
+    name = "modelsim"
+    executable = "vsim"
+    failure_regex = r"^# \*\* (?:Failure|Error|Fatal): (.*)$"
+
+    def get_elaboration_commands(self, vhdl_file_list, top_entity):
+        return [
+            ("library", ["vlib", "work"]),
+            ("analysis", ["vcom", "-2008"] + vhdl_file_list),
+        ]
+
+    def get_simulation_command(self, top_entity, stop_time, debug_file=None, exit_after_test=True):
+        # debug cmd
+        debug_cmd = "do {debug_file};".format(debug_file=debug_file) if debug_file else ""
+        debug_cmd += " exit;" if exit_after_test else ""
+        return [
+            "vsim", "-c", "work.{}".format(top_entity),
+            "-do", "run {} ns; {}".format(stop_time, debug_cmd)
+        ]
+
+
+class GHDLSimulator(HDLSimulator):
+    """ GHDL open-source VHDL simulator """
+    name = "ghdl"
+    executable = "ghdl"
+    failure_regex = r"\((?:assertion|report) (?:failure|error)\): (.*)$"
+    ## VHDL-2008 with the (non-standard) synopsys packages
+    #  std_logic_arith / std_logic_misc used by generated designs
+    option_list = ["--std=08", "-fsynopsys"]
+
+    def get_elaboration_commands(self, vhdl_file_list, top_entity):
+        return [
+            ("analysis", ["ghdl", "-a"] + self.option_list + vhdl_file_list),
+            ("elaboration", ["ghdl", "-e"] + self.option_list + [top_entity]),
+        ]
+
+    def get_simulation_command(self, top_entity, stop_time, debug_file=None, exit_after_test=True):
+        if debug_file:
+            Log.report(Log.Warning, "debug file {} is not supported by ghdl simulator, ignoring it".format(debug_file))
+        return [
+            "ghdl", "-r"] + self.option_list + [top_entity,
+            "--stop-time={}ns".format(stop_time)
+        ]
+
+
+## map of simulator name -> simulator class
+HDL_SIMULATOR_MAP = {
+    ModelSimSimulator.name: ModelSimSimulator,
+    GHDLSimulator.name: GHDLSimulator,
+}
+
+
+def get_hdl_simulator(name=None):
+    """ instanciate HDL simulator @p name, if name is None the first
+        available simulator (ModelSim first, then GHDL) is selected """
+    if name is None:
+        for simulator_class in [ModelSimSimulator, GHDLSimulator]:
+            if simulator_class.is_available():
+                return simulator_class()
+        Log.report(Log.Error, "no HDL simulator available (tried: {})".format(", ".join(sorted(HDL_SIMULATOR_MAP))), error=ToolchainError)
+    elif not name in HDL_SIMULATOR_MAP:
+        Log.report(Log.Error, "unknown HDL simulator {}, available: {}".format(name, ", ".join(sorted(HDL_SIMULATOR_MAP))), error=ToolchainError)
+    return HDL_SIMULATOR_MAP[name]()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: generation of several meta-functions into a single
+#              compilation unit (shared tables and helpers) with
+#              a single header
+###############################################################################
+
+import argparse
+import importlib
+import os
+import subprocess
+
+from metalibm_core.core.passes import Pass
+from metalibm_core.code_generation.code_object import NestedCode
+from metalibm_core.code_generation.code_constant import C_Code
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.ml_template import precision_parser, target_instanciate
+
+
+## Log level for library generation reports
+LOG_LIBRARY_INFO = Log.LogLevel("Info", "library")
+
+
+class LibraryGenerator(object):
+    """ Generate a list of meta-functions into a shared compilation unit:
+        tables and externalized helpers are shared between functions,
+        support library headers are declared once and a single header
+        declaring every function is emitted """
+    def __init__(self, library_name, function_list, output_file=None,
+                 header_file=None, pre_gen_passes=("table_compression",),
+                 language=C_Code):
+        """
+            Args:
+                library_name (str): name of the library (used for symbol
+                                    uniquification and default file names)
+                function_list (list): pairs (meta-function constructor,
+                                      dict of arguments)
+                output_file (str): name of the generated source file
+                header_file (str): name of the generated header file
+                pre_gen_passes (list): tags of the passes executed on
+                                       every function, a single pass object
+                                       is shared by all the functions
+        """
+        self.library_name = library_name
+        self.function_list = function_list
+        self.output_file = output_file or "{}.c".format(library_name)
+        self.header_file = header_file or "{}.h".format(library_name)
+        self.pre_gen_passes = pre_gen_passes
+        self.language = language
+        ## shared compilation unit
+        self.code_object = None
+        ## list of pairs (meta-function, list of CodeFunction to be generated)
+        self.implementation_list = []
+        ## helper generated code -> first CodeFunction implementing it
+        self.helper_map = {}
+
+    def instanciate_function(self, ctor, arg_dict):
+        """ build the meta-function object for ctor with the library
+            common settings """
+        arg_dict = dict(arg_dict)
+        arg_dict.update({
+            "pre_gen_passes": [],
+            "auto_test": False,
+            "auto_test_execute": False,
+            "bench_test_number": 0,
+            "bench_execute": 0,
+        })
+        fct = ctor(ctor.get_default_args(**arg_dict))
+        if self.code_object is None:
+            self.code_object = NestedCode(
+                fct.C_code_generator, static_cst=True,
+                uniquifier="{}_".format(self.library_name)
+            )
+        # every function shares the library compilation unit
+        # (symbol names, tables and function declarations)
+        fct.set_main_code_object(self.code_object)
+        return fct
+
+    def get_helper_key(self, fct, code_function):
+        """ return a key identifying a helper function implementation:
+            its generated code where its name has been anonymized """
+        definition = code_function.get_definition(
+            fct.C_code_generator, self.language, static_cst=True)
+        code = definition.get(fct.C_code_generator, headers=False)
+        return code.replace(code_function.get_name(), "__helper__")
+
+    def share_helper(self, fct, code_function):
+        """ register helper @p code_function, return False if an identical
+            helper has already been generated (in which case calls
+            to @p code_function are redirected to it) """
+        helper_key = self.get_helper_key(fct, code_function)
+        if helper_key in self.helper_map:
+            shared_helper = self.helper_map[helper_key]
+            Log.report(
+                LOG_LIBRARY_INFO, "sharing helper {} with {}".format(
+                    code_function.get_name(), shared_helper.get_name()))
+            code_function.redirect_calls(shared_helper)
+            return False
+        self.helper_map[helper_key] = code_function
+        return True
+
+    def generate_implementations(self):
+        """ generate and optimize every meta-function of the library """
+        fct_list = [
+            self.instanciate_function(ctor, arg_dict) for ctor, arg_dict in self.function_list
+        ]
+        # a single pass object is used for the whole compilation unit
+        pre_gen_pass_list = [
+            (pass_tag, Pass.get_pass_by_tag(pass_tag)(fct_list[0].processor))
+            for pass_tag in self.pre_gen_passes
+        ]
+        for fct in fct_list:
+            Log.report(LOG_LIBRARY_INFO, "generating {}".format(fct.function_name))
+            code_function_list = fct.generate_implementation_list(pre_gen_pass_list)
+            if fct.check_processor_support:
+                for code_function in code_function_list:
+                    fct.opt_engine.check_processor_support(
+                        code_function.get_scheme(), language=self.language)
+            self.implementation_list.append((fct, code_function_list))
+
+    def generate_code(self):
+        """ generate the shared source file """
+        for fct, code_function_list in self.implementation_list:
+            # helpers (sub-functions) are listed before the main
+            # function which may call them
+            helper_list = [cf for cf in code_function_list if cf is not fct.implementation]
+            for code_function in helper_list:
+                if self.share_helper(fct, code_function):
+                    code_function.add_definition(
+                        fct.C_code_generator, self.language, self.code_object,
+                        static_cst=True)
+            if fct.implementation in code_function_list:
+                fct.implementation.add_definition(
+                    fct.C_code_generator, self.language, self.code_object,
+                    static_cst=True)
+            fct.add_default_headers(self.code_object)
+
+        code_generator = self.implementation_list[0][0].C_code_generator
+        Log.report(Log.Info, "Generating library source in {}".format(self.output_file))
+        with open(self.output_file, "w") as output_stream:
+            output_stream.write(self.code_object.get(code_generator))
+
+    def get_entry_point_list(self):
+        """ return the list of the library public functions """
+        return [
+            fct.implementation for fct, code_function_list in self.implementation_list
+            if fct.implementation in code_function_list
+        ]
+
+    def generate_header(self):
+        """ generate the library header declaring every entry point """
+        guard = "__{}_H__".format(
+            os.path.basename(self.header_file).replace(".", "_").upper())
+        header = "#ifndef {guard}\n#define {guard}\n\n#include <stdint.h>\n\n".format(guard=guard)
+        for code_function in self.get_entry_point_list():
+            header += code_function.get_declaration(final=True, language=self.language) + "\n"
+        header += "\n#endif /* {} */\n".format(guard)
+        Log.report(Log.Info, "Generating library header in {}".format(self.header_file))
+        with open(self.header_file, "w") as header_stream:
+            header_stream.write(header)
+
+    def build_library(self):
+        """ compile (without linking) the library source with the target
+            compiler, return True if the build succeeded """
+        processor = self.implementation_list[0][0].processor
+        object_file = os.path.splitext(self.output_file)[0] + ".o"
+        build_command = "{compiler} {options} -O2 -I$ML_SRC_DIR/metalibm_core -c {src_file} -o {object_file}".format(
+            compiler=processor.get_compiler(),
+            options=" ".join(processor.get_compilation_options()),
+            src_file=self.output_file, object_file=object_file)
+        Log.report(Log.Info, "Building library with command: {}".format(build_command))
+        build_result = subprocess.call(build_command, shell=True)
+        Log.report(Log.Info, "build result: {}".format(build_result))
+        return build_result == 0
+
+    def gen_library(self):
+        """ generate library source and header files """
+        self.generate_implementations()
+        self.generate_code()
+        self.generate_header()
+
+
+def parse_function_desc(function_desc):
+    """ parse a module:class meta-function description and return the
+        meta-function constructor """
+    module_name, class_name = function_desc.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(" Metalibm library generation")
+    arg_parser.add_argument(
+        "--name", dest="library_name", action="store", default="ml_lib",
+        help="library name")
+    arg_parser.add_argument(
+        "--functions", dest="function_list", required=True,
+        type=lambda s: [parse_function_desc(desc) for desc in s.split(",")],
+        help="comma separated list of meta-functions (module:class), e.g. "
+             "metalibm_functions.ml_exp:ML_Exponential,"
+             "metalibm_functions.ml_sinh:ML_HyperbolicSine")
+    arg_parser.add_argument(
+        "--precision", dest="precision", type=precision_parser, default=None,
+        help="precision of every function")
+    arg_parser.add_argument(
+        "--target", dest="target", type=target_instanciate, default=None,
+        help="library target")
+    arg_parser.add_argument(
+        "--output", dest="output_file", action="store", default=None,
+        help="library source file")
+    arg_parser.add_argument(
+        "--header", dest="header_file", action="store", default=None,
+        help="library header file")
+    arg_parser.add_argument(
+        "--pre-gen-pass", dest="pre_gen_passes", default=["table_compression"],
+        type=lambda s: s.split(","),
+        help="comma separated list of passes executed on every function")
+    arg_parser.add_argument(
+        "--build", dest="build_enable", action="store_const", const=True,
+        default=False, help="compile the generated library source")
+    args = arg_parser.parse_args()
+
+    base_args = {}
+    if args.precision:
+        base_args["precision"] = args.precision
+    if args.target:
+        base_args["target"] = args.target
+
+    library = LibraryGenerator(
+        args.library_name, [(ctor, base_args) for ctor in args.function_list],
+        output_file=args.output_file, header_file=args.header_file,
+        pre_gen_passes=args.pre_gen_passes
+    )
+    library.gen_library()
+    if args.build_enable and not library.build_library():
+        exit(1)
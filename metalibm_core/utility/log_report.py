@@ -26,20 +26,51 @@
 # SOFTWARE.
 ###############################################################################
 # created:          Dec 27th, 2013
-# last-modified:    Mar  7th, 2018
+# last-modified:    Oct 19th, 2026
 #
 # Author(s): Nicolas Brunie (nicolas.brunie@kalray.eu)
 ###############################################################################
 
 
-import sys
 import pdb
+import json
+import time
+
+
+class ML_Error(Exception):
+    """ base class of the exceptions raised when an Error level message
+        is reported (see Log.report) """
+    pass
+
+class UnsupportedOperationError(ML_Error):
+    """ operation not supported by the selected target """
+    pass
+
+class ApproximationError(ML_Error):
+    """ failure of a numerical approximation or of its error
+        evaluation (sollya, gappa) """
+    pass
+
+class VerificationError(ML_Error):
+    """ failure of a check on the generated design: pass invariant,
+        auto-test validation, RTL simulation """
+    pass
+
+class ToolchainError(ML_Error):
+    """ failure of an external tool (compiler, HDL simulator, gappa,
+        bench execution) """
+    pass
+
 
 class Log(object):
     """ log report class """
     log_stream     = None
+    ## stream receiving displayed messages as JSON lines
+    json_stream    = None
     dump_stdout    = False
-    ## abort execution when an Error level message is reported
+    ## exit silently (status 1) rather than displaying a traceback when an
+    #  ML_Error reaches the command-line entry point (see
+    #  ml_template.install_error_exit_hook). Log.report always raises.
     exit_on_error  = True
     ## Tribber PDB break when an Error level message is reported
     break_on_error = False
@@ -81,6 +112,10 @@ class Log(object):
         Error,
         # LogLevelFilter("Info", "passes")
     ]
+    ## enabled level names (every sub-level enabled) and enabled
+    #  (name, sub_level) pairs, resolved from enabled_levels
+    enabled_name_set = set(["Warning", "Error"])
+    enabled_pair_set = set()
 
     @staticmethod
     def filter_log_level(filter_list, log_level):
@@ -92,28 +127,86 @@ class Log(object):
         return False
 
     @staticmethod
-    def report(level, msg, eol = "\n"):
-        """ report log message """
+    def update_enabled_sets():
+        """ resolve enabled_levels into the sets used by is_enabled """
+        Log.enabled_name_set = set(
+            level.name for level in Log.enabled_levels if level.sub_level is None)
+        Log.enabled_pair_set = set(
+            (level.name, level.sub_level) for level in Log.enabled_levels
+            if not level.sub_level is None)
+
+    @staticmethod
+    def is_enabled(level):
+        """ test if messages of @p level are displayed, callers can use it
+            to guard expensive trace computations """
+        return level.name in Log.enabled_name_set or \
+               (level.name, level.sub_level) in Log.enabled_pair_set
+
+    @staticmethod
+    def build_message(msg, args, fields):
+        """ build the message string: @p msg is either a callable returning
+            the message or a format string completed with @p args and
+            @p fields (raw string if there are none) """
+        if callable(msg):
+            return msg()
+        elif args or fields:
+            return msg.format(*args, **fields)
+        return msg
+
+    @staticmethod
+    def report(level, msg, *args, **fields):
+        """ report log message
+
+            @p msg can be a string, a format string completed with
+            @p args and @p fields, or a callable returning the message.
+            Formatting and callable evaluation only occur if the message
+            is output, so disabled trace messages cost a set lookup.
+            @p fields are also stored in JSON records, the eol keyword
+            defines the end of line of log stream messages.
+            An Error level report raises an ML_Error exception, whose
+            class can be selected with the error keyword (e.g.
+            error=UnsupportedOperationError) """
+        eol = fields.pop("eol", "\n")
+        error = fields.pop("error", ML_Error)
+        displayed = Log.is_enabled(level)
+        if not (displayed or Log.log_stream or level is Log.Error):
+            return
+        msg = Log.build_message(msg, args, fields)
         if Log.log_stream:
             Log.log_stream.write(msg + eol)
             if Log.dump_stdout:
               print("%s: %s" % (level.name, msg))
-        elif Log.filter_log_level(Log.enabled_levels, level):
+        elif displayed:
             print("%s: %s" % (level.name, msg))
+        if displayed and Log.json_stream:
+            Log.write_json_record(level, msg, fields)
         if level is Log.Error:
             if Log.break_on_error:
               pdb.set_trace()
-              raise Exception()
-            elif Log.exit_on_error:
-              sys.exit(1)
-            else:
-              raise Exception()
+            raise error(msg)
+
+    @staticmethod
+    def write_json_record(level, msg, fields):
+        """ write a structured record (JSON line) in json_stream,
+            non-serializable field values are converted to strings """
+        record = {
+            "time": time.time(),
+            "level": level.name,
+            "sub_level": level.sub_level,
+            "message": msg,
+        }
+        if fields:
+            record["fields"] = fields
+        Log.json_stream.write(json.dumps(record, default=str) + "\n")
 
     ## enable display of the specific log level
-    #  @param level log-level to be enabled
+    #  @param level log-level (name or LogLevel object) to be enabled
     @staticmethod
     def enable_level(level, sub_level=None):
+      if isinstance(level, Log.LogLevel):
+        level, sub_level = level.name, level.sub_level if sub_level is None else sub_level
       Log.enabled_levels.append(Log.LogLevelFilter(level,sub_level))
+      Log.update_enabled_sets()
 
     ## disable display of the specific log level
     #  @param level log-level to be disabled
@@ -127,3 +220,9 @@ class Log(object):
     def set_log_stream(log_stream):
         Log.log_stream = log_stream
 
+    ## emit displayed messages as JSON lines in @p json_stream
+    #  (None to disable)
+    @staticmethod
+    def set_json_stream(json_stream):
+        Log.json_stream = json_stream
+
@@ -41,31 +41,24 @@ import traceback
 from sollya import Interval
 
 from .arg_utils import extract_option_value, test_flag_option
-from .log_report import Log
+from .log_report import Log, ML_Error
+from .hdl_simulator import HDL_SIMULATOR_MAP
 
 from ..core.ml_formats import *
 from ..core.precisions import *
 
 from ..code_generation.generic_processor import GenericProcessor
 from ..core.target import TargetRegister
-from ..targets import *
 from ..code_generation.code_constant import *
 from ..core.passes import Pass
 
 from ..core.ml_hdl_format import fixed_point
 
-from metalibm_core.code_generation.vhdl_backend import VHDLBackend
-
-# import optimization passes
-from metalibm_core.opt import *
-
-# populating target_map
-target_map = {}
-target_map["none"] = GenericProcessor
-for target_name in TargetRegister.target_map:
-    target_map[target_name] = TargetRegister.get_target_by_name(
-        target_name
-    )(None)
+# declaring target and optimization pass entry points, the
+# corresponding modules are only imported once selected
+# (e.g. through --target or --passes)
+import metalibm_core.targets
+import metalibm_core.opt
 
 
 precision_map = {
@@ -136,10 +129,30 @@ def interval_parser(interval_str):
 #  the string @p target_name
 def target_parser(target_name):
     """ string -> target conversion """
-    return target_map[target_name]
-# Instanciate a target object from its string description
+    if target_name == "none":
+        return GenericProcessor
+    return TargetRegister.get_target_by_name(target_name)(None)
+
+
+def get_target_name_list():
+    """ return the list of available target names """
+    return ["none"] + TargetRegister.get_target_names()
 
 
+class LazyTarget(object):
+    """ class attribute descriptor instanciating the target @p target_name
+        on first access (importing its module only if required) """
+    def __init__(self, target_name):
+        self.target_name = target_name
+        self.target_object = None
+
+    def __get__(self, obj, objtype=None):
+        if self.target_object is None:
+            self.target_object = target_instanciate(self.target_name)
+        return self.target_object
+
+
+# Instanciate a target object from its string description
 def target_instanciate(target_name):
     """ instanciate target object from target string 
         Args:
@@ -166,6 +179,22 @@ def language_parser(language_str):
     return language_map[language_str]
 
 
+def error_exit_hook(exc_type, exc_value, exc_traceback):
+    """ exception hook of the command-line entry point: an ML_Error has
+        already been reported by Log.report, so the program simply exits
+        with status 1, unless --exception-error was selected """
+    if issubclass(exc_type, ML_Error) and Log.exit_on_error:
+        sys.exit(1)
+    sys.__excepthook__(exc_type, exc_value, exc_traceback)
+
+def install_error_exit_hook():
+    """ Log.report(Log.Error, ...) raises an ML_Error so that library
+        users (batch generation, test runners) can catch it; the historic
+        exit-on-error behavior is restored here, at the command-line
+        boundary only """
+    sys.excepthook = error_exit_hook
+
+
 class ExceptionOnErrorAction(argparse.Action):
     """ Exception action for command-line argument """
     def __init__(self, option_strings, dest, nargs=None, **kwargs):
@@ -194,12 +223,25 @@ class VerboseAction(argparse.Action):
                 level, sub_level = level_str, None
             Log.enable_level(level, sub_level=sub_level)
 
+
+class LogJsonAction(argparse.Action):
+    """ redirect a copy of displayed log messages, as JSON lines, to
+        the file given as option value """
+    def __init__(self, option_strings, dest, nargs=None, **kwargs):
+        if nargs is not None:
+            raise ValueError("nargs not allowed")
+        super(LogJsonAction, self).__init__(option_strings, dest, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        Log.set_json_stream(open(values, "w"))
+        setattr(namespace, self.dest, values)
+
 # list the available targets
 
 
 def list_targets():
-    for target_name in target_map:
-        print("{}:\n  {}".format(target_name, target_map[target_name]))
+    for target_name in get_target_name_list():
+        print("{}:\n  {}".format(target_name, target_parser(target_name)))
 
 
 class TargetInfoAction(argparse.Action):
@@ -331,6 +373,20 @@ class DefaultArgTemplate:
     passes = []
     # built binary execution
     execute_trigger = False
+    # per-pass profiling (table display)
+    profile_passes = False
+    # per-pass profiling Chrome trace-event output file
+    profile_trace = None
+    # file receiving log messages as JSON lines
+    log_json = None
+    # graph invariant verification between passes
+    verify_passes = False
+    # number of processes executing a pass over independent graphs
+    pass_jobs = 1
+    # I.R snapshot saved just before code generation
+    save_snapshot = None
+    # I.R snapshot to resume code generation from
+    load_snapshot = None
 
     def __init__(self, **kw):
         for key in kw:
@@ -353,7 +409,7 @@ class DefaultEntityArgTemplate(DefaultArgTemplate):
     accuracy = ML_Faithful
     libm_compliant = True
     # Optimization parameters,
-    backend = VHDLBackend()
+    backend = LazyTarget("vhdl_backend")
     fuse_fma = None
     fast_path_extract = False
     # Debug verbosity,
@@ -370,6 +426,24 @@ class DefaultEntityArgTemplate(DefaultArgTemplate):
     build_enable = False
     # pipelined deisgn
     pipelined = False
+    # target clock period (ns) for automatic pipeline stage insertion
+    clock_period = None
+    # delay model calibration file (JSON)
+    delay_model_file = None
+    # file storing testbench stimulus (None for embedded test vectors)
+    tb_stimulus_file = None
+    # streaming testbench (back-to-back test vectors)
+    tb_streaming = False
+    # probability of bubble insertion in streaming testbench
+    tb_bubble_rate = 0.0
+    # seed of auto-test random generation (None for a random seed)
+    auto_test_seed = None
+    # HDL simulator (None for automatic selection)
+    hdl_simulator = None
+    # number of processes used for auto-test output emulation
+    emulation_jobs = 1
+    # shared VHDL file for registered sub-components
+    component_library = None
 
 
 
@@ -506,6 +580,10 @@ class ML_CommonArgTemplate(object):
             "--verbose", dest="verbose_enable", action=VerboseAction,
             const=True, default=default_arg.verbose_enable,
             help="enable Verbose log level")
+        self.parser.add_argument(
+            "--log-json", dest="log_json", action=LogJsonAction,
+            default=default_arg.log_json,
+            help="dump displayed log messages as JSON lines into the given file")
         self.parser.add_argument(
             "--target-info", dest="target_info_flag", action=TargetInfoAction,
             const=True, default=ArgDefault(False),
@@ -545,9 +623,42 @@ class ML_CommonArgTemplate(object):
             "--build", dest="build_enable", action="store_const",
             const=True, default=default_arg.build_enable,
             help="enable RTL elaboration")
+        # pass profiling
+        self.parser.add_argument(
+            "--profile-passes", dest="profile_passes", action="store_const",
+            const=True, default=default_arg.profile_passes,
+            help="measure time, memory and node count of each pass and "
+                 "display the resulting table")
+        self.parser.add_argument(
+            "--profile-trace", dest="profile_trace", action="store",
+            default=default_arg.profile_trace,
+            help="dump pass measurements as a Chrome trace-event JSON "
+                 "file (implies --profile-passes)")
+        self.parser.add_argument(
+            "--verify-passes", dest="verify_passes", action="store_const",
+            const=True, default=default_arg.verify_passes,
+            help="check graph invariants (defined inputs, acyclicity) "
+                 "after each scheduled pass (debug mode)")
+        self.parser.add_argument(
+            "--pass-jobs", dest="pass_jobs", action="store", type=int,
+            default=default_arg.pass_jobs,
+            help="number of processes used to execute a pass over "
+                 "independent entities/functions")
+        # I.R snapshots
+        self.parser.add_argument(
+            "--save-snapshot", dest="save_snapshot", action="store",
+            default=default_arg.save_snapshot,
+            help="save the optimized I.R in the given snapshot file "
+                 "just before code generation")
+        self.parser.add_argument(
+            "--load-snapshot", dest="load_snapshot", action="store",
+            default=default_arg.load_snapshot,
+            help="resume generation from the given snapshot file (scheme "
+                 "generation and optimization passes are skipped)")
 
     # Extract argument from the command-line (sys.argv)
     def arg_extraction(self):
+        install_error_exit_hook()
         self.args = self.parser.parse_args(sys.argv[1:])
         return self.args
 
@@ -600,6 +711,19 @@ class ML_EntityArgTemplate(ML_CommonArgTemplate):
             "--pipelined", dest = "pipelined",
             action = "store", help = "define the number of pipeline stages"
         )
+        self.parser.add_argument(
+            "--clock-period", dest="clock_period",
+            action="store", type=float,
+            default=default_arg.clock_period,
+            help="target clock period (ns): pipeline stages are inserted "
+                 "automatically from the delay model (requires --pipelined)"
+        )
+        self.parser.add_argument(
+            "--delay-model", dest="delay_model_file",
+            action="store", default=default_arg.delay_model_file,
+            help="JSON file calibrating the operation delay model used by "
+                 "--clock-period ({\"Addition\": [base, log2_coeff], ...})"
+        )
         self.parser.add_argument(
             "--no-exit",
             action="store_const",
@@ -608,6 +732,54 @@ class ML_EntityArgTemplate(ML_CommonArgTemplate):
             default=True,
             help="disable auto exit after functionnal test"
         )
+        self.parser.add_argument(
+            "--tb-stimulus-file", dest="tb_stimulus_file",
+            action="store", default=default_arg.tb_stimulus_file,
+            help="store testbench vectors in the given file, read by a "
+                 "std.textio loop, rather than embedding them in the testbench"
+        )
+        self.parser.add_argument(
+            "--tb-streaming", dest="tb_streaming",
+            action="store_const", const=True,
+            default=default_arg.tb_streaming,
+            help="drive a new test vector every clock cycle and check "
+                 "outputs stage_num cycles later"
+        )
+        self.parser.add_argument(
+            "--tb-bubble-rate", dest="tb_bubble_rate",
+            action="store", type=float,
+            default=default_arg.tb_bubble_rate,
+            help="probability of inserting a random bubble before each "
+                 "test vector in streaming testbench"
+        )
+        self.parser.add_argument(
+            "--auto-test-seed", dest="auto_test_seed",
+            action="store", type=int,
+            default=default_arg.auto_test_seed,
+            help="seed of auto-test vector and streaming bubble generation "
+                 "(default: random seed, reported in the log)"
+        )
+        self.parser.add_argument(
+            "--hdl-simulator", dest="hdl_simulator",
+            action="store", choices=sorted(HDL_SIMULATOR_MAP.keys()),
+            default=default_arg.hdl_simulator,
+            help="select the HDL simulator used for RTL elaboration and "
+                 "auto-test execution (default: first available)"
+        )
+        self.parser.add_argument(
+            "--emulation-jobs", dest="emulation_jobs",
+            action="store", type=int,
+            default=default_arg.emulation_jobs,
+            help="number of processes used to compute expected auto-test "
+                 "outputs (numeric emulation)"
+        )
+        self.parser.add_argument(
+            "--component-library", dest="component_library",
+            action="store", default=default_arg.component_library,
+            help="emit shared sub-component entities (e.g. leading zero "
+                 "counters) once in the given VHDL file rather than in "
+                 "each output file"
+        )
 
 # new argument template based on argparse module
 class ML_NewArgTemplate(ML_CommonArgTemplate):
@@ -653,6 +825,7 @@ class ML_ArgTemplate(object):
     # standard argument extraction from command line and storing,
     #  Plus standard argument help and default value declaration
     def sys_arg_extraction(self, parse_arg=None, exit_on_info=True, check=True):
+        install_error_exit_hook()
         # argument extraction
         parse_arg = self.parse_arg if parse_arg is None else parse_arg
         self.libm_compliant = test_flag_option(
@@ -749,7 +922,7 @@ class ML_ArgTemplate(object):
             Log.enable_level(Log.Verbose)
 
         self.accuracy = accuracy_value
-        self.target = target_map[target_name]()
+        self.target = target_parser(target_name)()
         self.precision = precision_map[precision_name]
         self.input_interval = input_interval
 
@@ -798,11 +971,11 @@ class ML_ArgTemplate(object):
                 sys.exit(0)
                 return None
         if target_info_flag:
-            spacew = max(len(v) for v in target_map)
-            for target_name in target_map:
+            spacew = max(len(v) for v in get_target_name_list())
+            for target_name in get_target_name_list():
                 print("%s: %s %s " % (
                     target_name, " " * (spacew - len(target_name)),
-                    target_map[target_name]
+                    target_parser(target_name)
                 ))
             if exit_on_info:
                 sys.exit(0)
@@ -810,5 +983,5 @@ class ML_ArgTemplate(object):
 
 
 if __name__ == "__main__":
-    for target_name in target_map:
-        print(target_name, ": ", target_map[target_name])
+    for target_name in get_target_name_list():
+        print(target_name, ": ", target_parser(target_name))
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: instrumentation of optimization passes and generation
+#              phases (wall time, cpu time, peak memory, node count)
+###############################################################################
+
+import json
+import os
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    # python2: allocation peaks are not measured
+    tracemalloc = None
+
+from metalibm_core.utility.log_report import Log
+
+
+## wall-clock and cpu time sources (python2 lacks perf_counter and
+#  process_time)
+if hasattr(time, "perf_counter"):
+    wall_clock = time.perf_counter
+    cpu_clock = time.process_time
+else:
+    wall_clock = time.time
+    cpu_clock = time.clock
+
+
+class AllocationTracker(object):
+    """ measure, with tracemalloc, the peak of python memory allocated
+        during each open section above the memory allocated when the
+        section was entered (nested sections are supported) """
+    def __init__(self):
+        ## open sections, innermost last
+        self.section_stack = []
+        self.owns_tracing = False
+
+    @staticmethod
+    def is_available():
+        return not tracemalloc is None
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.owns_tracing = True
+
+    def stop(self):
+        if self.owns_tracing:
+            tracemalloc.stop()
+            self.owns_tracing = False
+
+    def update_peaks(self):
+        """ fold the peak reached since last update into every open section
+            and restart peak measurement, return the current allocation """
+        current, peak = tracemalloc.get_traced_memory()
+        for section in self.section_stack:
+            section.allocation_peak = max(section.allocation_peak, peak)
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:
+            # python < 3.9: clearing traces also resets the peak, the
+            # peaks of successive intervals are accumulated (upper bound)
+            tracemalloc.clear_traces()
+            current = 0
+            for section in self.section_stack:
+                section.allocation_start -= section.allocation_peak
+                section.allocation_peak = 0
+        return current
+
+    def enter(self, section):
+        current = self.update_peaks()
+        section.allocation_start = current
+        section.allocation_peak = current
+        self.section_stack.append(section)
+
+    def exit(self, section):
+        """ return the allocation peak of @p section (in kB) """
+        self.update_peaks()
+        self.section_stack.remove(section)
+        return (section.allocation_peak - section.allocation_start) // 1024
+
+
+def count_nodes(value):
+    """ return the number of distinct operation nodes reachable from
+        @p value, which can be an operation graph, an object with a
+        get_scheme method (CodeFunction, CodeEntity) or a list of those """
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple)):
+        root_list = list(value)
+    else:
+        root_list = [value]
+    processed = set()
+    node_count = 0
+    while len(root_list) > 0:
+        node = root_list.pop()
+        if isinstance(node, (list, tuple)):
+            root_list.extend(node)
+            continue
+        if not hasattr(node, "get_inputs") and hasattr(node, "get_scheme"):
+            node = node.get_scheme()
+        if node is None or id(node) in processed:
+            continue
+        processed.add(id(node))
+        node_count += 1
+        if hasattr(node, "get_inputs"):
+            root_list.extend(node.get_inputs())
+    return node_count
+
+
+class ProfileRecord(object):
+    """ measurements of a single pass (or phase) execution """
+    def __init__(self, name, category, start, wall_time, cpu_time,
+                 allocation_peak, node_count_before, node_count_after, depth=0):
+        self.name = name
+        self.category = category
+        ## nesting depth (0 for sections which are not enclosed in
+        #  another section, e.g. a generation phase)
+        self.depth = depth
+        ## start date (in seconds, relative to profiler creation)
+        self.start = start
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        ## peak of python memory allocated during the section, above the
+        #  memory allocated when it started (in kB, None if not measured)
+        self.allocation_peak = allocation_peak
+        self.node_count_before = node_count_before
+        self.node_count_after = node_count_after
+
+    def get_trace_event(self, pid=0, tid=0):
+        """ return the Chrome trace "complete" event (dict) describing
+            @p self, dates are expressed in micro-seconds """
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start * 1e6,
+            "dur": self.wall_time * 1e6,
+            "pid": pid,
+            "tid": tid,
+            "args": {
+                "cpu_time_ms": self.cpu_time * 1e3,
+                "allocation_peak_kB": self.allocation_peak,
+                "nodes_before": self.node_count_before,
+                "nodes_after": self.node_count_after,
+            }
+        }
+
+
+class ProfileSection(object):
+    """ context manager measuring a pass (or phase) execution and
+        storing the result in its profiler """
+    def __init__(self, profiler, name, category, inputs):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.inputs = inputs
+        ## outputs of the section, used to count nodes after execution
+        #  (default to inputs for in-place passes)
+        self.outputs = inputs
+
+    def set_outputs(self, outputs):
+        self.outputs = outputs
+
+    def __enter__(self):
+        self.depth = self.profiler.depth
+        self.profiler.depth += 1
+        self.node_count_before = count_nodes(self.inputs)
+        if self.profiler.allocation_tracker:
+            self.profiler.allocation_tracker.enter(self)
+        self.cpu_start = cpu_clock()
+        self.wall_start = wall_clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall_time = wall_clock() - self.wall_start
+        cpu_time = cpu_clock() - self.cpu_start
+        allocation_peak = None
+        if self.profiler.allocation_tracker:
+            allocation_peak = self.profiler.allocation_tracker.exit(self)
+        self.profiler.depth -= 1
+        self.profiler.add_record(ProfileRecord(
+            self.name, self.category,
+            self.wall_start - self.profiler.origin,
+            wall_time, cpu_time, allocation_peak,
+            self.node_count_before, count_nodes(self.outputs),
+            depth=self.depth
+        ))
+        return False
+
+
+class NullSection(object):
+    """ no-op section returned by a disabled profiler """
+    def set_outputs(self, outputs):
+        pass
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+## shared no-op section
+NULL_SECTION = NullSection()
+
+
+class PassProfiler(object):
+    """ collect per-pass measurements and emit them as a text table
+        and as a Chrome trace-event file (chrome://tracing, Perfetto) """
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.record_list = []
+        ## number of currently open sections
+        self.depth = 0
+        ## date origin of the trace
+        self.origin = wall_clock() if enabled else 0
+        ## allocation peak measurement (None if disabled or unavailable)
+        self.allocation_tracker = None
+        if enabled and AllocationTracker.is_available():
+            self.allocation_tracker = AllocationTracker()
+            self.allocation_tracker.start()
+
+    def profile(self, name, category="pass", inputs=None):
+        """ return a context manager measuring the execution of the
+            pass/phase @p name applied to @p inputs """
+        if not self.enabled:
+            return NULL_SECTION
+        return ProfileSection(self, name, category, inputs)
+
+    def add_record(self, record):
+        self.record_list.append(record)
+
+    def get_report(self):
+        """ return a string table of the recorded measurements, the
+            entry with the largest wall time appears first. The total
+            only accounts for top-level sections (nested sections are
+            already included in their enclosing section) """
+        header = "{:<40} {:<10} {:>10} {:>10} {:>13} {:>10} {:>10}".format(
+            "pass", "category", "wall (ms)", "cpu (ms)", "alloc peak kB",
+            "nodes in", "nodes out"
+        )
+        lines = [header, "-" * len(header)]
+        for record in sorted(self.record_list, key=lambda r: r.wall_time, reverse=True):
+            lines.append("{:<40} {:<10} {:>10.2f} {:>10.2f} {:>13} {:>10} {:>10}".format(
+                record.name[:40], record.category,
+                record.wall_time * 1e3, record.cpu_time * 1e3,
+                "-" if record.allocation_peak is None else record.allocation_peak,
+                record.node_count_before,
+                record.node_count_after
+            ))
+        top_level_records = [r for r in self.record_list if r.depth == 0]
+        lines.append("{:<40} {:<10} {:>10.2f} {:>10.2f}".format(
+            "total", "", sum(r.wall_time for r in top_level_records) * 1e3,
+            sum(r.cpu_time for r in top_level_records) * 1e3
+        ))
+        return "\n".join(lines)
+
+    def get_trace(self):
+        """ return the Chrome trace-event object (dict) of the recorded
+            measurements """
+        pid = os.getpid()
+        return {
+            "traceEvents": [record.get_trace_event(pid=pid) for record in self.record_list],
+            "displayTimeUnit": "ms",
+        }
+
+    def dump_trace(self, filename):
+        """ write the Chrome trace-event JSON file @p filename """
+        with open(filename, "w") as trace_stream:
+            json.dump(self.get_trace(), trace_stream, indent=1)
+
+    def report(self, trace_file=None):
+        """ report the measurement table and dump the trace in
+            @p trace_file (if not None) """
+        if not self.enabled:
+            return
+        if self.allocation_tracker:
+            self.allocation_tracker.stop()
+        print("pass profile:\n{}".format(self.get_report()))
+        if trace_file:
+            Log.report(Log.Info, "writing pass profile trace in {}".format(trace_file))
+            self.dump_trace(trace_file)
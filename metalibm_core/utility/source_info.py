@@ -34,7 +34,6 @@
 ###############################################################################
 
 import os
-import sys
 import inspect
 
 class SourceInfo:
@@ -48,10 +47,13 @@ class SourceInfo:
 
     @staticmethod
     def retrieve_source_info(extra_depth=0):
-        current_frame = inspect.currentframe()
-        frame = inspect.getouterframes(current_frame)[2 + extra_depth]
-        frameinfo = frame # inspect.getframeinfo(frame)
-        if sys.version_info >= (3, 5):
-            return SourceInfo(frameinfo.filename, frameinfo.lineno)
-        else:
-            return SourceInfo(frameinfo[1], frameinfo[2])
+        """ return the source location of the caller of the function
+            calling retrieve_source_info (@p extra_depth frames further up).
+            The frame chain is walked directly: inspect.getouterframes
+            builds a record (reading source context lines) for every
+            frame of the stack, which is very expensive when called for
+            each operator of the backend tables """
+        frame = inspect.currentframe()
+        for _ in range(2 + extra_depth):
+            frame = frame.f_back
+        return SourceInfo(frame.f_code.co_filename, frame.f_lineno)
@@ -64,6 +64,9 @@ class ML_Cbrt(ML_Function("ml_cbrt")):
     ML_FunctionBasis.__init__(self, args) 
     # initializing accuracy property
     self.accuracy  = args.accuracy
+    # function specific arguments
+    self.tbl_index_size = args.tbl_index_size
+    self.num_iteration = args.num_iteration
 
 
   @staticmethod
@@ -75,7 +78,9 @@ class ML_Cbrt(ML_Function("ml_cbrt")):
         "function_name": "my_cbrt",
         "precision": ML_Binary32,
         "accuracy": ML_Faithful,
-        "target": GenericProcessor()
+        "target": GenericProcessor(),
+        "tbl_index_size": 6,
+        "num_iteration": 8,
     }
     default_args_cbrt.update(kw)
     return DefaultArgTemplate(**default_args_cbrt)
@@ -85,8 +90,9 @@ class ML_Cbrt(ML_Function("ml_cbrt")):
     vx = self.implementation.add_input_variable("x", self.precision) 
 
     # declaring approximation parameters
-    index_size = 6
-    num_iteration = 8
+    index_size = int(self.tbl_index_size)
+    num_iteration = int(self.num_iteration)
+    self.design_metrics["num_iteration"] = num_iteration
 
     Log.set_dump_stdout(True)
 
@@ -170,6 +176,15 @@ class ML_Cbrt(ML_Function("ml_cbrt")):
 
     current_approx = init_approx
 
+    # relative error of the mathematical scheme (evaluation rounding
+    # errors excluded): the table seed error is at most
+    # cbrt(1 + 2^-index_size) - 1 plus the table rounding, each Newton
+    # iteration maps a relative error e to 2e^2 + e^3
+    approx_error = cbrt(1 + S2**-index_size) - 1 + S2**-(self.precision.get_field_size() + 1)
+    for i in range(num_iteration):
+      approx_error = 2 * approx_error**2 + approx_error**3
+    self.design_metrics["approx_error"] = approx_error
+
     for i in range(num_iteration):
       #current_approx = cbrt_newton_iteration(current_approx, reduced_vx, inverse_red_vx) 
       current_approx = cbrt_newton_iteration(current_approx, vx, inverse_vx) 
@@ -213,6 +228,8 @@ class ML_Cbrt(ML_Function("ml_cbrt")):
 if __name__ == "__main__":
     # auto-test
     arg_template = ML_NewArgTemplate(default_arg=ML_Cbrt.get_default_args())
+    arg_template.get_parser().add_argument("--table-index-size", dest = "tbl_index_size", action = "store", default = 6, help = "table index size (default: 6)")
+    arg_template.get_parser().add_argument("--num-iteration", dest = "num_iteration", action = "store", default = 8, help = "number of Newton-Raphson iterations (default: 8)")
     # argument extraction 
     args = arg_template.arg_extraction()
 
@@ -49,8 +49,9 @@ from metalibm_core.code_generation.generic_processor import GenericProcessor
 from metalibm_core.core.ml_function import (
     ML_Function, ML_FunctionBasis, DefaultArgTemplate
 )
-from metalibm_core.core.polynomials import (
-    PolynomialSchemeEvaluator, Polynomial
+from metalibm_core.core.polynomials import Polynomial
+from metalibm_core.core.polynomial_scheme_selection import (
+    PolynomialSchemeSelector
 )
 from metalibm_core.code_generation.generator_utility import (
     FunctionOperator, FO_Arg
@@ -255,8 +256,13 @@ class ML_Exponential(ML_Function("ml_exp")):
 
         error_function = lambda p, f, ai, mod, t: dirtyinfnorm(f - p, ai)
 
-        polynomial_scheme_builder = PolynomialSchemeEvaluator.generate_estrin_scheme
-        #polynomial_scheme_builder = PolynomialSchemeEvaluator.generate_horner_scheme
+        # the evaluation scheme is selected among several candidates
+        # as the one with the lowest latency on the target which verifies
+        # the evaluation error budget
+        scheme_selector = PolynomialSchemeSelector(
+            self.processor,
+            scheme_optimizer=lambda scheme: self.optimise_scheme(scheme, copy={}, verbose=False)
+        )
 
         while 1:
             Log.report(Log.Info, "attempting poly degree: %d" % poly_degree)
@@ -268,22 +274,6 @@ class ML_Exponential(ML_Function("ml_exp")):
 
             Log.report(Log.Info, "poly approx error: %s" % poly_approx_error)
 
-            Log.report(Log.Info, "\033[33;1m generating polynomial evaluation scheme \033[0m")
-            pre_poly = polynomial_scheme_builder(poly_object, r, unified_precision = self.precision)
-            pre_poly.set_attributes(tag = "pre_poly", debug = debug_multi)
-
-            pre_sub_poly = polynomial_scheme_builder(sub_poly, r, unified_precision = self.precision)
-            pre_sub_poly.set_attributes(tag = "pre_sub_poly", debug = debug_multi)
-
-            poly = 1 + (exact_hi_part + (exact_lo_part + pre_sub_poly))
-            poly.set_tag("poly")
-
-            # optimizing poly before evaluation error computation
-            #opt_poly = self.opt_engine.optimization_process(poly, self.precision, fuse_fma = fuse_fma)
-            #opt_sub_poly = self.opt_engine.optimization_process(pre_sub_poly, self.precision, fuse_fma = fuse_fma)
-            opt_poly = self.optimise_scheme(poly)
-            opt_sub_poly = self.optimise_scheme(pre_sub_poly)
-
             # evaluating error of the polynomial approximation
             r_gappa_var        = Variable("r", precision = self.precision, interval = approx_interval)
             exact_hi_gappa_var = Variable("exact_hi", precision = self.precision, interval = exact_hi_interval)
@@ -307,6 +297,27 @@ class ML_Exponential(ML_Function("ml_exp")):
                 exact_lo_part.get_handle().get_node(): exact_lo_gappa_var,
             }
 
+            Log.report(Log.Info, "\033[33;1m generating polynomial evaluation scheme \033[0m")
+            if is_gappa_installed():
+                sub_poly_error_function = lambda scheme: self.gappa_engine.get_eval_error_v2(
+                    self.opt_engine, self.optimise_scheme(scheme, copy={}), sub_poly_error_copy_map,
+                    gappa_filename="%s_gappa_sub_poly_candidate.g" % self.function_name)
+            else:
+                sub_poly_error_function = None
+            pre_sub_poly = scheme_selector.select_scheme(
+                sub_poly, r, self.precision,
+                eval_error_function=sub_poly_error_function,
+                error_bound=error_goal_approx
+            )
+            pre_sub_poly.set_attributes(tag = "pre_sub_poly", debug = debug_multi)
+
+            poly = 1 + (exact_hi_part + (exact_lo_part + pre_sub_poly))
+            poly.set_tag("poly")
+
+            # optimizing poly before evaluation error computation
+            opt_poly = self.optimise_scheme(poly)
+            opt_sub_poly = self.optimise_scheme(pre_sub_poly)
+
 
             if is_gappa_installed():
                 sub_poly_eval_error = -1.0
@@ -354,6 +365,9 @@ class ML_Exponential(ML_Function("ml_exp")):
             else:
                 poly_degree += 1
 
+        self.design_metrics["poly_degree"] = int(poly_object.get_degree())
+        self.design_metrics["approx_error"] = poly_approx_error
+
         late_overflow_test = Comparison(
             ik, self.precision.get_emax(),
             specifier=Comparison.Greater, likely=False,
@@ -209,6 +209,9 @@ class ML_Log(ML_Function("ml_log")):
         poly_degree = sup(guessdegree(log(1+sollya.x)/sollya.x, approx_interval, S2**-(self.precision.get_field_size()+1))) + 1
         global_poly_object = Polynomial.build_from_approximation(log(1+sollya.x)/sollya.x, poly_degree, [1] + [self.precision]*(poly_degree), approx_interval, sollya.absolute)
         poly_object = global_poly_object.sub_poly(start_index = 1)
+        self.design_metrics["poly_degree"] = int(poly_degree)
+        self.design_metrics["approx_error"] = sollya.dirtyinfnorm(
+            log(1+sollya.x) - sollya.x * global_poly_object.get_sollya_object(), approx_interval)
 
         Log.report(Log.Verbose, "generating polynomial evaluation scheme")
         #_poly = PolynomialSchemeEvaluator.generate_horner_scheme(poly_object, _red_vx, unified_precision = self.precision)
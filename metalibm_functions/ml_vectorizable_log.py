@@ -448,6 +448,9 @@ class ML_Log(ML_Function("ml_log")):
             0 + sollya._x_) # Force the first 2 coefficients to 0 and 1, resp.
 
     print(poly_object)
+    self.design_metrics["poly_degree"] = int(poly_degree)
+    self.design_metrics["approx_error"] = sollya.dirtyinfnorm(
+            sollya_function - poly_object.get_sollya_object(), approx_interval)
 
     constant_precision = ML_SingleSingle if self.precision == ML_Binary32 \
             else ML_DoubleDouble if self.precision == ML_Binary64 \
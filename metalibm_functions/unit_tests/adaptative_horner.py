@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# last-modified:    Oct 19th, 2026
+###############################################################################
+import math
+
+import sollya
+
+from sollya import S2, Interval
+
+from metalibm_core.core.ml_function import ML_Function, ML_FunctionBasis
+
+from metalibm_core.core.ml_operations import *
+from metalibm_core.core.ml_formats import *
+
+from metalibm_core.code_generation.generic_processor import GenericProcessor
+from metalibm_core.core.polynomials import Polynomial, PolynomialSchemeEvaluator
+
+from metalibm_core.utility.ml_template import *
+from metalibm_core.utility.log_report import Log
+from metalibm_core.utility.gappa_utils import is_gappa_installed
+
+
+def count_precision_operations(optree, precision, memoization_set=None):
+  """ count the number of distinct arithmetic nodes whose format
+      is precision in the graph of optree """
+  memoization_set = set() if memoization_set is None else memoization_set
+  if optree in memoization_set or isinstance(optree, ML_LeafNode):
+    return 0
+  memoization_set.add(optree)
+  local_count = 1 if optree.get_precision() is precision else 0
+  return local_count + sum(
+    count_precision_operations(op, precision, memoization_set) for op in optree.get_inputs()
+  )
+
+
+class ML_UT_AdaptativeHorner(ML_Function("ml_ut_adaptative_horner")):
+  """ Unit-test for the adaptative precision Horner scheme: on exp- and
+      log1p-style approximations the adaptative scheme must use fewer
+      double-double operations than a full double-double Horner scheme """
+  def __init__(self, args=DefaultArgTemplate):
+    # initializing base class
+    ML_FunctionBasis.__init__(self, args)
+    # expm1-style polynomial (Taylor coefficients)
+    self.exp_coeff_list = [sollya.SollyaObject(1) / math.factorial(k) for k in range(12)]
+    # log1p-style polynomial
+    self.log1p_coeff_list = [0] + [sollya.SollyaObject((-1)**(k+1)) / k for k in range(1, 12)]
+
+  @staticmethod
+  def get_default_args(**kw):
+    """ Return a structure containing the arguments for current class,
+        builtin from a default argument mapping overloaded with @p kw """
+    default_args = {
+        "output_file": "ut_adaptative_horner.c",
+        "function_name": "ut_adaptative_horner",
+        "precision": ML_Binary64,
+        "auto_test_range": Interval(-2**-5, 2**-5),
+        "target": GenericProcessor()
+    }
+    default_args.update(kw)
+    return DefaultArgTemplate(**default_args)
+
+  def check_adaptative_scheme(self, name, coeff_list, vx, error_constraint):
+    """ build full double-double and adaptative schemes for coeff_list
+        and check the adaptative one requires fewer double-double
+        operations for the same error constraint """
+    poly_object = Polynomial(dict((i, c) for i, c in enumerate(coeff_list) if c != 0))
+    full_dd_scheme = PolynomialSchemeEvaluator.generate_horner_scheme(
+      poly_object, vx, unified_precision = ML_DoubleDouble,
+    )
+    if is_gappa_installed():
+      gappa_vx = Variable("x", precision = self.precision, interval = vx.get_interval())
+      eval_error_function = lambda scheme: self.gappa_engine.get_eval_error_v2(
+        self.opt_engine, scheme, {vx: gappa_vx},
+        gappa_filename = "ut_adaptative_horner_{}.g".format(name))
+    else:
+      Log.report(Log.Warning, "gappa is not installed in this environnement")
+      eval_error_function = None
+    adaptative_scheme = PolynomialSchemeEvaluator.generate_adaptative_horner_scheme(
+      poly_object, vx, error_constraint,
+      out_precision = ML_DoubleDouble, start_precision = self.precision,
+      eval_error_function = eval_error_function
+    )
+    full_dd_count = count_precision_operations(full_dd_scheme, ML_DoubleDouble)
+    adaptative_dd_count = count_precision_operations(adaptative_scheme, ML_DoubleDouble)
+    Log.report(
+      Log.Info,
+      "{}: {} double-double operation(s) for full scheme, {} for adaptative scheme".format(
+        name, full_dd_count, adaptative_dd_count))
+    if adaptative_dd_count >= full_dd_count:
+      Log.report(Log.Error, "adaptative horner scheme does not reduce the number of double-double operations for {}".format(name))
+    return adaptative_scheme
+
+  def generate_scheme(self):
+    vx = self.implementation.add_input_variable("x", self.precision, interval = self.auto_test_range)
+    error_constraint = S2**-90
+
+    exp_scheme = self.check_adaptative_scheme("exp", self.exp_coeff_list, vx, error_constraint)
+    log1p_scheme = self.check_adaptative_scheme("log1p", self.log1p_coeff_list, vx, error_constraint)
+
+    result = Conversion(
+      Addition(exp_scheme, log1p_scheme, precision = ML_DoubleDouble),
+      precision = self.precision
+    )
+    return Statement(Return(result, precision = self.precision))
+
+  def numeric_emulate(self, input_value):
+    return sum(
+      (ce + cl) * input_value**i for i, (ce, cl) in
+      enumerate(zip(self.exp_coeff_list, self.log1p_coeff_list))
+    )
+
+
+def run_test(args):
+  ml_ut_adaptative_horner = ML_UT_AdaptativeHorner(args)
+  ml_ut_adaptative_horner.gen_implementation()
+  return True
+
+if __name__ == "__main__":
+  # auto-test
+  arg_template = ML_NewArgTemplate(default_args=ML_UT_AdaptativeHorner.get_default_args())
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: design space exploration helpers (Pareto front, point
+#              keys and resumable exploration cache)
+###############################################################################
+import os
+import tempfile
+
+from metalibm_core.utility.design_space_exploration import (
+  pareto_front, get_point_key, ExplorationCache, DesignSpaceExplorer
+)
+from metalibm_core.utility.ml_template import *
+from metalibm_core.utility.log_report import Log
+
+from metalibm_functions.ml_exp import ML_Exponential
+
+
+def check_pareto_front():
+  """ a point without CPE (failed bench) must not remove the CPE
+      objective for the other points """
+  fast = {"params": {"d": 0}, "cpe": 10.0, "table_bytes": 64, "approx_error": 1e-8}
+  slow = {"params": {"d": 1}, "cpe": 20.0, "table_bytes": 64, "approx_error": 1e-8}
+  small = {"params": {"d": 2}, "cpe": 30.0, "table_bytes": 16, "approx_error": 1e-8}
+  no_bench = {"params": {"d": 3}, "cpe": None, "table_bytes": 64, "approx_error": 1e-8}
+  no_accuracy = {"params": {"d": 4}, "cpe": 10.0, "table_bytes": 32}
+  front = pareto_front([fast, slow, small, no_bench, no_accuracy])
+  expected = [fast, small, no_accuracy]
+  if front != expected:
+    Log.report(Log.Error, "unexpected pareto front {}, expected {}",
+               [point["params"] for point in front], [point["params"] for point in expected])
+
+
+def check_point_key():
+  """ point keys must not depend on dict ordering and must depend on the
+      exploration configuration """
+  config = {"function": "ml_exp", "bench_test_number": 10}
+  key = get_point_key({"a": 1, "b": 2}, config)
+  if key != get_point_key({"b": 2, "a": 1}, dict(reversed(list(config.items())))):
+    Log.report(Log.Error, "point key depends on parameter order")
+  if key == get_point_key({"a": 1, "b": 2}, dict(config, bench_test_number=20)):
+    Log.report(Log.Error, "point key does not depend on configuration")
+  if key == get_point_key({"a": 1, "b": 3}, config):
+    Log.report(Log.Error, "point key does not depend on parameters")
+
+
+class CountingExplorer(DesignSpaceExplorer):
+  """ explorer recording evaluated points instead of generating them """
+  def __init__(self, *args, **kw):
+    DesignSpaceExplorer.__init__(self, *args, **kw)
+    self.evaluated = []
+
+  def evaluate_point(self, point_params, point_id):
+    self.evaluated.append(point_params)
+    return {"params": point_params, "cpe": 1.0 + point_params["poly_degree"]}
+
+
+def check_exploration_resume():
+  """ points explored by a first explorer are re-used (and not evaluated
+      again) by a second explorer sharing its cache file """
+  cache_fd, cache_file = tempfile.mkstemp(suffix=".json")
+  os.close(cache_fd)
+  os.remove(cache_file)
+  try:
+    first = CountingExplorer(ML_Exponential, {"poly_degree": [3, 4]}, cache_file=cache_file)
+    first_points = first.explore()
+    if not os.path.exists(cache_file) or len(ExplorationCache(cache_file).point_map) != 2:
+      Log.report(Log.Error, "explored points not stored in cache {}", cache_file)
+    second = CountingExplorer(ML_Exponential, {"poly_degree": [3, 4, 5]}, cache_file=cache_file)
+    second_points = second.explore()
+    if second.evaluated != [{"poly_degree": 5}] or second_points[:2] != first_points:
+      Log.report(Log.Error, "cached points not re-used on resume, evaluated: {}", second.evaluated)
+    other_config = CountingExplorer(ML_Exponential, {"poly_degree": [3]}, bench_test_number=10, cache_file=cache_file)
+    other_config.explore()
+    if other_config.evaluated != [{"poly_degree": 3}]:
+      Log.report(Log.Error, "point re-used for another exploration configuration")
+  finally:
+    if os.path.exists(cache_file):
+      os.remove(cache_file)
+
+
+def run_test(args):
+  check_pareto_front()
+  check_point_key()
+  check_exploration_resume()
+  return True
+
+if __name__ == "__main__":
+  arg_template = ML_NewArgTemplate(default_args=DefaultArgTemplate())
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
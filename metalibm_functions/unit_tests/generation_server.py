@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: batch of generation requests processed by a single
+#              generation server
+###############################################################################
+import os
+import subprocess
+import sys
+import time
+
+from metalibm_core.core.ml_operations import AbstractOperation
+from metalibm_core.core.ml_component_registry import COMPONENT_REGISTRY
+
+from metalibm_core.utility.generation_server import GenerationServer
+from metalibm_core.utility.ml_template import *
+from metalibm_core.utility.log_report import Log
+
+
+UT_FUNCTION = "metalibm_functions.unit_tests.new_arg_template:ML_UT_NewArgTemplate"
+## script generating UT_FUNCTION in a fresh process
+UT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "new_arg_template.py")
+
+
+def get_cold_generation_time():
+  """ return the duration of the generation of UT_FUNCTION in a fresh
+      process (interpreter startup, imports and target instanciation
+      included) """
+  start_time = time.time()
+  status = subprocess.call(
+    [sys.executable, UT_SCRIPT, "--precision", "binary32", "--target", "none",
+     "--output", "ut_gen_server_cold.c"],
+    stdout=open(os.devnull, "w"))
+  if status != 0:
+    Log.report(Log.Error, "cold generation of {} failed", UT_SCRIPT)
+  return time.time() - start_time
+
+
+def run_test(args):
+  server = GenerationServer()
+  server.warm_up([UT_FUNCTION], ["none"])
+  start_index = AbstractOperation.global_index
+  request_list = [
+    {"id": 0, "function": UT_FUNCTION,
+     "args": {"precision": "binary32", "target": "none", "output_file": "ut_gen_server_b32.c"}},
+    {"id": 1, "function": UT_FUNCTION,
+     "args": {"precision": "binary64", "target": "none", "output_file": "ut_gen_server_b64.c"}},
+    # failing request must not stop the server
+    {"id": 2, "function": "metalibm_functions.unit_tests.new_arg_template:ML_UT_Undefined"},
+    {"id": 3, "function": UT_FUNCTION,
+     "args": {"precision": "binary32", "target": "none", "output_file": "ut_gen_server_b32.c"}},
+  ]
+  expected_status = ["ok", "ok", "error", "ok"]
+  warm_time_list = []
+  for request, status in zip(request_list, expected_status):
+    response = server.process_request(request)
+    if response["status"] == "ok":
+      warm_time_list.append(response["time"])
+    Log.report(Log.Info, "response: {}", response)
+    if response["status"] != status:
+      Log.report(Log.Error, "unexpected status for request {}: {}", request["id"], response)
+    # per-run state isolation
+    if AbstractOperation.global_index != start_index:
+      Log.report(Log.Error, "node numbering not restored after request {}", request["id"])
+    if len(COMPONENT_REGISTRY.get_component_list()) > 0:
+      Log.report(Log.Error, "component registry not reset after request {}", request["id"])
+  # throughput: a warm request must be much cheaper than a fresh process
+  cold_time = get_cold_generation_time()
+  warm_time = sum(warm_time_list) / len(warm_time_list)
+  Log.report(Log.Info, "cold generation {:.3f}s, warm request {:.3f}s (speed-up {:.1f}x)",
+             cold_time, warm_time, cold_time / warm_time)
+  return warm_time < cold_time
+
+if __name__ == "__main__":
+  arg_template = ML_NewArgTemplate(default_args=DefaultArgTemplate)
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: I.R snapshot save / load round-trip
+###############################################################################
+from sollya import Interval
+
+from metalibm_core.core.ml_function import ML_Function, ML_FunctionBasis
+
+from metalibm_core.core.ml_operations import *
+from metalibm_core.core.ml_formats import *
+from metalibm_core.core.ml_table import ML_NewTable
+
+from metalibm_core.code_generation.generic_processor import GenericProcessor
+
+from metalibm_core.utility.ml_template import *
+
+
+## coefficient table of the unit test
+TABLE = [1.0 / (i + 1) for i in range(8)]
+
+
+class ML_UT_IRSnapshot(ML_Function("ml_ut_ir_snapshot")):
+  def __init__(self, args=DefaultArgTemplate):
+    # initializing base class
+    ML_FunctionBasis.__init__(self, args)
+
+  @staticmethod
+  def get_default_args(**kw):
+    """ Return a structure containing the arguments for current class,
+        builtin from a default argument mapping overloaded with @p kw """
+    default_args = {
+        "output_file": "ut_ir_snapshot.c",
+        "function_name": "ut_ir_snapshot",
+        "precision": ML_Binary32,
+        "target": GenericProcessor(),
+        "auto_test_range": Interval(0, 100),
+        "save_snapshot": "ut_ir_snapshot.mlsnap",
+    }
+    default_args.update(kw)
+    return DefaultArgTemplate(**default_args)
+
+  def generate_scheme(self):
+    vx = self.implementation.add_input_variable("x", self.precision)
+    table = ML_NewTable(dimensions=[len(TABLE)], storage_precision=self.precision,
+                        init_data=TABLE, tag="coeff_table")
+    index = Modulo(
+      Conversion(vx, precision=ML_Int32),
+      Constant(len(TABLE), precision=ML_Int32),
+      precision=ML_Int32
+    )
+    result = vx * TableLoad(table, index, precision=self.precision) + Constant(0.1, precision=self.precision)
+    return Return(result, precision=self.precision)
+
+  def numeric_emulate(self, input_value):
+    return input_value * TABLE[int(input_value) % len(TABLE)] + 0.1
+
+
+def run_test(args):
+  snapshot_file = args.save_snapshot or "ut_ir_snapshot.mlsnap"
+  arg_dict = dict(vars(args))
+  # first generation: scheme generation, optimization and snapshot save
+  ml_ut_ir_snapshot = ML_UT_IRSnapshot(ML_UT_IRSnapshot.get_default_args(
+    **dict(arg_dict, save_snapshot=snapshot_file, load_snapshot=None)
+  ))
+  ml_ut_ir_snapshot.gen_implementation()
+  # second generation resumed from the snapshot (the auto-test
+  # wrapper is part of the snapshot)
+  resumed_output_file = "resumed_" + ml_ut_ir_snapshot.output_file
+  ml_ut_resumed = ML_UT_IRSnapshot(ML_UT_IRSnapshot.get_default_args(
+    **dict(arg_dict, save_snapshot=None, load_snapshot=snapshot_file,
+           output_file=resumed_output_file)
+  ))
+  ml_ut_resumed.gen_implementation()
+  # resumed generation must produce the same source
+  with open(ml_ut_ir_snapshot.output_file, "r") as first_stream, \
+       open(resumed_output_file, "r") as resumed_stream:
+    return first_stream.read() == resumed_stream.read()
+
+if __name__ == "__main__":
+  # auto-test
+  arg_template = ML_NewArgTemplate(default_args=ML_UT_IRSnapshot.get_default_args())
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
@@ -45,37 +45,12 @@ from metalibm_core.code_generation.generic_processor import GenericProcessor
 from metalibm_core.code_generation.mpfr_backend import MPFRProcessor
 from metalibm_core.code_generation.code_constant import C_Code 
 from metalibm_core.core.ml_optimization_engine import OptimizationEngine
+from metalibm_core.core.polynomial_scheme_selection import LatencyEvaluator
 
 
 from metalibm_core.utility.ml_template import *
 
 
-class LatencyEvaluator:
-  def __init__(self, target, language = C_Code):
-    self.target = target
-    ## dictionnary storing pair (optree, latency) of already 
-    #  evaluated nodes
-    self.latency_map = {}
-    self.language = language
-
-  ## Evaluate the critical path latency of 
-  #  the evaluation of @p optree
-  def evaluate(self, optree):
-    if optree in self.latency_map:
-      return self.latency_map[optree]
-    else:
-      if isinstance(optree, ML_ArithmeticOperation):
-        optree_impl = self.target.get_implementation(optree, language = self.language)
-        latency = optree_impl.get_speed_measure() + max([self.evaluate(inp) for inp in optree.get_inputs()])
-        self.latency_map[optree] = latency
-        return latency
-      if isinstance(optree, ML_LeafNode):
-        return 1.0
-      else:
-        latency = max([self.evaluate(inp) for inp in optree.get_inputs()])
-        self.latency_map[optree] = latency
-        return latency
-
 class ML_UT_LatencyEvaluation(ML_Function("ml_ut_latency_evaluation")):
   def __init__(self, 
                  arg_template,
@@ -124,7 +99,7 @@ class ML_UT_LatencyEvaluation(ML_Function("ml_ut_latency_evaluation")):
 
     latency_pass  = LatencyEvaluator(self.processor)
     latency_value = latency_pass.evaluate(operations)
-    print "latency evaluation result: {}".format(latency_value)
+    print("latency evaluation result: {}".format(latency_value))
     
     scheme = Statement(
               Return(operations, precision = self.precision)
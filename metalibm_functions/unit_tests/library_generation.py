@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+#
+# description: two meta-functions generated into a single compilation
+#              unit, sharing an identical externalized helper
+###############################################################################
+import re
+
+from sollya import Interval
+
+from metalibm_core.core.ml_function import ML_Function, ML_FunctionBasis
+from metalibm_core.core.ml_operations import (
+  Multiplication, Addition, Subtraction, Return, Statement
+)
+from metalibm_core.core.ml_formats import ML_Binary32
+
+from metalibm_core.utility.library_generation import LibraryGenerator
+from metalibm_core.utility.ml_template import *
+from metalibm_core.utility.log_report import Log
+
+
+class ML_UT_LibraryFunction(ML_Function("ml_ut_library_function")):
+  """ x * x +/- x, where x * x is computed by an externalized helper """
+  def __init__(self, args=DefaultArgTemplate):
+    # initializing base class
+    ML_FunctionBasis.__init__(self, args)
+    self.negate = args.negate
+
+  @staticmethod
+  def get_default_args(**kw):
+    """ Return a structure containing the arguments for current class,
+        builtin from a default argument mapping overloaded with @p kw """
+    default_args = {
+        "output_file": "ut_library_function.c",
+        "function_name": "ut_library_function",
+        "precision": ML_Binary32,
+        "negate": False,
+    }
+    default_args.update(kw)
+    return DefaultArgTemplate(**default_args)
+
+  def generate_function_list(self):
+    vx = self.implementation.add_input_variable("x", self.precision)
+    vx.set_interval(Interval(-1, 1))
+
+    square, square_function = self.externalize_call(
+      Multiplication(vx, vx, precision=self.precision), [vx], tag="square")
+    if self.negate:
+      result = Subtraction(square, vx, precision=self.precision)
+    else:
+      result = Addition(square, vx, precision=self.precision)
+
+    self.implementation.set_scheme(Statement(Return(result)))
+
+    return [square_function, self.implementation]
+
+
+def run_test(args):
+  library = LibraryGenerator(
+    "ut_library",
+    [
+      (ML_UT_LibraryFunction, {"function_name": "ut_library_add", "negate": False}),
+      (ML_UT_LibraryFunction, {"function_name": "ut_library_sub", "negate": True}),
+    ],
+    output_file="ut_library.c", header_file="ut_library.h"
+  )
+  library.gen_library()
+  with open(library.output_file, "r") as source_stream:
+    source = source_stream.read()
+  # the square helper must be emitted once, the second function calling
+  # the first function's helper
+  helper_list = [
+    code_function for fct, code_function_list in library.implementation_list
+    for code_function in code_function_list if code_function is not fct.implementation
+  ]
+  emitted_helpers = [
+    code_function.get_name() for code_function in helper_list
+    if re.search(r"\b{}\b".format(code_function.get_name()), source)
+  ]
+  if len(helper_list) != 2 or len(emitted_helpers) != 1:
+    Log.report(Log.Error, "shared helper emitted {} time(s) in {} (helpers: {})",
+               len(emitted_helpers), library.output_file,
+               [code_function.get_name() for code_function in helper_list])
+  for code_function in library.get_entry_point_list():
+    if not re.search(r"\b{}\b".format(code_function.get_name()), source):
+      Log.report(Log.Error, "entry point {} missing from {}",
+                 code_function.get_name(), library.output_file)
+  return library.build_library()
+
+if __name__ == "__main__":
+  arg_template = ML_NewArgTemplate(default_args=ML_UT_LibraryFunction.get_default_args())
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
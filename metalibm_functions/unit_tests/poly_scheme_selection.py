@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# last-modified:    Oct 19th, 2026
+###############################################################################
+from sollya import Interval, S2
+
+from metalibm_core.core.ml_function import ML_Function, ML_FunctionBasis
+
+from metalibm_core.core.ml_operations import *
+from metalibm_core.core.ml_formats import *
+
+from metalibm_core.code_generation.generic_processor import GenericProcessor
+from metalibm_core.core.polynomials import Polynomial, PolynomialSchemeEvaluator
+from metalibm_core.core.polynomial_scheme_selection import (
+    PolynomialSchemeSelector, LatencyEvaluator
+)
+
+from metalibm_core.utility.ml_template import *
+from metalibm_core.utility.log_report import Log
+
+
+class ML_UT_PolySchemeSelection(ML_Function("ml_ut_poly_scheme_selection")):
+  """ Unit-test for latency-driven polynomial evaluation scheme selection """
+  def __init__(self, args=DefaultArgTemplate):
+    # initializing base class
+    ML_FunctionBasis.__init__(self, args)
+    self.coeff_list = [1.0, 0.5, 0.25, 0.125, 0.0625, 0.03125, 0.015625]
+
+  @staticmethod
+  def get_default_args(**kw):
+    """ Return a structure containing the arguments for current class,
+        builtin from a default argument mapping overloaded with @p kw """
+    default_args = {
+        "output_file": "ut_poly_scheme_selection.c",
+        "function_name": "ut_poly_scheme_selection",
+        "precision": ML_Binary64,
+        "auto_test_range": Interval(-1, 1),
+        "target": GenericProcessor()
+    }
+    default_args.update(kw)
+    return DefaultArgTemplate(**default_args)
+
+  def generate_scheme(self):
+    vx = self.implementation.add_input_variable("x", self.precision)
+    poly_object = Polynomial(dict(enumerate(self.coeff_list)))
+
+    selector = PolynomialSchemeSelector(self.processor)
+    candidate_list = selector.generate_candidate_list(poly_object, vx, self.precision)
+    for candidate in candidate_list:
+      Log.report(Log.Info, "candidate: {}".format(candidate))
+
+    horner_latency = LatencyEvaluator(self.processor).evaluate(
+      PolynomialSchemeEvaluator.generate_horner_scheme(poly_object, vx, self.precision)
+    )
+    selected = selector.select_candidate(poly_object, vx, self.precision)
+    if selected.latency > horner_latency:
+      Log.report(
+        Log.Error,
+        "selected scheme {} is slower than horner scheme (latency={})".format(
+          selected, horner_latency)
+      )
+
+    # accuracy constraint: the (synthetic) evaluation error decreases
+    # with latency, so the fastest candidates exceed the error bound
+    def eval_error_function(scheme):
+      error = S2**-LatencyEvaluator(self.processor).evaluate(scheme)
+      return Interval(-error, error)
+    latency_list = sorted(set(candidate.latency for candidate in candidate_list))
+    if len(latency_list) > 1:
+      error_bound = S2**-latency_list[1]
+      constrained = selector.select_candidate(
+        poly_object, vx, self.precision,
+        eval_error_function=eval_error_function, error_bound=error_bound)
+      if constrained.eval_error > error_bound or constrained.latency != latency_list[1]:
+        Log.report(
+          Log.Error,
+          "selected scheme {} is not the fastest one within error bound {}".format(
+            constrained, error_bound)
+        )
+    # no candidate meets the bound: the most accurate one is selected
+    fallback = selector.select_candidate(
+      poly_object, vx, self.precision,
+      eval_error_function=eval_error_function,
+      error_bound=S2**-(latency_list[-1] + 1))
+    if fallback.latency != latency_list[-1]:
+      Log.report(
+        Log.Error,
+        "fallback scheme {} is not the most accurate candidate".format(fallback)
+      )
+
+    return Statement(Return(selected.scheme, precision = self.precision))
+
+  def numeric_emulate(self, input_value):
+    return sum(c * input_value**i for i, c in enumerate(self.coeff_list))
+
+
+def run_test(args):
+  ml_ut_poly_scheme_selection = ML_UT_PolySchemeSelection(args)
+  ml_ut_poly_scheme_selection.gen_implementation()
+  return True
+
+if __name__ == "__main__":
+  # auto-test
+  arg_template = ML_NewArgTemplate(default_args=ML_UT_PolySchemeSelection.get_default_args())
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
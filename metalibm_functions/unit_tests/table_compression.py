@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+from sollya import Interval
+
+from metalibm_core.core.ml_function import ML_Function, ML_FunctionBasis
+
+from metalibm_core.core.ml_operations import *
+from metalibm_core.core.ml_formats import *
+from metalibm_core.core.ml_table import ML_NewTable
+
+from metalibm_core.code_generation.generic_processor import GenericProcessor
+
+from metalibm_core.opt.p_table_compression import Pass_TableCompression
+
+from metalibm_core.utility.ml_template import *
+
+
+## content of the three tables used by the unit test:
+#  - TABLE_A is representable in binary32
+#  - TABLE_B overlaps with the end of TABLE_A
+#  - TABLE_C is identical to TABLE_A
+TABLE_A = [i * 0.25 for i in range(16)]
+TABLE_B = TABLE_A[8:] + [8.0 + i for i in range(8)]
+TABLE_C = list(TABLE_A)
+
+
+class ML_UT_TableCompression(ML_Function("ml_ut_table_compression")):
+  def __init__(self, args=DefaultArgTemplate):
+    # initializing base class
+    ML_FunctionBasis.__init__(self, args)
+
+  @staticmethod
+  def get_default_args(**kw):
+    """ Return a structure containing the arguments for current class,
+        builtin from a default argument mapping overloaded with @p kw """
+    default_args = {
+        "output_file": "ut_table_compression.c",
+        "function_name": "ut_table_compression",
+        "precision": ML_Binary64,
+        "target": GenericProcessor(),
+        "auto_test_range": Interval(0, 100),
+        "pre_gen_passes": ["table_compression"],
+    }
+    default_args.update(kw)
+    return DefaultArgTemplate(**default_args)
+
+  def generate_scheme(self):
+    vx = self.implementation.add_input_variable("x", self.precision)
+
+    table_list = [
+      ML_NewTable(dimensions=[len(content)], storage_precision=self.precision,
+                  init_data=content, tag="table_{}".format(name))
+      for name, content in [("a", TABLE_A), ("b", TABLE_B), ("c", TABLE_C)]
+    ]
+    index = Modulo(
+      Conversion(vx, precision=ML_Int32),
+      Constant(16, precision=ML_Int32),
+      precision=ML_Int32
+    )
+    result = Addition(
+      Addition(
+        TableLoad(table_list[0], index, precision=self.precision),
+        TableLoad(table_list[1], index, precision=self.precision),
+        precision=self.precision
+      ),
+      TableLoad(table_list[2], index, precision=self.precision),
+      precision=self.precision
+    )
+    return Return(result, precision=self.precision)
+
+  def numeric_emulate(self, input_value):
+    index = int(input_value) % 16
+    return TABLE_A[index] + TABLE_B[index] + TABLE_C[index]
+
+
+def check_table_compression():
+  """ check the merging and packing of the unit test tables """
+  ml_ut = ML_UT_TableCompression(ML_UT_TableCompression.get_default_args())
+  scheme = ml_ut.generate_scheme()
+  compression_pass = Pass_TableCompression(ml_ut.processor)
+  compression_pass.execute(scheme)
+  original_size, compressed_size = compression_pass.get_table_byte_sizes()
+  # 3 tables of 16 binary64 entries are merged into a single
+  # table of 24 binary32 entries
+  return len(compression_pass.group_list) == 1 and \
+         original_size == 3 * 16 * 8 and compressed_size == 24 * 4
+
+
+def run_test(args):
+  if not check_table_compression():
+    Log.report(Log.Error, "table compression unit test failed")
+    return False
+  ml_ut_table_compression = ML_UT_TableCompression(args)
+  ml_ut_table_compression.gen_implementation()
+  return True
+
+if __name__ == "__main__":
+  # auto-test
+  arg_template = ML_NewArgTemplate(default_args=ML_UT_TableCompression.get_default_args())
+  args = arg_template.arg_extraction()
+
+  if run_test(args):
+    exit(0)
+  else:
+    exit(1)
@@ -42,6 +42,7 @@ from metalibm_core.core.ml_table import ML_Table
 import metalibm_core.code_generation.vhdl_backend as vhdl_backend
 from metalibm_core.core.polynomials import *
 from metalibm_core.core.ml_entity import ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+from metalibm_core.core.ml_component_registry import get_component
 from metalibm_core.code_generation.generator_utility import FunctionOperator, FO_Result, FO_Arg
 
 
@@ -164,12 +165,8 @@ def vhdl_legalize_count_leading_zeros(optree):
     lzc_input = optree.get_input(0)
     lzc_width = lzc_input.get_precision().get_bit_size()
 
-    lzc_args = ML_LeadingZeroCounter.get_default_args(width = lzc_width)
-    LZC_entity = ML_LeadingZeroCounter(lzc_args)
-    lzc_entity_list = LZC_entity.generate_scheme()
-    lzc_implementation = LZC_entity.get_implementation()
-
-    lzc_component = lzc_implementation.get_component_object()
+    # shared leading zero counter entity (generated once per width)
+    lzc_component = get_component(ML_LeadingZeroCounter, width = lzc_width).get_component_object()
 
     lzc_tag = optree.get_tag() if not optree.get_tag() is None else "lzc_signal"
 
@@ -42,6 +42,7 @@ from metalibm_core.core.ml_table import ML_Table
 from metalibm_core.code_generation.vhdl_backend import VHDLBackend
 from metalibm_core.core.polynomials import *
 from metalibm_core.core.ml_entity import ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+from metalibm_core.core.ml_component_registry import get_component
 from metalibm_core.code_generation.generator_utility import FunctionOperator, FO_Result, FO_Arg
 
 
@@ -297,12 +298,11 @@ class FP_FMA(ML_Entity("fp_fma")):
     lzc_width = int(floor(log2(datapath_full_width + 1)) + 1)
     lzc_prec = ML_StdLogicVectorFormat(lzc_width)
 
-    lzc_args = ML_LeadingZeroCounter.get_default_args(width = (datapath_full_width + 1))
-    LZC_entity = ML_LeadingZeroCounter(lzc_args)
-    lzc_entity_list = LZC_entity.generate_scheme()
-    lzc_implementation = LZC_entity.get_implementation()
+    # shared leading zero counter entity (generated once per width)
+    lzc_shared = get_component(ML_LeadingZeroCounter, width = (datapath_full_width + 1))
+    lzc_entity_list = lzc_shared.entity_list
 
-    lzc_component = lzc_implementation.get_component_object()
+    lzc_component = lzc_shared.get_component_object()
 
     #lzc_in = SubSignalSelection(mant_add, p+1, 2*p+3)
     lzc_in = mant_add_abs # SubSignalSelection(mant_add_abs, 0, 3*p+3, precision = ML_StdLogicVectorFormat(3*p+4))
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" Static bit-width report pass unit test """
+
+import sollya
+
+from metalibm_core.core.ml_operations import (
+    Addition, Multiplication, Conversion
+)
+from metalibm_core.code_generation.code_constant import VHDL_Code
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.code_generation.vhdl_backend import VHDLBackend
+from metalibm_core.core.ml_entity import (
+    ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+)
+from metalibm_core.utility.ml_template import \
+    ML_EntityArgTemplate
+from metalibm_core.utility.log_report import Log
+from metalibm_core.core.ml_hdl_format import fixed_point
+
+from metalibm_core.opt.p_bitwidth_report import Pass_BitWidthReport
+
+from metalibm_functions.unit_tests.utils import TestRunner
+
+
+class BitWidthReportBench(ML_Entity("ut_bitwidth_report_entity"), TestRunner):
+    """ (x + y) + x * y with explicit formats, x in [0, 3] and y in [0, 1]:
+        the two additions are wider than their ranges require """
+    ## expected tag -> (integer size, excess integer bits) of the report
+    expected_widths = {
+        "x": (2, 0),
+        "y": (1, 0),
+        # [0, 4] requires 3 integer bits
+        "sum": (8, 5),
+        # [0, 3] requires 2 integer bits
+        "prod": (2, 0),
+        # [0, 7] requires 3 integer bits
+        "acc": (6, 3),
+    }
+
+    @staticmethod
+    def get_default_args(width=16, **kw):
+        """ generate default argument template """
+        default_args = {
+            "precision": ML_Int32,
+            "debug_flag": False,
+            "target": VHDLBackend(),
+            "output_file": "ut_bitwidth_report_entity.vhd",
+            "entity_name": "ut_bitwidth_report_entity",
+            "language": VHDL_Code,
+            "width": width,
+        }
+        default_args.update(kw)
+        return DefaultEntityArgTemplate(**default_args)
+
+    def __init__(self, arg_template=None):
+        """ Initialize """
+        # building default arg_template if necessary
+        arg_template = BitWidthReportBench.get_default_args() if \
+            arg_template is None else arg_template
+        self.width = arg_template.width
+        Log.report(
+            Log.Info,
+            "generating bit-width report entity with width={}".format(self.width)
+        )
+
+        # initializing base class
+        ML_EntityBasis.__init__(self,
+                                base_name="bitwidth_report",
+                                arg_template=arg_template
+                                )
+
+        self.accuracy = arg_template.accuracy
+        self.precision = arg_template.precision
+
+    def generate_scheme(self):
+        """ main scheme generation """
+        frac_size = self.width - 2
+        var_x = self.implementation.add_input_signal(
+            "x", fixed_point(2, frac_size, signed=False))
+        var_y = self.implementation.add_input_signal(
+            "y", fixed_point(1, frac_size, signed=False))
+        var_x.set_interval(sollya.Interval(0, 3))
+        var_y.set_interval(sollya.Interval(0, 1))
+
+        sum_xy = Addition(
+            var_x, var_y, precision=fixed_point(8, frac_size, signed=False),
+            tag="sum")
+        prod_xy = Multiplication(
+            var_x, var_y, precision=fixed_point(2, 2 * frac_size, signed=False),
+            tag="prod")
+        acc = Addition(
+            sum_xy, prod_xy, precision=fixed_point(6, 2 * frac_size, signed=False),
+            tag="acc")
+        result = Conversion(acc, precision=fixed_point(3, frac_size, signed=False))
+
+        self.implementation.add_output_signal("vr_out", result)
+
+        return [self.implementation]
+
+    def numeric_emulate(self, io_map):
+        """ Meta-Function numeric emulation """
+        output_precision = fixed_point(3, self.width - 2, signed=False)
+        value_x = io_map["x"]
+        value_y = io_map["y"]
+        return {"vr_out": output_precision.truncate(value_x + value_y + value_x * value_y)}
+
+    @staticmethod
+    def __call__(args):
+        ut_bitwidth_report = BitWidthReportBench(args)
+        ut_bitwidth_report.generate_scheme()
+        report_pass = Pass_BitWidthReport(args.target)
+        report = report_pass.get_report(ut_bitwidth_report.implementation.get_scheme())
+        reported_widths = dict(
+            (info.node.get_tag(), (info.integer_size, info.get_excess_bits()))
+            for info in report_pass.info_list
+            if info.node.get_tag() in BitWidthReportBench.expected_widths
+        )
+        if reported_widths != BitWidthReportBench.expected_widths:
+            Log.report(Log.Error, "unexpected bit-width report {}, expected {}",
+                       reported_widths, BitWidthReportBench.expected_widths)
+        # oversized summary: sum and acc, 5 + 3 excess bits
+        return "2 oversized node(s), 8 excess integer bit(s)" in report
+
+run_test = BitWidthReportBench
+
+
+if __name__ == "__main__":
+    # auto-test
+    main_arg_template = ML_EntityArgTemplate(
+        default_entity_name="ut_bitwidth_report_entity",
+        default_output_file="ut_bitwidth_report_entity.vhd",
+        default_arg=BitWidthReportBench.get_default_args()
+    )
+    main_arg_template.parser.add_argument(
+        "--width", dest="width", type=int, default=16,
+        help="set input width value (in bits)"
+    )
+    # argument extraction
+    args = parse_arg_index_list = main_arg_template.arg_extraction()
+
+    ut_bitwidth_report = BitWidthReportBench(args)
+
+    ut_bitwidth_report.gen_implementation()
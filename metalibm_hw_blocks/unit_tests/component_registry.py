@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" Shared RTL component registry unit test """
+
+import re
+
+from sollya import floor, log2
+
+from metalibm_core.code_generation.code_constant import VHDL_Code
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.code_generation.vhdl_backend import VHDLBackend
+from metalibm_core.core.ml_entity import (
+    ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+)
+from metalibm_core.core.ml_component_registry import get_component
+from metalibm_core.core.ml_hdl_format import ML_StdLogicVectorFormat
+from metalibm_core.core.ml_hdl_operations import Signal, PlaceHolder
+from metalibm_core.utility.ml_template import \
+    ML_EntityArgTemplate
+from metalibm_core.utility.log_report import Log
+
+from metalibm_functions.unit_tests.utils import TestRunner
+
+from metalibm_hw_blocks.lzc import ML_LeadingZeroCounter
+
+
+class ComponentRegistryBench(ML_Entity("ut_component_registry_entity"), TestRunner):
+    """ two leading zero counts of the same width: both instances must
+        share a single LZC entity, emitted once in the component library """
+    @staticmethod
+    def get_default_args(width=16, **kw):
+        """ generate default argument template """
+        return DefaultEntityArgTemplate(
+            precision=ML_Int32,
+            debug_flag=False,
+            target=VHDLBackend(),
+            output_file="ut_component_registry_entity.vhd",
+            entity_name="ut_component_registry_entity",
+            language=VHDL_Code,
+            width=width,
+            component_library="ut_component_registry_lib.vhd",
+        )
+
+    def __init__(self, arg_template=None):
+        """ Initialize """
+        # building default arg_template if necessary
+        arg_template = ComponentRegistryBench.get_default_args() if \
+            arg_template is None else arg_template
+        self.width = arg_template.width
+        Log.report(
+            Log.Info,
+            "generating component registry entity with width={}".format(self.width)
+        )
+
+        # initializing base class
+        ML_EntityBasis.__init__(self,
+                                base_name="component_registry",
+                                arg_template=arg_template
+                                )
+
+        self.accuracy = arg_template.accuracy
+        self.precision = arg_template.precision
+
+    def generate_lzc(self, lzc_input, tag):
+        """ instanciate the shared LZC component on lzc_input,
+            return the pair (lzc result, LZC entity list) """
+        lzc_width = int(floor(log2(self.width))) + 1
+        lzc_shared = get_component(ML_LeadingZeroCounter, width=self.width)
+        lzc_component = lzc_shared.get_component_object()
+        lzc_signal = Signal(
+            tag, precision=ML_StdLogicVectorFormat(lzc_width),
+            var_type=Signal.Local
+        )
+        lzc_value = PlaceHolder(
+            lzc_signal,
+            lzc_component(io_map={"x": lzc_input, "vr_out": lzc_signal}),
+        )
+        return lzc_value, lzc_shared.entity_list
+
+    def generate_scheme(self):
+        """ main scheme generation """
+        input_precision = ML_StdLogicVectorFormat(self.width)
+
+        # declaring main input variable
+        var_x = self.implementation.add_input_signal("x", input_precision)
+        var_y = self.implementation.add_input_signal("y", input_precision)
+
+        lzc_x, lzc_entity_list = self.generate_lzc(var_x, "lzc_x")
+        lzc_y, _ = self.generate_lzc(var_y, "lzc_y")
+
+        self.implementation.add_output_signal("lzc_x_out", lzc_x)
+        self.implementation.add_output_signal("lzc_y_out", lzc_y)
+
+        # the shared entity list is returned once per instance
+        return lzc_entity_list + lzc_entity_list + [self.implementation]
+
+    def numeric_emulate(self, io_map):
+        """ Meta-Function numeric emulation """
+        def count_leading_zero(value):
+            for index in range(self.width):
+                if int(value) & 2**(self.width - 1 - index):
+                    return index
+            return self.width
+        return {
+            "lzc_x_out": count_leading_zero(io_map["x"]),
+            "lzc_y_out": count_leading_zero(io_map["y"]),
+        }
+
+    standard_test_cases = [
+        ({"x": 1, "y": 0}, None),
+    ]
+
+    @staticmethod
+    def __call__(args):
+        ut_component_registry = ComponentRegistryBench(args)
+        ut_component_registry.gen_implementation()
+        lzc_name = get_component(ML_LeadingZeroCounter, width=args.width).get_name()
+        entity_regex = r"^entity {} is".format(lzc_name)
+        with open(ut_component_registry.output_file, "r") as output_stream:
+            output_count = len(re.findall(entity_regex, output_stream.read(), re.MULTILINE))
+        with open(args.component_library, "r") as library_stream:
+            library_count = len(re.findall(entity_regex, library_stream.read(), re.MULTILINE))
+        return output_count == 0 and library_count == 1
+
+run_test = ComponentRegistryBench
+
+
+if __name__ == "__main__":
+    # auto-test
+    main_arg_template = ML_EntityArgTemplate(
+        default_entity_name="ut_component_registry_entity",
+        default_output_file="ut_component_registry_entity.vhd",
+        default_arg=ComponentRegistryBench.get_default_args()
+    )
+    main_arg_template.parser.add_argument(
+        "--width", dest="width", type=int, default=16,
+        help="set input width value (in bits)"
+    )
+    # argument extraction
+    args = parse_arg_index_list = main_arg_template.arg_extraction()
+
+    ut_component_registry = ComponentRegistryBench(args)
+
+    ut_component_registry.gen_implementation()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" HDL simulator output parsing unit test (sample ModelSim and GHDL
+    transcripts, no simulator is executed) """
+
+from metalibm_core.utility.hdl_simulator import (
+    ModelSimSimulator, GHDLSimulator, END_OF_TEST_MESSAGE
+)
+from metalibm_core.utility.log_report import Log
+
+
+## simulator class -> list of (case, simulation transcript, expected
+#  success, expected number of error messages)
+TRANSCRIPT_MAP = {
+    ModelSimSimulator: [
+        ("end of test",
+         "# Loading work.testbench(rtl)\n"
+         "# ** Failure: " + END_OF_TEST_MESSAGE + "\n"
+         "#    Time: 1230 ns  Iteration: 0  Process: /testbench/test_process\n",
+         True, 0),
+        ("assertion error",
+         "# Loading work.testbench(rtl)\n"
+         "# ** Error: unexpected value for inputs x=1, expected 2, got 3\n"
+         "#    Time: 40 ns  Iteration: 0  Process: /testbench/test_process\n"
+         "# ** Failure: " + END_OF_TEST_MESSAGE + "\n",
+         False, 1),
+        ("unfinished",
+         "# Loading work.testbench(rtl)\n"
+         "# run 2000 ns\n"
+         "# exit\n",
+         False, 1),
+    ],
+    GHDLSimulator: [
+        ("end of test",
+         "ut_entity.vhd:120:9:@1230ns:(assertion failure): " + END_OF_TEST_MESSAGE + "\n"
+         "ghdl:error: assertion failed\n",
+         True, 0),
+        ("assertion error",
+         "ut_entity.vhd:80:13:@40ns:(assertion error): unexpected value for inputs x=1, expected 2, got 3\n"
+         "ut_entity.vhd:120:9:@1230ns:(assertion failure): " + END_OF_TEST_MESSAGE + "\n",
+         False, 1),
+        ("unfinished",
+         "ghdl:info: simulation stopped by --stop-time @2000ns\n",
+         False, 1),
+    ],
+}
+
+
+def get_replay_simulator(simulator_class, transcript):
+    """ return a simulator instance whose stages are not executed: every
+        stage succeeds, simulation outputs @p transcript """
+    class ReplaySimulator(simulator_class):
+        def run_stage(self, stage_name, cmd, stage_timing):
+            stage_timing.append((stage_name, 0.0))
+            return 0, transcript if stage_name == "simulation" else ""
+    return ReplaySimulator()
+
+
+def run_test(args):
+    for simulator_class in sorted(TRANSCRIPT_MAP, key=lambda c: c.name):
+        for case, transcript, success, error_num in TRANSCRIPT_MAP[simulator_class]:
+            simulator = get_replay_simulator(simulator_class, transcript)
+            result = simulator.simulate("ut_entity.vhd", "testbench", 2000)
+            if bool(result) != success or len(result.error_list) != error_num:
+                Log.report(
+                    Log.Error, "{} transcript \"{}\": success={}, errors={}, expected success={}, {} error(s)",
+                    simulator_class.name, case, bool(result), result.error_list,
+                    success, error_num)
+    return True
+
+
+if __name__ == "__main__":
+    if run_test(None):
+        exit(0)
+    else:
+        exit(1)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" Parallel (multi-process) entity pass execution unit test """
+
+from sollya import floor, log2
+
+from metalibm_core.code_generation.code_constant import VHDL_Code
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.code_generation.vhdl_backend import VHDLBackend
+from metalibm_core.core.ml_entity import (
+    ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+)
+from metalibm_core.core.ml_hdl_format import ML_StdLogicVectorFormat
+from metalibm_core.core.ml_hdl_operations import Signal, PlaceHolder
+from metalibm_core.utility.ml_template import \
+    ML_EntityArgTemplate
+from metalibm_core.utility.log_report import Log
+
+from metalibm_functions.unit_tests.utils import TestRunner
+
+from metalibm_hw_blocks.lzc import ML_LeadingZeroCounter
+
+
+class ParallelPassBench(ML_Entity("ut_parallel_pass_entity"), TestRunner):
+    """ pipelined entity instanciating a LZC sub-entity, so that entity
+        passes are executed over two code entities """
+    @staticmethod
+    def get_default_args(width=16, **kw):
+        """ generate default argument template """
+        default_args = {
+            "precision": ML_Int32,
+            "debug_flag": False,
+            "target": VHDLBackend(),
+            "output_file": "ut_parallel_pass_entity.vhd",
+            "entity_name": "ut_parallel_pass_entity",
+            "language": VHDL_Code,
+            "width": width,
+            "pipelined": True,
+            "passes": [
+                "beforepipelining:size_datapath",
+                "beforepipelining:rtl_legalize",
+                # in-place check pass: graphs are not exchanged
+                "beforepipelining:check_precision",
+                "beforepipelining:unify_pipeline_stages",
+            ],
+        }
+        default_args.update(kw)
+        return DefaultEntityArgTemplate(**default_args)
+
+    def __init__(self, arg_template=None):
+        """ Initialize """
+        # building default arg_template if necessary
+        arg_template = ParallelPassBench.get_default_args() if \
+            arg_template is None else arg_template
+        self.width = arg_template.width
+        Log.report(
+            Log.Info,
+            "generating parallel pass entity with width={}".format(self.width)
+        )
+
+        # initializing base class
+        ML_EntityBasis.__init__(self,
+                                base_name="parallel_pass",
+                                arg_template=arg_template
+                                )
+
+        self.accuracy = arg_template.accuracy
+        self.precision = arg_template.precision
+
+    def generate_scheme(self):
+        """ main scheme generation """
+        input_precision = ML_StdLogicVectorFormat(self.width)
+        lzc_width = int(floor(log2(self.width))) + 1
+
+        # clock input created before pass execution
+        self.get_clk_input()
+        var_x = self.implementation.add_input_signal("x", input_precision)
+
+        self.lzc_entity = ML_LeadingZeroCounter(
+            ML_LeadingZeroCounter.get_default_args(width=self.width))
+        lzc_entity_list = self.lzc_entity.generate_scheme()
+        lzc_component = self.lzc_entity.get_implementation().get_component_object()
+        lzc_signal = Signal(
+            "lzc_x", precision=ML_StdLogicVectorFormat(lzc_width),
+            var_type=Signal.Local
+        )
+        lzc_x = PlaceHolder(
+            lzc_signal,
+            lzc_component(io_map={"x": var_x, "vr_out": lzc_signal}),
+        )
+
+        self.implementation.start_new_stage()
+
+        self.implementation.add_output_signal("lzc_out", lzc_x)
+
+        return lzc_entity_list + [self.implementation]
+
+    def numeric_emulate(self, io_map):
+        """ Meta-Function numeric emulation """
+        for index in range(self.width):
+            if int(io_map["x"]) & 2**(self.width - 1 - index):
+                return {"lzc_out": index}
+        return {"lzc_out": self.width}
+
+    standard_test_cases = [
+        ({"x": 1}, None),
+        ({"x": 0}, None),
+    ]
+
+    @staticmethod
+    def __call__(args):
+        code_list = []
+        for jobs in [1, 2]:
+            output_file = "ut_parallel_pass_entity_{}.vhd".format(jobs)
+            bench = ParallelPassBench(ParallelPassBench.get_default_args(
+                **dict(vars(args), pass_jobs=jobs, output_file=output_file)))
+            bench.gen_implementation()
+            # input map must reference the (possibly exchanged) ports
+            for code_entity in [bench.implementation, bench.lzc_entity.get_implementation()]:
+                for tag in ["clk", "x"]:
+                    port = code_entity.get_input_by_tag(tag)
+                    if not port is None and not any(port is arg for arg in code_entity.get_arg_list()):
+                        Log.report(Log.Error, "input {} of {} is not an entity port with {} job(s)",
+                                   tag, code_entity.get_name(), jobs)
+            with open(output_file, "r") as output_stream:
+                code_list.append(output_stream.read())
+        return code_list[0] == code_list[1]
+
+run_test = ParallelPassBench
+
+
+if __name__ == "__main__":
+    # auto-test
+    main_arg_template = ML_EntityArgTemplate(
+        default_entity_name="ut_parallel_pass_entity",
+        default_output_file="ut_parallel_pass_entity.vhd",
+        default_arg=ParallelPassBench.get_default_args()
+    )
+    main_arg_template.parser.add_argument(
+        "--width", dest="width", type=int, default=16,
+        help="set input width value (in bits)"
+    )
+    # argument extraction
+    args = parse_arg_index_list = main_arg_template.arg_extraction()
+
+    ut_parallel_pass = ParallelPassBench(args)
+
+    ut_parallel_pass.gen_implementation()
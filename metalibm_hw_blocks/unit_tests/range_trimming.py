@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" Range-driven bit-width trimming unit test """
+
+import random
+
+import sollya
+
+from metalibm_core.core.ml_operations import Conversion
+from metalibm_core.code_generation.code_constant import VHDL_Code
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.code_generation.vhdl_backend import VHDLBackend
+from metalibm_core.core.ml_entity import (
+    ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+)
+from metalibm_core.utility.ml_template import \
+    ML_EntityArgTemplate
+from metalibm_core.utility.log_report import Log
+from metalibm_core.core.ml_hdl_format import fixed_point
+
+from metalibm_core.opt.p_range_trimming import Pass_RangeTrimming
+
+from metalibm_functions.unit_tests.utils import TestRunner
+
+
+class RangeTrimmingBench(ML_Entity("ut_range_trimming_entity"), TestRunner):
+    """ x * y + x with y known to be in [0, 0.25]: the product and the sum
+        formats inferred by size_datapath can be narrowed """
+    @staticmethod
+    def get_default_args(width=16, **kw):
+        """ generate default argument template """
+        default_args = {
+            "precision": ML_Int32,
+            "debug_flag": False,
+            "target": VHDLBackend(),
+            "output_file": "ut_range_trimming_entity.vhd",
+            "entity_name": "ut_range_trimming_entity",
+            "language": VHDL_Code,
+            "width": width,
+            "passes": [
+                ("beforecodegen:size_datapath"),
+                ("beforecodegen:range_trimming"),
+                ],
+        }
+        default_args.update(kw)
+        return DefaultEntityArgTemplate(**default_args)
+
+    def __init__(self, arg_template=None):
+        """ Initialize """
+        # building default arg_template if necessary
+        arg_template = RangeTrimmingBench.get_default_args() if \
+            arg_template is None else arg_template
+        self.width = arg_template.width
+        Log.report(
+            Log.Info,
+            "generating range trimming entity with width={}".format(self.width)
+        )
+
+        # initializing base class
+        ML_EntityBasis.__init__(self,
+                                base_name="range_trimming",
+                                arg_template=arg_template
+                                )
+
+        self.accuracy = arg_template.accuracy
+        self.precision = arg_template.precision
+
+    def get_io_precisions(self):
+        """ return the (input, output) fixed-point formats """
+        frac_size = self.width - 1
+        return fixed_point(1, frac_size, signed=False), fixed_point(3, frac_size, signed=False)
+
+    def generate_scheme(self):
+        """ main scheme generation """
+        input_precision, output_precision = self.get_io_precisions()
+
+        # declaring main input variable
+        var_x = self.implementation.add_input_signal("x", input_precision)
+        var_y = self.implementation.add_input_signal("y", input_precision)
+        var_y.set_interval(sollya.Interval(0, 0.25))
+
+        result = Conversion(var_x * var_y + var_x, precision=output_precision)
+
+        self.implementation.add_output_signal("vr_out", result)
+
+        return [self.implementation]
+
+    def generate_test_case(self, input_signals, io_map, index, test_range=None):
+        """ y is drawn in its declared interval [0, 0.25] """
+        input_precision, _ = self.get_io_precisions()
+        frac_size = input_precision.get_frac_size()
+        return {
+            "x": random.randrange(2**(frac_size + 1)) * sollya.S2**-frac_size,
+            "y": random.randrange(2**(frac_size - 2) + 1) * sollya.S2**-frac_size,
+        }
+
+    standard_test_cases = [
+        ({"x": 1.5, "y": 0.25}, None),
+        ({"x": 0, "y": 0}, None),
+    ]
+
+    def numeric_emulate(self, io_map):
+        """ Meta-Function numeric emulation """
+        _, output_precision = self.get_io_precisions()
+        return {
+            "vr_out": output_precision.truncate(io_map["x"] * io_map["y"] + io_map["x"])
+        }
+
+    @staticmethod
+    def __call__(args):
+        ut_range_trimming = RangeTrimmingBench(args)
+        ut_range_trimming.gen_implementation()
+        trimming_pass = [
+            pass_object for pass_object in ut_range_trimming.get_pass_scheduler().get_executed_passes()
+            if isinstance(pass_object, Pass_RangeTrimming)
+        ]
+        return len(trimming_pass) == 1 and trimming_pass[0].trimmed_bits > 0
+
+run_test = RangeTrimmingBench
+
+
+if __name__ == "__main__":
+    # auto-test
+    main_arg_template = ML_EntityArgTemplate(
+        default_entity_name="ut_range_trimming_entity",
+        default_output_file="ut_range_trimming_entity.vhd",
+        default_arg=RangeTrimmingBench.get_default_args()
+    )
+    main_arg_template.parser.add_argument(
+        "--width", dest="width", type=int, default=16,
+        help="set input width value (in bits)"
+    )
+    # argument extraction
+    args = parse_arg_index_list = main_arg_template.arg_extraction()
+
+    ut_range_trimming = RangeTrimmingBench(args)
+
+    ut_range_trimming.gen_implementation()
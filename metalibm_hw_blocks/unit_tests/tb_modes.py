@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" Testbench generation modes (stimulus file, streaming) unit test """
+
+from metalibm_core.core.ml_operations import Conversion
+from metalibm_core.code_generation.code_constant import VHDL_Code
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.code_generation.vhdl_backend import VHDLBackend
+from metalibm_core.core.ml_entity import (
+    ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+)
+from metalibm_core.utility.ml_template import \
+    ML_EntityArgTemplate
+from metalibm_core.utility.log_report import Log
+from metalibm_core.core.ml_hdl_format import fixed_point
+
+from metalibm_functions.unit_tests.utils import TestRunner
+
+
+class TestbenchModesBench(ML_Entity("ut_tb_modes_entity"), TestRunner):
+    """ two-stage pipelined fixed-point x + y, used to exercise the
+        testbench generation modes """
+    @staticmethod
+    def get_default_args(width=16, **kw):
+        """ generate default argument template """
+        default_args = {
+            "precision": ML_Int32,
+            "debug_flag": False,
+            "target": VHDLBackend(),
+            "output_file": "ut_tb_modes_entity.vhd",
+            "entity_name": "ut_tb_modes_entity",
+            "language": VHDL_Code,
+            "width": width,
+            "pipelined": True,
+            "passes": [
+                ("beforepipelining:size_datapath"),
+                ("beforepipelining:rtl_legalize"),
+                ("beforepipelining:unify_pipeline_stages"),
+                ],
+        }
+        default_args.update(kw)
+        return DefaultEntityArgTemplate(**default_args)
+
+    def __init__(self, arg_template=None):
+        """ Initialize """
+        # building default arg_template if necessary
+        arg_template = TestbenchModesBench.get_default_args() if \
+            arg_template is None else arg_template
+        self.width = arg_template.width
+        Log.report(
+            Log.Info,
+            "generating testbench modes entity with width={}".format(self.width)
+        )
+
+        # initializing base class
+        ML_EntityBasis.__init__(self,
+                                base_name="tb_modes",
+                                arg_template=arg_template
+                                )
+
+        self.accuracy = arg_template.accuracy
+        self.precision = arg_template.precision
+
+    def get_io_precisions(self):
+        """ return the (input, output) fixed-point formats """
+        int_size = 3
+        frac_size = self.width - int_size
+        return fixed_point(int_size, frac_size), fixed_point(int_size + 1, frac_size)
+
+    def generate_scheme(self):
+        """ main scheme generation """
+        input_precision, output_precision = self.get_io_precisions()
+
+        # declaring main input variable
+        var_x = self.implementation.add_input_signal("x", input_precision)
+        var_y = self.implementation.add_input_signal("y", input_precision)
+
+        self.implementation.start_new_stage()
+
+        result = Conversion(var_x + var_y, precision=output_precision)
+
+        self.implementation.start_new_stage()
+
+        self.implementation.add_output_signal("vr_out", result)
+
+        return [self.implementation]
+
+    standard_test_cases = [
+        ({"x": 1.5, "y": -2}, None),
+        ({"x": 0, "y": 0}, None),
+    ]
+
+    def numeric_emulate(self, io_map):
+        """ Meta-Function numeric emulation """
+        _, output_precision = self.get_io_precisions()
+        return {"vr_out": output_precision.truncate(io_map["x"] + io_map["y"])}
+
+    @staticmethod
+    def __call__(args):
+        ut_tb_modes = TestbenchModesBench(args)
+        ut_tb_modes.gen_implementation()
+        if args.tb_stimulus_file and not args.tb_streaming:
+            # one stimulus line per test vector
+            with open(args.tb_stimulus_file, "r") as stimulus_stream:
+                line_num = len(stimulus_stream.readlines())
+            expected_num = ut_tb_modes.auto_test_number + \
+                (len(ut_tb_modes.standard_test_cases) if ut_tb_modes.auto_test_std else 0)
+            if line_num != expected_num:
+                Log.report(Log.Error, "{} stimulus lines found in {}, expected {}",
+                           line_num, args.tb_stimulus_file, expected_num)
+        if args.auto_test_seed is None:
+            return True
+        # generating again with the same seed (and a single emulation
+        # process) must build the same test vectors and bubble schedule
+        vector_file = args.tb_stimulus_file or args.output_file
+        replay_file = "replay_" + vector_file
+        replay_args = dict(
+            vars(args), auto_test=ut_tb_modes.auto_test_number,
+            auto_test_execute=False, emulation_jobs=1)
+        if args.tb_stimulus_file:
+            replay_args["tb_stimulus_file"] = replay_file
+        else:
+            replay_args["output_file"] = replay_file
+        ut_replay = TestbenchModesBench(TestbenchModesBench.get_default_args(**replay_args))
+        ut_replay.gen_implementation()
+        with open(vector_file, "r") as vector_stream, open(replay_file, "r") as replay_stream:
+            return vector_stream.read() == replay_stream.read()
+
+run_test = TestbenchModesBench
+
+
+if __name__ == "__main__":
+    # auto-test
+    main_arg_template = ML_EntityArgTemplate(
+        default_entity_name="ut_tb_modes_entity",
+        default_output_file="ut_tb_modes_entity.vhd",
+        default_arg=TestbenchModesBench.get_default_args()
+    )
+    main_arg_template.parser.add_argument(
+        "--width", dest="width", type=int, default=16,
+        help="set input width value (in bits)"
+    )
+    # argument extraction
+    args = parse_arg_index_list = main_arg_template.arg_extraction()
+
+    ut_tb_modes = TestbenchModesBench(args)
+
+    ut_tb_modes.gen_implementation()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+###############################################################################
+# This file is part of metalibm (https://github.com/kalray/metalibm)
+###############################################################################
+# MIT License
+#
+# Copyright (c) 2018 Kalray
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+###############################################################################
+# created:          Oct 19th, 2026
+# last-modified:    Oct 19th, 2026
+###############################################################################
+""" Timing-driven automatic pipeline stage insertion unit test """
+
+from metalibm_core.core.ml_operations import Conversion
+from metalibm_core.code_generation.code_constant import VHDL_Code
+from metalibm_core.core.ml_formats import ML_Int32
+from metalibm_core.code_generation.vhdl_backend import VHDLBackend
+from metalibm_core.core.ml_entity import (
+    ML_Entity, ML_EntityBasis, DefaultEntityArgTemplate
+)
+from metalibm_core.utility.ml_template import \
+    ML_EntityArgTemplate
+from metalibm_core.utility.log_report import Log
+from metalibm_core.core.ml_hdl_format import fixed_point
+
+from metalibm_functions.unit_tests.utils import TestRunner
+
+
+class TimingPipeliningBench(ML_Entity("ut_timing_pipelining_entity"), TestRunner):
+    """ multiply-add chain without any hand-placed stage, pipelined
+        automatically for a target clock period """
+    @staticmethod
+    def get_default_args(width=16, **kw):
+        """ generate default argument template """
+        default_args = {
+            "precision": ML_Int32,
+            "debug_flag": False,
+            "target": VHDLBackend(),
+            "output_file": "ut_timing_pipelining_entity.vhd",
+            "entity_name": "ut_timing_pipelining_entity",
+            "language": VHDL_Code,
+            "width": width,
+            "pipelined": True,
+            "clock_period": 2.0,
+            "passes": [
+                ("beforepipelining:size_datapath"),
+                ("beforepipelining:bitwidth_report"),
+                ("beforepipelining:rtl_legalize"),
+                ("beforepipelining:unify_pipeline_stages"),
+                ],
+        }
+        default_args.update(kw)
+        return DefaultEntityArgTemplate(**default_args)
+
+    def __init__(self, arg_template=None):
+        """ Initialize """
+        # building default arg_template if necessary
+        arg_template = TimingPipeliningBench.get_default_args() if \
+            arg_template is None else arg_template
+        self.width = arg_template.width
+        Log.report(
+            Log.Info,
+            "generating timing pipelining entity with width={}".format(self.width)
+        )
+
+        # initializing base class
+        ML_EntityBasis.__init__(self,
+                                base_name="timing_pipelining",
+                                arg_template=arg_template
+                                )
+
+        self.accuracy = arg_template.accuracy
+        self.precision = arg_template.precision
+
+    def get_io_precisions(self):
+        """ return the (input, output) fixed-point formats """
+        int_size = 3
+        frac_size = self.width - int_size
+        return fixed_point(int_size, frac_size), fixed_point(int_size, frac_size)
+
+    def generate_scheme(self):
+        """ main scheme generation """
+        input_precision, output_precision = self.get_io_precisions()
+
+        # declaring main input variable
+        var_x = self.implementation.add_input_signal("x", input_precision)
+        var_y = self.implementation.add_input_signal("y", input_precision)
+
+        # no stage is declared: stages are inserted by the timing-driven
+        # pipelining pass
+        acc = var_x * var_y + var_x
+        acc = acc * var_y + var_y
+        acc = acc * var_x + var_y
+
+        result = Conversion(acc, precision=output_precision)
+
+        self.implementation.add_output_signal("vr_out", result)
+
+        return [self.implementation]
+
+    standard_test_cases = [
+        ({"x": 2, "y": 2}, None),
+        ({"x": 1, "y": 2}, None),
+        ({"x": 0.5, "y": -2}, None),
+    ]
+
+    def numeric_emulate(self, io_map):
+        """ Meta-Function numeric emulation """
+        _, output_precision = self.get_io_precisions()
+        value_x = io_map["x"]
+        value_y = io_map["y"]
+        # intermediary formats are exact (size_datapath), only the final
+        # conversion truncates
+        acc = value_x * value_y + value_x
+        acc = acc * value_y + value_y
+        acc = acc * value_x + value_y
+        return {"vr_out": output_precision.truncate(acc)}
+
+    @staticmethod
+    def __call__(args):
+        ut_timing_pipelining = TimingPipeliningBench(args)
+        ut_timing_pipelining.gen_implementation()
+        # the multiply-add chain does not fit in a single 2 ns stage
+        return ut_timing_pipelining.stage_num > 1
+
+run_test = TimingPipeliningBench
+
+
+if __name__ == "__main__":
+    # auto-test
+    main_arg_template = ML_EntityArgTemplate(
+        default_entity_name="ut_timing_pipelining_entity",
+        default_output_file="ut_timing_pipelining_entity.vhd",
+        default_arg=TimingPipeliningBench.get_default_args()
+    )
+    main_arg_template.parser.add_argument(
+        "--width", dest="width", type=int, default=16,
+        help="set input width value (in bits)"
+    )
+    # argument extraction
+    args = parse_arg_index_list = main_arg_template.arg_extraction()
+
+    ut_timing_pipelining = TimingPipeliningBench(args)
+
+    ut_timing_pipelining.gen_implementation()
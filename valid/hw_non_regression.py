@@ -43,12 +43,18 @@ from metalibm_core.utility.ml_template import (
     target_instanciate, DefaultEntityArgTemplate
 )
 
+from metalibm_core.utility.hdl_simulator import HDL_SIMULATOR_MAP
+
 from valid.test_utils import *
 
 class EntitySchemeTest(NewSchemeTest):
+  ## arguments common to every test case (e.g. simulator selection)
+  extra_args = {}
   ## Build an argument template from dict
   def build_arg_template(self, **kw):
-    default_arg = self.ctor.get_default_args(**kw)
+    arg_dict = dict(self.extra_args)
+    arg_dict.update(kw)
+    default_arg = self.ctor.get_default_args(**arg_dict)
     return default_arg
 
 # list of non-regression tests
@@ -66,6 +72,14 @@ new_scheme_function_list = [
     metalibm_hw_blocks.ml_fp_adder.FP_Adder,
     [{"precision": ML_Binary32}, {"precision": ML_Binary64},]
   ),
+  EntitySchemeTest(
+    "floating-point adder with range trimming",
+    metalibm_hw_blocks.ml_fp_adder.FP_Adder,
+    [
+      {"precision": ML_Binary32, "passes": ["beforecodegen:range_trimming"],
+       "auto_test_execute": 100},
+    ]
+  ),
   EntitySchemeTest(
     "mixed-precision fused multiply-add",
     metalibm_hw_blocks.ml_fp_mpfma.FP_MPFMA,
@@ -122,11 +136,20 @@ arg_parser.add_argument("--execute", dest = "test_list", type = parse_test_list,
 
 arg_parser.add_argument("--match", dest = "match_regex", type = str, default = ".*", help = "list of comma separated match regexp to be used for test selection") 
 
+# functional test execution
+arg_parser.add_argument("--auto-test-execute", dest = "auto_test_execute", type = int, default = None, help = "generate, simulate and check the given number of test vectors for each test") 
+arg_parser.add_argument("--hdl-simulator", dest = "hdl_simulator", choices = sorted(HDL_SIMULATOR_MAP.keys()), default = None, help = "HDL simulator used for test execution (default: first available)") 
+
 
 
 
 args = arg_parser.parse_args(sys.argv[1:])
 
+if args.auto_test_execute:
+  EntitySchemeTest.extra_args["auto_test_execute"] = args.auto_test_execute
+if args.hdl_simulator:
+  EntitySchemeTest.extra_args["hdl_simulator"] = args.hdl_simulator
+
 success = True
 # list of TestResult objects generated by execution
 # of new scheme tests
@@ -58,6 +58,13 @@ import metalibm_hw_blocks.unit_tests.fixed_point_position as ut_fixed_point_posi
 import metalibm_hw_blocks.unit_tests.ut_special_values as ut_special_values
 import metalibm_hw_blocks.unit_tests.min_max_select as ut_min_max_select
 import metalibm_hw_blocks.unit_tests.unify_pipeline as ut_unify_pipeline
+import metalibm_hw_blocks.unit_tests.timing_pipelining as ut_timing_pipelining
+import metalibm_hw_blocks.unit_tests.range_trimming as ut_range_trimming
+import metalibm_hw_blocks.unit_tests.bitwidth_report as ut_bitwidth_report
+import metalibm_hw_blocks.unit_tests.component_registry as ut_component_registry
+import metalibm_hw_blocks.unit_tests.parallel_passes as ut_parallel_passes
+import metalibm_hw_blocks.unit_tests.tb_modes as ut_tb_modes
+import metalibm_hw_blocks.unit_tests.hdl_simulator_output as ut_hdl_simulator_output
 
 unit_test_list = [
   UnitTestScheme(
@@ -95,6 +102,58 @@ unit_test_list = [
     ut_unify_pipeline,
     [{}]
   ),
+  UnitTestScheme(
+    "timing-driven pipelining pass test",
+    ut_timing_pipelining,
+    [{"width": 16, "auto_test_execute": 100}]
+  ),
+  UnitTestScheme(
+    "range-driven bit-width trimming pass test",
+    ut_range_trimming,
+    [{"width": 16, "auto_test_execute": 100}]
+  ),
+  UnitTestScheme(
+    "static bit-width report pass test",
+    ut_bitwidth_report,
+    [{"width": 16}]
+  ),
+  UnitTestScheme(
+    "shared RTL component registry test",
+    ut_component_registry,
+    [{"width": 16}]
+  ),
+  UnitTestScheme(
+    "parallel entity pass execution test",
+    ut_parallel_passes,
+    [{"width": 16}]
+  ),
+  UnitTestScheme(
+    "testbench stimulus file test",
+    ut_tb_modes,
+    [{"width": 16, "auto_test_execute": 100, "auto_test_std": True,
+      "tb_stimulus_file": "ut_tb_modes_stimulus.txt"}]
+  ),
+  UnitTestScheme(
+    "streaming testbench test",
+    ut_tb_modes,
+    [{"width": 16, "auto_test_execute": 100, "tb_streaming": True},
+     {"width": 16, "auto_test_execute": 100, "tb_streaming": True,
+      "tb_bubble_rate": 0.25, "auto_test_seed": 17},
+     {"width": 16, "auto_test_execute": 100, "tb_streaming": True,
+      "tb_bubble_rate": 0.25, "auto_test_seed": 17,
+      "tb_stimulus_file": "ut_tb_modes_streaming.txt"}]
+  ),
+  UnitTestScheme(
+    "parallel auto-test emulation test",
+    ut_tb_modes,
+    [{"width": 16, "auto_test_execute": 100, "auto_test_seed": 17,
+      "emulation_jobs": 4}]
+  ),
+  UnitTestScheme(
+    "HDL simulator output parsing test",
+    ut_hdl_simulator_output,
+    [{}]
+  ),
 ]
 
 ## Command line action to set break on error in load module
@@ -68,6 +68,13 @@ import metalibm_functions.unit_tests.new_table as ut_new_table
 import metalibm_functions.unit_tests.multi_ary_function as ut_multi_ary_function
 import metalibm_functions.unit_tests.entity_pass as ut_entity_pass
 import metalibm_functions.unit_tests.implicit_interval_eval as ut_implicit_interval_eval
+import metalibm_functions.unit_tests.poly_scheme_selection as ut_poly_scheme_selection
+import metalibm_functions.unit_tests.adaptative_horner as ut_adaptative_horner
+import metalibm_functions.unit_tests.table_compression as ut_table_compression
+import metalibm_functions.unit_tests.ir_snapshot as ut_ir_snapshot
+import metalibm_functions.unit_tests.generation_server as ut_generation_server
+import metalibm_functions.unit_tests.library_generation as ut_library_generation
+import metalibm_functions.unit_tests.design_space_exploration as ut_design_space_exploration
 
 unit_test_list = [
   UnitTestScheme(
@@ -178,6 +185,41 @@ unit_test_list = [
     ut_entity_pass,
     [{}],
   ),
+  UnitTestScheme(
+    "polynomial scheme selection",
+    ut_poly_scheme_selection,
+    [{"auto_test_execute": 100}],
+  ),
+  UnitTestScheme(
+    "adaptative horner scheme",
+    ut_adaptative_horner,
+    [{"auto_test_execute": 100}],
+  ),
+  UnitTestScheme(
+    "table compression",
+    ut_table_compression,
+    [{"auto_test_execute": 100}],
+  ),
+  UnitTestScheme(
+    "I.R snapshot",
+    ut_ir_snapshot,
+    [{"auto_test_execute": 100}],
+  ),
+  UnitTestScheme(
+    "generation server",
+    ut_generation_server,
+    [{}],
+  ),
+  UnitTestScheme(
+    "multi-function library generation test",
+    ut_library_generation,
+    [{}],
+  ),
+  UnitTestScheme(
+    "design space exploration",
+    ut_design_space_exploration,
+    [{}],
+  ),
 ]
 
 # TODO: factorize / encapsulate in object/function
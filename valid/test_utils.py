@@ -35,6 +35,7 @@
 ###############################################################################
 
 from metalibm_core.core.ml_function import DefaultArgTemplate
+from metalibm_core.utility.log_report import ML_Error
 
 class TestResult:
   ## @param result boolean indicating success (True) or failure (False)
@@ -102,6 +103,8 @@ class NewSchemeTest(CommonTestScheme):
         return TestResult(False, "{} ctor failed".format(test_desc))
       try:
         fct.gen_implementation()
+      except ML_Error as error:
+        return TestResult(False, "{} gen_implementation failed [{}]".format(test_desc, error.__class__.__name__))
       except:
         return TestResult(False, "{} gen_implementation failed".format(test_desc))
       
@@ -41,6 +41,7 @@ import inspect
 from valid.test_utils import *
 
 from metalibm_core.core.ml_formats import ML_Int32, ML_Int16, ML_Int64
+from metalibm_core.utility.log_report import ML_Error
 
 from metalibm_functions.unit_tests.utils import TestRunner
 
@@ -78,6 +79,8 @@ class UnitTestScheme(CommonTestScheme):
       try:
         runner(arg_template)
         return TestResult(True, "{} succeed".format(test_desc))
+      except ML_Error as error:
+        return TestResult(False, "{} failed [{}]".format(test_desc, error.__class__.__name__))
       except:
         return TestResult(False, "{} failed".format(test_desc))
 